@@ -21,6 +21,7 @@ DEFAULT_CONFIG = {
     "check_updates_on_startup": True,
     "use_ssh_agent": False,
     "look_for_ssh_keys": False,
+    "use_session_shell": False,
     "menu_style": "side_menu",
     "remember_offline_sd_root": False,
     "offline_sd_root": "",
@@ -1,5 +1,172 @@
+import select
+import shlex
+import socket
+import threading
+import time
+import uuid
+
 import paramiko
 
+from core.remote_bulk import (
+    build_read_many_command,
+    build_write_many_payload,
+    parse_read_many_output,
+    parse_write_many_output,
+)
+from core.remote_probe import build_probe_command, parse_probe_output
+
+
+SFTP_POOL_SIZE = 3
+RECONNECT_TIMEOUT = 180
+RECONNECT_INTERVAL = 5
+
+
+class SessionShellError(Exception):
+    def __init__(self, message, started=False):
+        super().__init__(message)
+        self.started = started
+
+
+class SessionShell:
+    def __init__(self, client):
+        self.client = client
+        self.channel = client.get_transport().open_session()
+        self.channel.exec_command("sh")
+        self._lock = threading.Lock()
+        self._stdout = bytearray()
+        self._stderr = bytearray()
+
+    def is_alive(self):
+        try:
+            return not self.channel.closed and not self.channel.exit_status_ready()
+        except Exception:
+            return False
+
+    def close(self):
+        try:
+            self.channel.close()
+        except Exception:
+            pass
+
+    def try_run(self, command):
+        if not self._lock.acquire(blocking=False):
+            return None
+
+        try:
+            return self._run(command)
+        finally:
+            self._lock.release()
+
+    def _run(self, command):
+        if not self.is_alive():
+            raise SessionShellError("Session shell is closed")
+
+        token = uuid.uuid4().hex
+        start = f"__MC_START_{token}__"
+        end = f"__MC_END_{token}__"
+
+        script = (
+            f"printf '%s\\n' {start}; printf '%s\\n' {start} >&2\n"
+            f"( eval {shlex.quote(command)} ) </dev/null\n"
+            f"printf '\\n%s %s\\n' {end} \"$?\"; printf '\\n%s\\n' {end} >&2\n"
+        )
+
+        try:
+            self.channel.sendall(script.encode("utf-8"))
+        except Exception as e:
+            raise SessionShellError(str(e)) from e
+
+        start_marker = f"{start}\n".encode("ascii")
+        out_end = f"\n{end} ".encode("ascii")
+        err_end = f"\n{end}\n".encode("ascii")
+
+        out_start = err_start = out_stop = err_stop = out_line_end = -1
+        out_seen = err_seen = 0
+
+        while True:
+            # Each pass only searches what arrived since the last one (plus a marker's length of
+            # overlap), so large outputs are not rescanned from the start on every read.
+            if out_start < 0:
+                out_start = self._stdout.find(start_marker, max(0, out_seen - len(start_marker)))
+            if out_start >= 0 and out_stop < 0:
+                out_stop = self._stdout.find(out_end, max(out_start, out_seen - len(out_end)))
+            if out_stop >= 0:
+                out_line_end = self._stdout.find(b"\n", out_stop + len(out_end))
+            if err_start < 0:
+                err_start = self._stderr.find(start_marker, max(0, err_seen - len(start_marker)))
+            if err_start >= 0 and err_stop < 0:
+                err_stop = self._stderr.find(err_end, max(err_start, err_seen - len(err_end)))
+            out_seen = len(self._stdout)
+            err_seen = len(self._stderr)
+
+            if out_line_end >= 0 and err_stop >= 0:
+                output = bytes(self._stdout[out_start + len(start_marker):out_stop])
+                error = bytes(self._stderr[err_start + len(start_marker):err_stop])
+                exit_code = bytes(self._stdout[out_stop + len(out_end):out_line_end])
+
+                del self._stdout[:out_line_end + 1]
+                del self._stderr[:err_stop + len(err_end)]
+
+                try:
+                    exit_code = int(exit_code.decode("ascii").strip())
+                except Exception:
+                    exit_code = -1
+
+                return output, error, exit_code
+
+            if not self._read_available():
+                raise SessionShellError(
+                    "Session shell closed while running a command",
+                    started=out_start >= 0 or err_start >= 0,
+                )
+
+    def _read_available(self):
+        while True:
+            received = False
+
+            while self.channel.recv_ready():
+                self._stdout.extend(self.channel.recv(65536))
+                received = True
+
+            while self.channel.recv_stderr_ready():
+                self._stderr.extend(self.channel.recv_stderr(65536))
+                received = True
+
+            if received:
+                return True
+
+            if self.channel.closed or self.channel.eof_received:
+                return False
+
+            try:
+                select.select([self.channel], [], [], 1.0)
+            except Exception:
+                return False
+
+
+class PooledSFTP:
+    def __init__(self, connection, client, sftp):
+        self._connection = connection
+        self._client = client
+        self._sftp = sftp
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._sftp, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        self._connection._release_sftp(self._client, self._sftp)
+
 
 class MiSTerConnection:
     def __init__(self):
@@ -8,6 +175,15 @@ class MiSTerConnection:
         self.username = ""
         self.password = ""
         self.client = None
+        self.use_session_shell = False
+        self._sftp_lock = threading.Lock()
+        self._sftp_idle = []
+        self._shell_lock = threading.Lock()
+        self._session_shell = None
+        self._connect_options = {}
+        self._auto_reconnect = False
+        self._reconnect_lock = threading.Lock()
+        self._reconnected = threading.Condition()
 
     def connect(self, host, username, password, use_ssh_agent=False, look_for_ssh_keys=False):
         self.host = host
@@ -18,6 +194,9 @@ class MiSTerConnection:
             raise ValueError("IP address is required")
 
         try:
+            self._close_sftp_pool()
+            self._close_session_shell()
+
             if self.client:
                 try:
                     self.client.close()
@@ -38,6 +217,23 @@ class MiSTerConnection:
 
             transport = self.client.get_transport()
             self.connected = bool(transport and transport.is_active())
+            if self.connected:
+                # Without this, Nagle's algorithm holds back the small request packets of every
+                # command and SFTP call for tens of milliseconds.
+                try:
+                    transport.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                except (AttributeError, OSError):
+                    pass
+            self._connect_options = {
+                "use_ssh_agent": use_ssh_agent,
+                "look_for_ssh_keys": look_for_ssh_keys,
+            }
+
+            if self.connected:
+                self._auto_reconnect = True
+                with self._reconnected:
+                    self._reconnected.notify_all()
+
             return self.connected
 
         except Exception:
@@ -46,6 +242,10 @@ class MiSTerConnection:
             return False
 
     def disconnect(self):
+        self._auto_reconnect = False
+        self._close_sftp_pool()
+        self._close_session_shell()
+
         try:
             if self.client:
                 self.client.close()
@@ -56,6 +256,39 @@ class MiSTerConnection:
         self.connected = False
         return True
 
+    # =============================
+    # RECONNECT
+    # =============================
+
+    def reconnect(self):
+        with self._reconnect_lock:
+            if self.is_connected():
+                return True
+            if not self.host or not self._auto_reconnect:
+                return False
+            return self.connect(self.host, self.username, self.password, **self._connect_options)
+
+    def wait_for_reconnect(self, timeout=RECONNECT_TIMEOUT, interval=RECONNECT_INTERVAL):
+        deadline = time.monotonic() + timeout
+        while True:
+            if self.is_connected():
+                return True
+            if not self._auto_reconnect:
+                return False
+
+            try:
+                if self.reconnect():
+                    return True
+            except Exception:
+                pass
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+
+            with self._reconnected:
+                self._reconnected.wait(min(interval, remaining))
+
     def is_connected(self):
         if not self.connected or self.client is None:
             return False
@@ -71,7 +304,17 @@ class MiSTerConnection:
 
         return True
 
+    def _transport_active(self, client):
+        try:
+            transport = client.get_transport()
+            return bool(transport and transport.is_active())
+        except Exception:
+            return False
+
     def mark_disconnected(self):
+        self._close_sftp_pool()
+        self._close_session_shell()
+
         try:
             if self.client:
                 self.client.close()
@@ -81,6 +324,136 @@ class MiSTerConnection:
         self.connected = False
         self.client = None
 
+    # =============================
+    # SFTP POOL
+    # =============================
+
+    def open_sftp(self):
+        if not self.is_connected():
+            raise RuntimeError("Not connected")
+
+        client = self.client
+
+        while True:
+            with self._sftp_lock:
+                if not self._sftp_idle:
+                    break
+                idle_client, sftp = self._sftp_idle.pop()
+
+            if idle_client is client and self._sftp_healthy(client, sftp):
+                return PooledSFTP(self, client, sftp)
+
+            self._close_sftp(sftp)
+
+        try:
+            sftp = client.open_sftp()
+        except Exception:
+            # A refused channel (e.g. sshd MaxSessions) leaves the transport and every other channel
+            # usable, so only a dead transport tears the connection down.
+            if client is self.client and not self._transport_active(client):
+                self.mark_disconnected()
+            raise
+
+        return PooledSFTP(self, client, sftp)
+
+    def _release_sftp(self, client, sftp):
+        if client is not self.client or not self._sftp_healthy(client, sftp):
+            self._close_sftp(sftp)
+            return
+
+        try:
+            sftp.chdir(None)
+        except Exception:
+            pass
+
+        with self._sftp_lock:
+            if len(self._sftp_idle) < SFTP_POOL_SIZE:
+                self._sftp_idle.append((client, sftp))
+                return
+
+        self._close_sftp(sftp)
+
+    def _sftp_healthy(self, client, sftp):
+        try:
+            transport = client.get_transport()
+            if transport is None or not transport.is_active():
+                return False
+
+            channel = sftp.get_channel()
+            return channel is not None and not channel.closed
+        except Exception:
+            return False
+
+    def _close_sftp(self, sftp):
+        try:
+            sftp.close()
+        except Exception:
+            pass
+
+    def _close_sftp_pool(self):
+        with self._sftp_lock:
+            idle = self._sftp_idle
+            self._sftp_idle = []
+
+        for _client, sftp in idle:
+            self._close_sftp(sftp)
+
+    # =============================
+    # SESSION SHELL
+    # =============================
+
+    def _get_session_shell(self):
+        client = self.client
+
+        with self._shell_lock:
+            shell = self._session_shell
+            if shell is not None and shell.client is client and shell.is_alive():
+                return shell
+
+            self._session_shell = None
+            if shell is not None:
+                shell.close()
+
+            try:
+                shell = SessionShell(client)
+            except Exception:
+                return None
+
+            self._session_shell = shell
+            return shell
+
+    def _close_session_shell(self):
+        with self._shell_lock:
+            shell = self._session_shell
+            self._session_shell = None
+
+        if shell is not None:
+            shell.close()
+
+    def _run_in_session_shell(self, command):
+        shell = self._get_session_shell()
+        if shell is None:
+            return None
+
+        try:
+            result = shell.try_run(command)
+        except SessionShellError as e:
+            self._close_session_shell()
+            if not e.started:
+                return None
+            if not self.is_connected():
+                raise RuntimeError("Not connected") from e
+            raise RuntimeError(str(e)) from e
+
+        if result is None:
+            return None
+
+        output, error, _exit_code = result
+        return (
+            output.decode("utf-8", errors="ignore").strip(),
+            error.decode("utf-8", errors="ignore").strip(),
+        )
+
     # =============================
     # COMMAND EXECUTION
     # =============================
@@ -89,6 +462,14 @@ class MiSTerConnection:
         if not self.is_connected():
             raise RuntimeError("Not connected")
 
+        if self.use_session_shell:
+            result = self._run_in_session_shell(command)
+            if result is not None:
+                output, error = result
+                if error and not output:
+                    return error
+                return output
+
         try:
             stdin, stdout, stderr = self.client.exec_command(command)
 
@@ -104,6 +485,61 @@ class MiSTerConnection:
             self.mark_disconnected()
             raise
 
+    def probe(self, paths=(), globs=()):
+        paths = list(paths or [])
+        globs = list(globs or [])
+        if not paths and not globs:
+            return {}
+
+        output = self.run_command(build_probe_command(paths, globs))
+        return parse_probe_output(output, paths, globs)
+
+    def read_many(self, paths):
+        if not self.is_connected():
+            raise RuntimeError("Not connected")
+
+        paths = list(dict.fromkeys(paths or []))
+        if not paths:
+            return {}
+
+        try:
+            stdin, stdout, stderr = self.client.exec_command(build_read_many_command(paths))
+            stdin.close()
+            data = stdout.read()
+            stderr.read()
+        except Exception:
+            self.mark_disconnected()
+            raise
+
+        return parse_read_many_output(data, paths)
+
+    def write_many(self, files):
+        if not self.is_connected():
+            raise RuntimeError("Not connected")
+
+        if not files:
+            return
+
+        payload, command = build_write_many_payload(files)
+
+        try:
+            stdin, stdout, stderr = self.client.exec_command(command)
+            stdin.write(payload)
+            stdin.flush()
+            stdin.channel.shutdown_write()
+            output = stdout.read().decode("utf-8", errors="ignore")
+            error = stderr.read().decode("utf-8", errors="ignore").strip()
+            exit_status = stdout.channel.recv_exit_status()
+        except Exception:
+            self.mark_disconnected()
+            raise
+
+        failed = parse_write_many_output(output)
+        if exit_status != 0 and not failed:
+            raise RuntimeError(error or "Failed to write files on MiSTer.")
+        if failed:
+            raise RuntimeError("Failed to write:\n" + "\n".join(failed))
+
     def run_command_stream(self, command, callback):
         if not self.is_connected():
             raise RuntimeError("Not connected")
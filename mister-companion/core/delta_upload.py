@@ -0,0 +1,189 @@
+import hashlib
+import posixpath
+import shlex
+from pathlib import Path
+
+from core.resumable_transfer import local_checksum, remote_checksum
+
+
+DELTA_BLOCK_SIZE = 1024 * 1024
+DELTA_MIN_SIZE = 8 * 1024 * 1024
+DELTA_MAX_CHANGED_RATIO = 0.5
+DELTA_WORK_SUFFIX = ".mcdelta"
+DELTA_BLOCKS_SUFFIX = ".mcblocks"
+
+
+def build_block_checksum_command(remote_path, block_size=DELTA_BLOCK_SIZE):
+    quoted = shlex.quote(remote_path)
+    return (
+        f"f={quoted}; [ -f \"$f\" ] || exit 1; "
+        f"s=$(stat -c %s \"$f\"); echo \"size $s\"; "
+        f"n=$(( (s + {block_size} - 1) / {block_size} )); i=0; "
+        f"while [ $i -lt $n ]; do "
+        f"printf '%s ' $i; dd if=\"$f\" bs={block_size} skip=$i count=1 2>/dev/null | md5sum; "
+        f"i=$((i + 1)); done"
+    )
+
+
+def parse_block_checksums(output):
+    size = None
+    checksums = {}
+
+    for line in (output or "").splitlines():
+        fields = line.split()
+        if len(fields) == 2 and fields[0] == "size" and fields[1].isdigit():
+            size = int(fields[1])
+        elif len(fields) >= 2 and fields[0].isdigit():
+            checksums[int(fields[0])] = fields[1].lower()
+
+    return size, checksums
+
+
+def local_block_checksums(local_path, block_size=DELTA_BLOCK_SIZE):
+    checksums = []
+    with open(local_path, "rb") as handle:
+        while True:
+            block = handle.read(block_size)
+            if not block:
+                break
+            checksums.append(hashlib.md5(block).hexdigest())
+    return checksums
+
+
+def changed_blocks(local_checksums, remote_checksums):
+    return [
+        index
+        for index, checksum in enumerate(local_checksums)
+        if remote_checksums.get(index) != checksum
+    ]
+
+
+def remote_free_space(connection, remote_dir):
+    output = connection.run_command(f"df -Pk {shlex.quote(remote_dir)} 2>/dev/null | tail -n 1") or ""
+    fields = output.split()
+    try:
+        return int(fields[3]) * 1024
+    except (ValueError, IndexError):
+        return None
+
+
+def delta_space_needed(size, changed, block_size=DELTA_BLOCK_SIZE):
+    # The working copy of the whole file plus the uploaded blocks sit next to the target until
+    # the final rename.
+    return int(size) + int(changed) * int(block_size)
+
+
+def build_splice_command(remote_path, blocks, new_size, block_size=DELTA_BLOCK_SIZE):
+    target = shlex.quote(remote_path)
+    work = shlex.quote(remote_path + DELTA_WORK_SUFFIX)
+    blocks_file = shlex.quote(remote_path + DELTA_BLOCKS_SUFFIX)
+
+    indexes = " ".join(str(int(index)) for index in blocks)
+    splice = (
+        f"p=0; for b in {indexes}; do [ $status -eq 0 ] || break; "
+        f"dd if={blocks_file} of={work} bs={block_size} skip=$p seek=$b count=1 conv=notrunc 2>/dev/null || status=1; "
+        f"p=$((p + 1)); done; "
+    ) if blocks else ""
+
+    return (
+        f"status=0; {{ cp --reflink=auto {target} {work} 2>/dev/null || cp {target} {work}; }} || status=1; {splice}"
+        f"[ $status -eq 0 ] && {{ dd if=/dev/null of={work} bs=1 seek={int(new_size)} 2>/dev/null || status=1; }}; "
+        f"rm -f {blocks_file}; echo \"splice=$status\""
+    )
+
+
+def delta_upload(connection, local_path, remote_path, progress_callback=None, message_callback=None, block_size=DELTA_BLOCK_SIZE):
+    local_path = Path(local_path)
+    size = local_path.stat().st_size
+    if size < DELTA_MIN_SIZE:
+        return None
+
+    if message_callback:
+        message_callback(f"Comparing {local_path.name} with the copy on MiSTer...")
+
+    remote_size, remote_checksums = parse_block_checksums(
+        connection.run_command(build_block_checksum_command(remote_path, block_size))
+    )
+    if remote_size is None or not remote_checksums:
+        return None
+
+    local_checksums = local_block_checksums(local_path, block_size)
+    blocks = changed_blocks(local_checksums, remote_checksums)
+    if local_checksums and len(blocks) > len(local_checksums) * DELTA_MAX_CHANGED_RATIO:
+        return None
+
+    stats = {
+        "size": size,
+        "blocks": len(local_checksums),
+        "changed_blocks": len(blocks),
+        "bytes_sent": 0,
+        "bytes_saved": size,
+    }
+
+    if not blocks and remote_size == size:
+        if message_callback:
+            message_callback(f"{local_path.name} is already up to date on MiSTer.")
+        if progress_callback:
+            progress_callback(size, size)
+        return stats
+
+    needed = delta_space_needed(size, len(blocks), block_size)
+    free = remote_free_space(connection, posixpath.dirname(remote_path) or "/")
+    if free is not None and free < needed:
+        if message_callback:
+            message_callback(
+                f"Not enough free space on MiSTer for a delta upload of {local_path.name} "
+                f"(needs {needed // (1024 * 1024)} MB), sending the whole file..."
+            )
+        return None
+
+    blocks_path = remote_path + DELTA_BLOCKS_SUFFIX
+    work_path = remote_path + DELTA_WORK_SUFFIX
+    bytes_sent = 0
+
+    cleanup = f"rm -f {shlex.quote(work_path)} {shlex.quote(blocks_path)}"
+
+    try:
+        sftp = connection.open_sftp()
+        try:
+            with open(local_path, "rb") as source_file:
+                with sftp.open(blocks_path, "wb") as target_file:
+                    target_file.set_pipelined(True)
+                    for index in blocks:
+                        source_file.seek(index * block_size)
+                        block = source_file.read(block_size)
+                        target_file.write(block.ljust(block_size, b"\0"))
+                        bytes_sent += len(block)
+                        if progress_callback:
+                            progress_callback(bytes_sent, size)
+        finally:
+            sftp.close()
+    except Exception:
+        # The caller falls back to a full upload, so do not leave up to half a target's worth of blocks behind.
+        if connection.is_connected():
+            connection.run_command(cleanup)
+        raise
+
+    output = connection.run_command(build_splice_command(remote_path, blocks, size, block_size)) or ""
+    if "splice=0" not in output:
+        connection.run_command(cleanup)
+        raise RuntimeError(f"Delta upload failed while splicing {remote_path}.")
+
+    command, factory, remote_digest = remote_checksum(connection, work_path)
+    if factory and remote_digest != local_checksum(local_path, factory):
+        connection.run_command(cleanup)
+        raise RuntimeError(f"Delta upload checksum mismatch ({command}): {remote_path}")
+
+    output = connection.run_command(
+        f"mv -f {shlex.quote(work_path)} {shlex.quote(remote_path)}; echo \"rename=$?\""
+    ) or ""
+    if "rename=0" not in output:
+        connection.run_command(cleanup)
+        raise RuntimeError(f"Delta upload failed while replacing {remote_path}.")
+
+    if progress_callback:
+        progress_callback(size, size)
+
+    stats["bytes_sent"] = bytes_sent
+    stats["bytes_saved"] = max(0, size - bytes_sent)
+    return stats
@@ -112,12 +112,8 @@ def _remote_downloader_command(*args: str) -> str:
     )
 
 
-def _read_remote(connection, path=DOWNLOADER_INI):
-    return connection.run_command(f"cat {path} 2>/dev/null || true") or ""
-
-
 def _write_remote(connection, text: str, path=DOWNLOADER_INI):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "w") as handle:
             handle.write(text)
@@ -130,14 +126,10 @@ def _local_ini(sd_root) -> Path:
 
 
 def _remote_ini_paths(connection) -> list[str]:
-    sftp = connection.client.open_sftp()
-    try:
-        names = sftp.listdir("/media/fat")
-    finally:
-        sftp.close()
-    matches = [name for name in names if name == "downloader.ini" or (name.startswith("downloader_") and name.endswith(".ini"))]
-    if "downloader.ini" not in matches:
-        matches.insert(0, "downloader.ini")
+    pattern = "/media/fat/downloader_*.ini"
+    probed = connection.probe(globs=[pattern])
+    names = [match["path"].rsplit("/", 1)[-1] for match in probed[pattern]["matches"]]
+    matches = ["downloader.ini", *names]
     return [f"/media/fat/{name}" for name in sorted(set(matches), key=lambda name: (name != "downloader.ini", name.lower()))]
 
 
@@ -148,7 +140,8 @@ def _local_ini_paths(sd_root) -> list[Path]:
 
 
 def _read_remote_ini_files(connection) -> dict[str, str]:
-    return {path: _read_remote(connection, path) for path in _remote_ini_paths(connection)}
+    files = connection.read_many(_remote_ini_paths(connection))
+    return {path: (data or b"").decode("utf-8", errors="ignore") for path, data in files.items()}
 
 
 def _read_local_ini_files(sd_root) -> dict[str, str]:
@@ -248,8 +241,7 @@ def _target_for_database(files: dict[str, str], db_id: str, default_path: str) -
 
 
 def _write_remote_snapshot(connection, snapshot: DatabaseConfigSnapshot):
-    for path, text in snapshot.files.items():
-        _write_remote(connection, text, path)
+    connection.write_many(snapshot.files)
 
 
 def _write_local_snapshot(snapshot: DatabaseConfigSnapshot):
@@ -370,8 +362,7 @@ def ensure_database_source_local(sd_root, db_id: str, db_url: str, filter_value=
 def remove_database_source_online(connection, db_id: str):
     files = _read_remote_ini_files(connection)
     found = _find_section_files(files, db_id)
-    for path in sorted(set(found)):
-        _write_remote(connection, remove_db_section(files[path], db_id), path)
+    connection.write_many({path: remove_db_section(files[path], db_id) for path in sorted(set(found))})
 
 
 def remove_database_source_local(sd_root, db_id: str):
@@ -15,6 +15,8 @@ from core.extras_common import (
     _normalize_ini_text_for_append,
     _path_exists,
     _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _read_local_text,
     _read_remote_text,
@@ -44,24 +46,23 @@ OLD_REMOTE_AFS_PATH = "/media/fat/games/3sx/resources/SF33RD.AFS"
 
 INI_BLOCK = "[3S-ARM]\nmain=MiSTer_3S-ARM\n"
 
+INSTALLED_PROBE_PATHS = (REMOTE_RBF_PATH, REMOTE_GAME_DIR, REMOTE_LAUNCHER_PATH)
+STATUS_PROBE_PATHS = INSTALLED_PROBE_PATHS + (REMOTE_AFS_PATH, OLD_REMOTE_AFS_PATH)
 
-def _is_3sx_installed(connection) -> bool:
-    return (
-        _path_exists(connection, REMOTE_RBF_PATH)
-        and _path_exists(connection, REMOTE_GAME_DIR)
-        and _path_exists(connection, REMOTE_LAUNCHER_PATH)
-    )
+
+def _is_3sx_installed(connection, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists(connection, INSTALLED_PROBE_PATHS)
+    return all(probed[path] for path in INSTALLED_PROBE_PATHS)
 
 
 def _is_old_3sx_installed(connection) -> bool:
     return False
 
-def _is_3sx_installed_local(sd_root: str) -> bool:
-    return (
-        _path_exists_local(sd_root, REMOTE_RBF_PATH)
-        and _path_exists_local(sd_root, REMOTE_GAME_DIR)
-        and _path_exists_local(sd_root, REMOTE_LAUNCHER_PATH)
-    )
+def _is_3sx_installed_local(sd_root: str, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists_local(sd_root, INSTALLED_PROBE_PATHS)
+    return all(probed[path] for path in INSTALLED_PROBE_PATHS)
 
 
 def _is_old_3sx_installed_local(sd_root: str) -> bool:
@@ -296,15 +297,16 @@ def get_3sx_status(connection, check_latest: bool = False):
         except Exception as exc:
             latest_error = str(exc)
 
-    installed = _is_3sx_installed(connection)
+    probed = _probe_exists(connection, STATUS_PROBE_PATHS)
+    installed = _is_3sx_installed(connection, probed)
     legacy_installed = _is_old_3sx_installed(connection)
     installed_version = _read_installed_version(connection) if (installed or legacy_installed) else ""
 
     afs_present = False
     if installed:
-        afs_present = _path_exists(connection, REMOTE_AFS_PATH)
+        afs_present = probed[REMOTE_AFS_PATH]
     elif legacy_installed:
-        afs_present = _path_exists(connection, OLD_REMOTE_AFS_PATH)
+        afs_present = probed[OLD_REMOTE_AFS_PATH]
 
     update_available = False
     if check_latest:
@@ -368,15 +370,16 @@ def get_3sx_status_local(sd_root: str, check_latest: bool = False):
         except Exception as exc:
             latest_error = str(exc)
 
-    installed = _is_3sx_installed_local(sd_root)
+    probed = _probe_exists_local(sd_root, STATUS_PROBE_PATHS)
+    installed = _is_3sx_installed_local(sd_root, probed)
     legacy_installed = _is_old_3sx_installed_local(sd_root)
     installed_version = _read_installed_version_local(sd_root) if (installed or legacy_installed) else ""
 
     afs_present = False
     if installed:
-        afs_present = _path_exists_local(sd_root, REMOTE_AFS_PATH)
+        afs_present = probed[REMOTE_AFS_PATH]
     elif legacy_installed:
-        afs_present = _path_exists_local(sd_root, OLD_REMOTE_AFS_PATH)
+        afs_present = probed[OLD_REMOTE_AFS_PATH]
 
     update_available = False
     if check_latest:
@@ -469,7 +472,7 @@ def install_or_update_3sx(connection, log):
 
             payloads.append(member)
 
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             for member in payloads:
                 name = member.filename.replace("\\", "/")
@@ -667,7 +670,7 @@ def upload_3sx_afs(connection, local_path: str, log):
             last_percent["value"] = percent
             log(f"[PROGRESS] {percent}%")
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         sftp.put(local_path, target_afs_path, callback=progress_callback)
     finally:
@@ -9,6 +9,7 @@ from urllib.parse import unquote, urljoin
 
 import requests
 
+from core.remote_probe import probe_local
 
 MEDIA_FAT_PREFIX = "/media/fat"
 
@@ -26,7 +27,7 @@ def _remote_file_exists(sftp, path: str) -> bool:
 
 
 def _write_remote_bytes(connection, path: str, data: bytes):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "wb") as remote_file:
             remote_file.write(data)
@@ -35,16 +36,11 @@ def _write_remote_bytes(connection, path: str, data: bytes):
 
 
 def _write_remote_text(connection, path: str, text: str):
-    sftp = connection.client.open_sftp()
-    try:
-        with sftp.open(path, "wb") as remote_file:
-            remote_file.write(text.encode("utf-8"))
-    finally:
-        sftp.close()
+    connection.write_many({path: text.encode("utf-8")})
 
 
 def _read_remote_text(connection, path: str) -> str:
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "r") as remote_file:
             data = remote_file.read()
@@ -81,6 +77,11 @@ def _glob_exists(connection, pattern: str) -> bool:
     return "EXISTS" in (result or "")
 
 
+def _probe_exists(connection, paths, globs=()) -> dict:
+    probed = connection.probe(paths, globs)
+    return {key: bool(value.get("exists")) for key, value in probed.items()}
+
+
 def _fetch_latest_release_from_html(repo: str, title: str) -> dict:
     latest_url = f"https://github.com/{repo}/releases/latest"
 
@@ -280,6 +281,11 @@ def _glob_exists_local(sd_root: str, remote_pattern: str) -> bool:
     return any(Path(match).exists() for match in glob.glob(local_pattern))
 
 
+def _probe_exists_local(sd_root: str, paths, globs=()) -> dict:
+    probed = probe_local(sd_root, paths, globs)
+    return {key: bool(value.get("exists")) for key, value in probed.items()}
+
+
 def _ensure_local_dir(sd_root: str, remote_dir: str):
     _local_path(sd_root, remote_dir).mkdir(parents=True, exist_ok=True)
 
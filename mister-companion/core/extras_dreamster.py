@@ -13,8 +13,8 @@ from core.extras_common import (
     _ensure_remote_dir,
     _copy_local_file_to_sd,
     _local_path,
-    _path_exists,
-    _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _read_local_text,
     _read_remote_text,
@@ -37,6 +37,8 @@ REMOTE_GAME_DIR = "/media/fat/games/Dreamcast"
 REMOTE_DC_BOOT = f"{REMOTE_GAME_DIR}/dc_boot.bin"
 REMOTE_DC_FLASH = f"{REMOTE_GAME_DIR}/dc_flash.bin"
 
+STATUS_PROBE_PATHS = (REMOTE_SCRIPT, REMOTE_RUNTIME_BINARY, REMOTE_MANIFEST, REMOTE_DC_BOOT, REMOTE_DC_FLASH)
+
 
 def _fetch_latest_dreamster_release() -> dict:
     response = requests.get(
@@ -137,11 +139,13 @@ def _write_manifest_local(sd_root: str, release: dict):
 
 
 def _is_installed(connection) -> bool:
-    return _path_exists(connection, REMOTE_SCRIPT) and _path_exists(connection, REMOTE_RUNTIME_BINARY)
+    probed = _probe_exists(connection, (REMOTE_SCRIPT, REMOTE_RUNTIME_BINARY))
+    return probed[REMOTE_SCRIPT] and probed[REMOTE_RUNTIME_BINARY]
 
 
 def _is_installed_local(sd_root: str) -> bool:
-    return _path_exists_local(sd_root, REMOTE_SCRIPT) and _path_exists_local(sd_root, REMOTE_RUNTIME_BINARY)
+    probed = _probe_exists_local(sd_root, (REMOTE_SCRIPT, REMOTE_RUNTIME_BINARY))
+    return probed[REMOTE_SCRIPT] and probed[REMOTE_RUNTIME_BINARY]
 
 
 def _build_status(installed: bool, installed_version: str, latest_version: str, latest_error: str,
@@ -196,13 +200,11 @@ def get_dreamster_status(connection, check_latest: bool = False):
         except Exception as exc:
             latest_error = str(exc)
 
-    installed = _is_installed(connection)
-    manifest_present = installed and _path_exists(connection, REMOTE_MANIFEST)
+    probed = _probe_exists(connection, STATUS_PROBE_PATHS)
+    installed = probed[REMOTE_SCRIPT] and probed[REMOTE_RUNTIME_BINARY]
+    manifest_present = installed and probed[REMOTE_MANIFEST]
     installed_version = str(_read_manifest(connection).get("installed_version") or "") if manifest_present else ""
-    bios_present = (
-        _path_exists(connection, REMOTE_DC_BOOT)
-        and _path_exists(connection, REMOTE_DC_FLASH)
-    ) if installed else False
+    bios_present = (probed[REMOTE_DC_BOOT] and probed[REMOTE_DC_FLASH]) if installed else False
     return _build_status(installed, installed_version, latest_version, latest_error, manifest_present, bios_present)
 
 
@@ -215,13 +217,11 @@ def get_dreamster_status_local(sd_root: str, check_latest: bool = False):
         except Exception as exc:
             latest_error = str(exc)
 
-    installed = _is_installed_local(sd_root)
-    manifest_present = installed and _path_exists_local(sd_root, REMOTE_MANIFEST)
+    probed = _probe_exists_local(sd_root, STATUS_PROBE_PATHS)
+    installed = probed[REMOTE_SCRIPT] and probed[REMOTE_RUNTIME_BINARY]
+    manifest_present = installed and probed[REMOTE_MANIFEST]
     installed_version = str(_read_manifest_local(sd_root).get("installed_version") or "") if manifest_present else ""
-    bios_present = (
-        _path_exists_local(sd_root, REMOTE_DC_BOOT)
-        and _path_exists_local(sd_root, REMOTE_DC_FLASH)
-    ) if installed else False
+    bios_present = (probed[REMOTE_DC_BOOT] and probed[REMOTE_DC_FLASH]) if installed else False
     return _build_status(installed, installed_version, latest_version, latest_error, manifest_present, bios_present)
 
 
@@ -247,7 +247,7 @@ def upload_dreamster_bios(connection, local_paths, log):
 
     selected = _validate_bios_paths(local_paths)
     _ensure_remote_dir(connection, REMOTE_GAME_DIR)
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         for name, local_path in selected.items():
             target = posixpath.join(REMOTE_GAME_DIR, name)
@@ -256,7 +256,8 @@ def upload_dreamster_bios(connection, local_paths, log):
     finally:
         sftp.close()
     log("Dreamcast BIOS upload completed.\n")
-    return {"bios_present": _path_exists(connection, REMOTE_DC_BOOT) and _path_exists(connection, REMOTE_DC_FLASH)}
+    probed = _probe_exists(connection, (REMOTE_DC_BOOT, REMOTE_DC_FLASH))
+    return {"bios_present": probed[REMOTE_DC_BOOT] and probed[REMOTE_DC_FLASH]}
 
 
 def upload_dreamster_bios_local(sd_root: str, local_paths, log):
@@ -270,10 +271,8 @@ def upload_dreamster_bios_local(sd_root: str, local_paths, log):
         log(f"Copying {name} to {target}\n")
         _copy_local_file_to_sd(sd_root, local_path, target)
     log("Dreamcast BIOS copy completed.\n")
-    return {
-        "bios_present": _path_exists_local(sd_root, REMOTE_DC_BOOT)
-        and _path_exists_local(sd_root, REMOTE_DC_FLASH)
-    }
+    probed = _probe_exists_local(sd_root, (REMOTE_DC_BOOT, REMOTE_DC_FLASH))
+    return {"bios_present": probed[REMOTE_DC_BOOT] and probed[REMOTE_DC_FLASH]}
 
 
 def _archive_members(zf: zipfile.ZipFile):
@@ -310,7 +309,7 @@ def install_or_update_dreamster(connection, log):
 
     with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
         members = _archive_members(zf)
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             for member, name in members:
                 remote_path = "/media/fat/" + name
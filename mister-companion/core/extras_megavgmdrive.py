@@ -14,6 +14,8 @@ from core.extras_common import (
     _local_path,
     _path_exists,
     _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _remove_if_empty_dir,
     _remove_if_empty_dir_local,
@@ -38,6 +40,7 @@ MEGAVGMD_RBF_PATH = "/media/fat/_Custom Cores/Cores/VGM_MD_MiSTer.rbf"
 MEGAVGMD_RBF_PREFIX = "MegaVGMdrive_MiSTer"
 MEGAVGMD_CONFIG_DIR = "/media/fat/Scripts/.config/MegaVGMDrive"
 MEGAVGMD_RELEASE_MARKER_PATH = "/media/fat/Scripts/.config/MegaVGMDrive/release.json"
+SAMBA_SCRIPT_PATH = "/media/fat/linux/samba.sh"
 
 
 def _download_bytes(url: str, timeout: int = 90) -> bytes:
@@ -150,11 +153,6 @@ def _write_marker_local(sd_root: str, release: dict):
     _write_local_bytes(sd_root, MEGAVGMD_RELEASE_MARKER_PATH, payload)
 
 
-def _is_smb_enabled(connection) -> bool:
-    result = connection.run_command("test -f /media/fat/linux/samba.sh && echo EXISTS || echo MISSING")
-    return "EXISTS" in (result or "")
-
-
 def _megavgmd_rbf_paths(connection) -> list[str]:
     command = (
         f"find {_quote(MEGAVGMD_CORES_DIR)} -maxdepth 1 -type f "
@@ -259,10 +257,11 @@ def _build_status(
 
 def get_megavgmdrive_status(connection, check_latest: bool = False) -> dict:
     rbf_exists = _megavgmd_rbf_exists(connection)
-    mgl_exists = _path_exists(connection, MEGAVGMD_MGL_PATH)
-    game_dir_exists = _path_exists(connection, MEGAVGMD_GAME_DIR)
+    probed = _probe_exists(connection, (MEGAVGMD_MGL_PATH, MEGAVGMD_GAME_DIR, SAMBA_SCRIPT_PATH))
+    mgl_exists = probed[MEGAVGMD_MGL_PATH]
+    game_dir_exists = probed[MEGAVGMD_GAME_DIR]
     installed_version = _marker_version(_read_marker(connection))
-    folder_open_enabled = bool(rbf_exists and mgl_exists and _is_smb_enabled(connection))
+    folder_open_enabled = bool(rbf_exists and mgl_exists and probed[SAMBA_SCRIPT_PATH])
     return _build_status(
         rbf_exists,
         mgl_exists,
@@ -275,8 +274,9 @@ def get_megavgmdrive_status(connection, check_latest: bool = False) -> dict:
 
 def get_megavgmdrive_status_local(sd_root: str, check_latest: bool = False) -> dict:
     rbf_exists = _megavgmd_rbf_exists_local(sd_root)
-    mgl_exists = _path_exists_local(sd_root, MEGAVGMD_MGL_PATH)
-    game_dir_exists = _path_exists_local(sd_root, MEGAVGMD_GAME_DIR)
+    probed = _probe_exists_local(sd_root, (MEGAVGMD_MGL_PATH, MEGAVGMD_GAME_DIR))
+    mgl_exists = probed[MEGAVGMD_MGL_PATH]
+    game_dir_exists = probed[MEGAVGMD_GAME_DIR]
     installed_version = _marker_version(_read_marker_local(sd_root))
     installed = bool(rbf_exists and mgl_exists)
     return _build_status(
@@ -13,8 +13,8 @@ from core.extras_common import (
     _fetch_latest_release_from_html,
     _local_path,
     _normalize_ini_text_for_append,
-    _path_exists,
-    _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _read_local_text,
     _read_remote_text,
@@ -35,6 +35,8 @@ DUKE3D_REMOTE_GAME_DIR = "/media/fat/games/DUKE3D"
 DUKE3D_REMOTE_BIN = "/media/fat/games/DUKE3D/bin/duke3d-mister"
 DUKE3D_REMOTE_GRP = "/media/fat/games/DUKE3D/duke3d.grp"
 DUKE3D_REMOTE_VERSION_FILE = "/media/fat/games/DUKE3D/.mister_companion_version"
+DUKE3D_INSTALL_PATHS = (DUKE3D_REMOTE_LAUNCHER, DUKE3D_REMOTE_RBF, DUKE3D_REMOTE_BIN)
+DUKE3D_STATUS_PROBE_PATHS = DUKE3D_INSTALL_PATHS + (DUKE3D_REMOTE_GRP,)
 REMOTE_INI_PATH = "/media/fat/MiSTer.ini"
 
 DUKE3D_INI_SECTIONS = {
@@ -58,16 +60,16 @@ def _fetch_latest_duke3d_release():
     return {"version": version, "zip_url": zip_url}
 
 
-def _is_installed(connection):
-    return all(_path_exists(connection, path) for path in (
-        DUKE3D_REMOTE_LAUNCHER, DUKE3D_REMOTE_RBF, DUKE3D_REMOTE_BIN,
-    ))
+def _is_installed(connection, probed=None):
+    if probed is None:
+        probed = _probe_exists(connection, DUKE3D_INSTALL_PATHS)
+    return all(probed[path] for path in DUKE3D_INSTALL_PATHS)
 
 
-def _is_installed_local(sd_root):
-    return all(_path_exists_local(sd_root, path) for path in (
-        DUKE3D_REMOTE_LAUNCHER, DUKE3D_REMOTE_RBF, DUKE3D_REMOTE_BIN,
-    ))
+def _is_installed_local(sd_root, probed=None):
+    if probed is None:
+        probed = _probe_exists_local(sd_root, DUKE3D_INSTALL_PATHS)
+    return all(probed[path] for path in DUKE3D_INSTALL_PATHS)
 
 
 def _read_version(connection):
@@ -127,13 +129,14 @@ def get_mister_duke3d_status(connection, check_latest=False):
             latest_version = _fetch_latest_duke3d_release()["version"]
         except Exception as exc:
             latest_error = str(exc)
-    installed = _is_installed(connection)
+    probed = _probe_exists(connection, DUKE3D_STATUS_PROBE_PATHS)
+    installed = _is_installed(connection, probed)
     return _status(
         installed,
         _read_version(connection) if installed else "",
         latest_version,
         latest_error,
-        _path_exists(connection, DUKE3D_REMOTE_GRP) if installed else False,
+        probed[DUKE3D_REMOTE_GRP] if installed else False,
     )
 
 
@@ -145,13 +148,14 @@ def get_mister_duke3d_status_local(sd_root, check_latest=False):
             latest_version = _fetch_latest_duke3d_release()["version"]
         except Exception as exc:
             latest_error = str(exc)
-    installed = _is_installed_local(sd_root)
+    probed = _probe_exists_local(sd_root, DUKE3D_STATUS_PROBE_PATHS)
+    installed = _is_installed_local(sd_root, probed)
     return _status(
         installed,
         _read_version_local(sd_root) if installed else "",
         latest_version,
         latest_error,
-        _path_exists_local(sd_root, DUKE3D_REMOTE_GRP) if installed else False,
+        probed[DUKE3D_REMOTE_GRP] if installed else False,
     )
 
 
@@ -224,7 +228,7 @@ def install_or_update_mister_duke3d(connection, log):
     response = requests.get(latest["zip_url"], timeout=60)
     response.raise_for_status()
     with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             for member in _archive_files(zf):
                 name = member.filename.replace("\\", "/").lstrip("/")
@@ -285,7 +289,7 @@ def upload_mister_duke3d_grp(connection, local_path, log):
     _validate_grp(local_path)
     _ensure_remote_dir(connection, DUKE3D_REMOTE_GAME_DIR)
     log(f"Uploading DUKE3D.GRP to {DUKE3D_REMOTE_GRP}\n")
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         sftp.put(local_path, DUKE3D_REMOTE_GRP)
     finally:
@@ -13,8 +13,8 @@ from core.extras_common import (
     _fetch_latest_release_from_html,
     _local_path,
     _normalize_ini_text_for_append,
-    _path_exists,
-    _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _read_local_text,
     _read_remote_text,
@@ -35,6 +35,10 @@ QUAKE_REMOTE_GAME_DIR = "/media/fat/games/quake"
 QUAKE_REMOTE_BIN = "/media/fat/games/quake/bin/quake-mister"
 QUAKE_REMOTE_ID1_DIR = "/media/fat/games/quake/id1"
 QUAKE_REMOTE_VERSION_FILE = "/media/fat/games/quake/.mister_companion_version"
+QUAKE_REMOTE_PAK0 = posixpath.join(QUAKE_REMOTE_ID1_DIR, "PAK0.PAK")
+QUAKE_REMOTE_PAK1 = posixpath.join(QUAKE_REMOTE_ID1_DIR, "PAK1.PAK")
+QUAKE_INSTALL_PATHS = (QUAKE_REMOTE_LAUNCHER, QUAKE_REMOTE_RBF, QUAKE_REMOTE_BIN)
+QUAKE_STATUS_PROBE_PATHS = QUAKE_INSTALL_PATHS + (QUAKE_REMOTE_PAK0, QUAKE_REMOTE_PAK1)
 REMOTE_INI_PATH = "/media/fat/MiSTer.ini"
 
 QUAKE_INI_SECTIONS = {
@@ -58,12 +62,16 @@ def _fetch_latest_quake_release():
     return {"version": version, "zip_url": zip_url}
 
 
-def _is_installed(connection):
-    return all(_path_exists(connection, p) for p in (QUAKE_REMOTE_LAUNCHER, QUAKE_REMOTE_RBF, QUAKE_REMOTE_BIN))
+def _is_installed(connection, probed=None):
+    if probed is None:
+        probed = _probe_exists(connection, QUAKE_INSTALL_PATHS)
+    return all(probed[p] for p in QUAKE_INSTALL_PATHS)
 
 
-def _is_installed_local(sd_root):
-    return all(_path_exists_local(sd_root, p) for p in (QUAKE_REMOTE_LAUNCHER, QUAKE_REMOTE_RBF, QUAKE_REMOTE_BIN))
+def _is_installed_local(sd_root, probed=None):
+    if probed is None:
+        probed = _probe_exists_local(sd_root, QUAKE_INSTALL_PATHS)
+    return all(probed[p] for p in QUAKE_INSTALL_PATHS)
 
 
 def _read_version(connection):
@@ -84,18 +92,19 @@ def _write_version_local(sd_root, version):
     _write_local_text(sd_root, QUAKE_REMOTE_VERSION_FILE, version.strip() + "\n")
 
 
-def _pak_state(connection):
+def _pak_state_from_probe(probed):
     return {
-        "pak0_present": _path_exists(connection, posixpath.join(QUAKE_REMOTE_ID1_DIR, "PAK0.PAK")),
-        "pak1_present": _path_exists(connection, posixpath.join(QUAKE_REMOTE_ID1_DIR, "PAK1.PAK")),
+        "pak0_present": probed[QUAKE_REMOTE_PAK0],
+        "pak1_present": probed[QUAKE_REMOTE_PAK1],
     }
 
 
+def _pak_state(connection):
+    return _pak_state_from_probe(_probe_exists(connection, (QUAKE_REMOTE_PAK0, QUAKE_REMOTE_PAK1)))
+
+
 def _pak_state_local(sd_root):
-    return {
-        "pak0_present": _path_exists_local(sd_root, posixpath.join(QUAKE_REMOTE_ID1_DIR, "PAK0.PAK")),
-        "pak1_present": _path_exists_local(sd_root, posixpath.join(QUAKE_REMOTE_ID1_DIR, "PAK1.PAK")),
-    }
+    return _pak_state_from_probe(_probe_exists_local(sd_root, (QUAKE_REMOTE_PAK0, QUAKE_REMOTE_PAK1)))
 
 
 def _status(installed, installed_version, latest_version, latest_error, pak):
@@ -130,8 +139,9 @@ def get_mister_quake_status(connection, check_latest=False):
     if check_latest:
         try: latest_version = _fetch_latest_quake_release()["version"]
         except Exception as exc: latest_error = str(exc)
-    installed = _is_installed(connection)
-    return _status(installed, _read_version(connection) if installed else "", latest_version, latest_error, _pak_state(connection) if installed else {"pak0_present": False, "pak1_present": False})
+    probed = _probe_exists(connection, QUAKE_STATUS_PROBE_PATHS)
+    installed = _is_installed(connection, probed)
+    return _status(installed, _read_version(connection) if installed else "", latest_version, latest_error, _pak_state_from_probe(probed) if installed else {"pak0_present": False, "pak1_present": False})
 
 
 def get_mister_quake_status_local(sd_root, check_latest=False):
@@ -139,8 +149,9 @@ def get_mister_quake_status_local(sd_root, check_latest=False):
     if check_latest:
         try: latest_version = _fetch_latest_quake_release()["version"]
         except Exception as exc: latest_error = str(exc)
-    installed = _is_installed_local(sd_root)
-    return _status(installed, _read_version_local(sd_root) if installed else "", latest_version, latest_error, _pak_state_local(sd_root) if installed else {"pak0_present": False, "pak1_present": False})
+    probed = _probe_exists_local(sd_root, QUAKE_STATUS_PROBE_PATHS)
+    installed = _is_installed_local(sd_root, probed)
+    return _status(installed, _read_version_local(sd_root) if installed else "", latest_version, latest_error, _pak_state_from_probe(probed) if installed else {"pak0_present": False, "pak1_present": False})
 
 
 def _upsert_ini_sections(text):
@@ -195,7 +206,7 @@ def install_or_update_mister_quake(connection, log):
     log(f"Latest version on GitHub: {version}\nDownloading: {latest['zip_url']}\n")
     response = requests.get(latest["zip_url"], timeout=60); response.raise_for_status()
     with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             for member in _archive_files(zf):
                 name = member.filename.replace("\\", "/").lstrip("/")
@@ -244,7 +255,7 @@ def upload_mister_quake_paks(connection, paths, log):
     if not connection.is_connected(): raise RuntimeError("Not connected to MiSTer.")
     if not _is_installed(connection): raise RuntimeError("MiSTer Quake is not installed.")
     files = _validate_paks(paths); _ensure_remote_dir(connection, QUAKE_REMOTE_ID1_DIR)
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         for source, name in files:
             target = posixpath.join(QUAKE_REMOTE_ID1_DIR, name)
@@ -8,8 +8,6 @@ import requests
 from core.extras_common import (
     _ensure_local_dir,
     _ensure_remote_dir,
-    _path_exists,
-    _path_exists_local,
     _quote,
     _remove_glob,
     _remove_if_empty_dir,
@@ -19,6 +17,7 @@ from core.extras_common import (
     _write_local_bytes,
     _write_remote_bytes,
 )
+from core.remote_probe import probe_local
 
 
 MMS2_GB_RELEASES_URL = "https://github.com/Heber-co-uk/Gameboy_MiSTer_Cart/tree/master/releases"
@@ -94,30 +93,6 @@ def _latest_installed_mms2_gb_date_from_names(names: list[str]) -> str:
     return sorted(dates)[-1] if dates else ""
 
 
-def _read_installed_mms2_gb_date(connection) -> str:
-    command = (
-        f"for f in {MMS2_GB_RBF_PATTERN}; do "
-        f'[ -e "$f" ] && basename "$f"; '
-        f"done"
-    )
-    output = connection.run_command(command) or ""
-    return _latest_installed_mms2_gb_date_from_names(output.splitlines())
-
-
-def _read_installed_mms2_gb_date_local(sd_root: str) -> str:
-    root = Path(str(sd_root or "")).expanduser()
-    if not root.exists() or not root.is_dir():
-        return ""
-
-    mms2_dir = root / "MMS2"
-    if not mms2_dir.exists() or not mms2_dir.is_dir():
-        return ""
-
-    return _latest_installed_mms2_gb_date_from_names(
-        [path.name for path in mms2_dir.glob("Gameboy_*.rbf")]
-    )
-
-
 def _build_status(installed_date: str, mgl_exists: bool, cfg_exists: bool, check_latest: bool) -> dict:
     installed = bool(installed_date and mgl_exists and cfg_exists)
     partial = bool(installed_date or mgl_exists or cfg_exists) and not installed
@@ -166,18 +141,26 @@ def _build_status(installed_date: str, mgl_exists: bool, cfg_exists: bool, check
     }
 
 
+def _build_status_from_probe(probed: dict, check_latest: bool) -> dict:
+    installed_date = _latest_installed_mms2_gb_date_from_names(
+        [match["path"] for match in probed[MMS2_GB_RBF_PATTERN]["matches"]]
+    )
+    return _build_status(
+        installed_date,
+        probed[MMS2_GB_MGL_PATH]["exists"],
+        probed[MMS2_GB_CFG_PATH]["exists"],
+        check_latest,
+    )
+
+
 def get_mms2_gb_core_status(connection, check_latest: bool = False) -> dict:
-    installed_date = _read_installed_mms2_gb_date(connection)
-    mgl_exists = _path_exists(connection, MMS2_GB_MGL_PATH)
-    cfg_exists = _path_exists(connection, MMS2_GB_CFG_PATH)
-    return _build_status(installed_date, mgl_exists, cfg_exists, check_latest)
+    probed = connection.probe((MMS2_GB_MGL_PATH, MMS2_GB_CFG_PATH), (MMS2_GB_RBF_PATTERN,))
+    return _build_status_from_probe(probed, check_latest)
 
 
 def get_mms2_gb_core_status_local(sd_root: str, check_latest: bool = False) -> dict:
-    installed_date = _read_installed_mms2_gb_date_local(sd_root)
-    mgl_exists = _path_exists_local(sd_root, MMS2_GB_MGL_PATH)
-    cfg_exists = _path_exists_local(sd_root, MMS2_GB_CFG_PATH)
-    return _build_status(installed_date, mgl_exists, cfg_exists, check_latest)
+    probed = probe_local(sd_root, (MMS2_GB_MGL_PATH, MMS2_GB_CFG_PATH), (MMS2_GB_RBF_PATTERN,))
+    return _build_status_from_probe(probed, check_latest)
 
 
 def install_or_update_mms2_gb_core(connection, log):
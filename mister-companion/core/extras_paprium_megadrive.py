@@ -10,8 +10,6 @@ from core.extras_common import (
     _ensure_local_dir,
     _ensure_remote_dir,
     _local_path,
-    _path_exists,
-    _path_exists_local,
     _quote,
     _remove_glob,
     _remove_if_empty_dir,
@@ -22,6 +20,7 @@ from core.extras_common import (
     _write_remote_bytes,
 )
 from core.open_helpers import open_local_folder, open_smb_share
+from core.remote_probe import probe_local
 
 
 PAPRIUM_REPO = "MisterPezz82/Paprium_MegaDrive_MiSTer"
@@ -35,6 +34,7 @@ PAPRIUM_GAME_DIR = "/media/fat/games/PapriumMD"
 PAPRIUM_MGL_PATH = "/media/fat/_Custom Cores/PapriumMD.mgl"
 PAPRIUM_RBF_PATTERN = "/media/fat/_Custom Cores/Cores/MegaDrive_Paprium_*.rbf"
 PAPRIUM_RBF_NAME_PATTERN = "MegaDrive_Paprium_*.rbf"
+SAMBA_SCRIPT_PATH = "/media/fat/linux/samba.sh"
 
 PAPRIUM_FILENAME_RE = re.compile(r"MegaDrive_Paprium_(\d{8})\.rbf$", re.IGNORECASE)
 
@@ -120,35 +120,12 @@ def _latest_installed_paprium_date_from_names(names: list[str]) -> str:
     return sorted(dates)[-1] if dates else ""
 
 
-def _read_installed_paprium_date(connection) -> str:
-    command = (
-        f"for f in {_paprium_remote_rbf_glob()}; do "
-        f'[ -e "$f" ] && basename "$f"; '
-        f"done"
-    )
-    output = connection.run_command(command) or ""
-    return _latest_installed_paprium_date_from_names(output.splitlines())
-
-
-def _read_installed_paprium_date_local(sd_root: str) -> str:
-    root = Path(str(sd_root or "")).expanduser()
-    if not root.exists() or not root.is_dir():
-        return ""
-
-    cores_dir = root / "_Custom Cores" / "Cores"
-    if not cores_dir.exists() or not cores_dir.is_dir():
-        return ""
-
+def _installed_paprium_date_from_probe(probed: dict) -> str:
     return _latest_installed_paprium_date_from_names(
-        [path.name for path in cores_dir.glob("MegaDrive_Paprium_*.rbf")]
+        [match["path"] for match in probed[PAPRIUM_RBF_PATTERN]["matches"]]
     )
 
 
-def _is_smb_enabled(connection) -> bool:
-    result = connection.run_command("test -f /media/fat/linux/samba.sh && echo EXISTS || echo MISSING")
-    return "EXISTS" in (result or "")
-
-
 def _build_status(
     installed_date: str,
     mgl_exists: bool,
@@ -206,10 +183,14 @@ def _build_status(
 
 
 def get_paprium_megadrive_status(connection, check_latest: bool = False) -> dict:
-    installed_date = _read_installed_paprium_date(connection)
-    mgl_exists = _path_exists(connection, PAPRIUM_MGL_PATH)
-    game_dir_exists = _path_exists(connection, PAPRIUM_GAME_DIR)
-    folder_open_enabled = bool(installed_date and mgl_exists and _is_smb_enabled(connection))
+    probed = connection.probe(
+        (PAPRIUM_MGL_PATH, PAPRIUM_GAME_DIR, SAMBA_SCRIPT_PATH),
+        (PAPRIUM_RBF_PATTERN,),
+    )
+    installed_date = _installed_paprium_date_from_probe(probed)
+    mgl_exists = probed[PAPRIUM_MGL_PATH]["exists"]
+    game_dir_exists = probed[PAPRIUM_GAME_DIR]["exists"]
+    folder_open_enabled = bool(installed_date and mgl_exists and probed[SAMBA_SCRIPT_PATH]["exists"])
     return _build_status(
         installed_date,
         mgl_exists,
@@ -220,9 +201,10 @@ def get_paprium_megadrive_status(connection, check_latest: bool = False) -> dict
 
 
 def get_paprium_megadrive_status_local(sd_root: str, check_latest: bool = False) -> dict:
-    installed_date = _read_installed_paprium_date_local(sd_root)
-    mgl_exists = _path_exists_local(sd_root, PAPRIUM_MGL_PATH)
-    game_dir_exists = _path_exists_local(sd_root, PAPRIUM_GAME_DIR)
+    probed = probe_local(sd_root, (PAPRIUM_MGL_PATH, PAPRIUM_GAME_DIR), (PAPRIUM_RBF_PATTERN,))
+    installed_date = _installed_paprium_date_from_probe(probed)
+    mgl_exists = probed[PAPRIUM_MGL_PATH]["exists"]
+    game_dir_exists = probed[PAPRIUM_GAME_DIR]["exists"]
     installed = bool(installed_date and mgl_exists)
     return _build_status(
         installed_date,
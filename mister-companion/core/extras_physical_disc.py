@@ -1,7 +1,7 @@
 import re
 
 from core.extras_common import (
-    _path_exists, _path_exists_local, _quote, _read_local_text, _read_remote_text,
+    _probe_exists, _probe_exists_local, _quote, _read_local_text, _read_remote_text,
     _remove_local_path, _write_local_text, _write_remote_text,
 )
 from core.downloader_backend import (
@@ -343,7 +343,7 @@ def _status(found, complete, manual, update_available=False, connected=True, ini
 def get_physical_disc_status(connection, check_latest=False):
     if not connection.is_connected():
         return _status([], False, False, connected=False)
-    found, complete = _presence(lambda path: _path_exists(connection, path))
+    found, complete = _presence(_probe_exists(connection, PHYSICAL_DISC_FILES).get)
     manual = False
     ini_state = _physical_disc_ini_state(_read_remote_text(connection, MISTER_INI_PATH))
     ini_entry_present = ini_state["current"]
@@ -357,7 +357,7 @@ def get_physical_disc_status(connection, check_latest=False):
 
 
 def get_physical_disc_status_local(sd_root, check_latest=False):
-    found, complete = _presence(lambda path: _path_exists_local(sd_root, path))
+    found, complete = _presence(_probe_exists_local(sd_root, PHYSICAL_DISC_FILES).get)
     manual = False
     ini_state = _physical_disc_ini_state(_read_local_text(sd_root, MISTER_INI_PATH))
     ini_entry_present = ini_state["current"]
@@ -378,7 +378,7 @@ def _reboot_result(uninstall=False):
 def install_or_update_physical_disc(connection, log):
     if not connection.is_connected():
         raise RuntimeError("Not connected to MiSTer.")
-    found, complete = _presence(lambda path: _path_exists(connection, path))
+    found, complete = _presence(_probe_exists(connection, PHYSICAL_DISC_FILES).get)
     manual = False
     ini_state = _physical_disc_ini_state(_read_remote_text(connection, MISTER_INI_PATH))
     if complete and not manual and not ini_state["current"] and not ini_state["legacy"]:
@@ -400,7 +400,7 @@ def install_or_update_physical_disc(connection, log):
 
 
 def install_or_update_physical_disc_local(sd_root, log):
-    found, complete = _presence(lambda path: _path_exists_local(sd_root, path))
+    found, complete = _presence(_probe_exists_local(sd_root, PHYSICAL_DISC_FILES).get)
     manual = False
     ini_state = _physical_disc_ini_state(_read_local_text(sd_root, MISTER_INI_PATH))
     if complete and not manual and not ini_state["current"] and not ini_state["legacy"]:
@@ -12,6 +12,7 @@ from urllib.parse import unquote, urljoin
 
 import requests
 
+from core.remote_probe import probe_local
 
 RA_ROOT_DIR = "/media/fat"
 
@@ -121,6 +122,10 @@ def _glob_exists(connection, pattern: str) -> bool:
     return "EXISTS" in (result or "")
 
 
+def _probe_exists(connection, paths) -> dict:
+    return {key: value["exists"] for key, value in connection.probe(paths).items()}
+
+
 def _remove_remote_file(connection, path: str):
     connection.run_command(f"rm -f {_quote(path)}")
 
@@ -130,7 +135,7 @@ def _remove_remote_dir(connection, path: str):
 
 
 def _write_remote_bytes(connection, path: str, data: bytes):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "wb") as remote_file:
             remote_file.write(data)
@@ -143,7 +148,7 @@ def _write_remote_text(connection, path: str, text: str):
 
 
 def _read_remote_text(connection, path: str) -> str:
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "r") as remote_file:
             data = remote_file.read()
@@ -195,6 +200,10 @@ def _path_exists_local(sd_root: str, remote_path: str) -> bool:
     return _local_path(sd_root, remote_path).exists()
 
 
+def _probe_exists_local(sd_root: str, paths) -> dict:
+    return {key: value["exists"] for key, value in probe_local(sd_root, paths).items()}
+
+
 def _glob_exists_local(sd_root: str, remote_pattern: str) -> bool:
     root = _local_root(sd_root)
     pattern = _local_glob_pattern(remote_pattern)
@@ -564,16 +573,28 @@ def _ra_core_components_status_from_checker(exists_func) -> list[dict]:
     return components
 
 
-def get_ra_core_components_status(connection) -> list[dict]:
+def _ra_status_probe_paths() -> list[str]:
+    paths = [RA_MAIN_BINARY_PATH, RA_CONFIG_PATH, RA_SOUND_PATH]
+    for source in selectable_ra_core_sources():
+        paths.append(_rbf_path_for_source(source))
+        paths.append(_mgl_path_for_source(source))
+    return paths
+
+
+def get_ra_core_components_status(connection, probed=None) -> list[dict]:
     if not connection.is_connected():
         return []
-    return _ra_core_components_status_from_checker(lambda path: _path_exists(connection, path))
+    if probed is None:
+        probed = _probe_exists(connection, _ra_status_probe_paths())
+    return _ra_core_components_status_from_checker(probed.get)
 
 
-def get_ra_core_components_status_local(sd_root: str) -> list[dict]:
+def get_ra_core_components_status_local(sd_root: str, probed=None) -> list[dict]:
     if not sd_root or not _local_root(sd_root).exists():
         return []
-    return _ra_core_components_status_from_checker(lambda path: _path_exists_local(sd_root, path))
+    if probed is None:
+        probed = _probe_exists_local(sd_root, _ra_status_probe_paths())
+    return _ra_core_components_status_from_checker(probed.get)
 
 
 def _installed_component_keys(components: list[dict], include_incomplete: bool = True) -> list[str]:
@@ -584,63 +605,73 @@ def _installed_component_keys(components: list[dict], include_incomplete: bool =
     return [key for key in keys if key]
 
 
-def _base_ra_files_present(connection) -> bool:
+def _base_ra_files_present(connection, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists(connection, (RA_MAIN_BINARY_PATH, RA_CONFIG_PATH, RA_SOUND_PATH))
     return (
-        _path_exists(connection, RA_MAIN_BINARY_PATH)
-        and _path_exists(connection, RA_CONFIG_PATH)
-        and _path_exists(connection, RA_SOUND_PATH)
+        probed[RA_MAIN_BINARY_PATH]
+        and probed[RA_CONFIG_PATH]
+        and probed[RA_SOUND_PATH]
         and _mister_ini_has_ra_block(connection)
     )
 
 
-def _base_ra_files_present_local(sd_root: str) -> bool:
+def _base_ra_files_present_local(sd_root: str, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists_local(sd_root, (RA_MAIN_BINARY_PATH, RA_CONFIG_PATH, RA_SOUND_PATH))
     return (
-        _path_exists_local(sd_root, RA_MAIN_BINARY_PATH)
-        and _path_exists_local(sd_root, RA_CONFIG_PATH)
-        and _path_exists_local(sd_root, RA_SOUND_PATH)
+        probed[RA_MAIN_BINARY_PATH]
+        and probed[RA_CONFIG_PATH]
+        and probed[RA_SOUND_PATH]
         and _mister_ini_has_ra_block_local(sd_root)
     )
 
 
-def _any_expected_core_files_present(connection) -> bool:
+def _any_expected_core_files_present(connection, probed=None) -> bool:
     return any(
         component.get("rbf_exists") or component.get("mgl_exists")
-        for component in get_ra_core_components_status(connection)
+        for component in get_ra_core_components_status(connection, probed)
     )
 
 
-def _any_expected_core_files_present_local(sd_root: str) -> bool:
+def _any_expected_core_files_present_local(sd_root: str, probed=None) -> bool:
     return any(
         component.get("rbf_exists") or component.get("mgl_exists")
-        for component in get_ra_core_components_status_local(sd_root)
+        for component in get_ra_core_components_status_local(sd_root, probed)
     )
 
 
 def _is_ra_cores_installed(connection) -> bool:
-    components = get_ra_core_components_status(connection)
-    return _base_ra_files_present(connection) and any(component.get("installed") for component in components)
+    probed = _probe_exists(connection, _ra_status_probe_paths())
+    components = get_ra_core_components_status(connection, probed)
+    return _base_ra_files_present(connection, probed) and any(component.get("installed") for component in components)
 
 
 def _is_ra_cores_installed_local(sd_root: str) -> bool:
-    components = get_ra_core_components_status_local(sd_root)
-    return _base_ra_files_present_local(sd_root) and any(component.get("installed") for component in components)
+    probed = _probe_exists_local(sd_root, _ra_status_probe_paths())
+    components = get_ra_core_components_status_local(sd_root, probed)
+    return _base_ra_files_present_local(sd_root, probed) and any(component.get("installed") for component in components)
 
 
-def _is_ra_cores_partial_install(connection) -> bool:
+def _is_ra_cores_partial_install(connection, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists(connection, _ra_status_probe_paths())
     return (
-        _path_exists(connection, RA_MAIN_BINARY_PATH)
-        or _path_exists(connection, RA_SOUND_PATH)
+        probed[RA_MAIN_BINARY_PATH]
+        or probed[RA_SOUND_PATH]
         or _mister_ini_has_ra_block(connection)
-        or _any_expected_core_files_present(connection)
+        or _any_expected_core_files_present(connection, probed)
     )
 
 
-def _is_ra_cores_partial_install_local(sd_root: str) -> bool:
+def _is_ra_cores_partial_install_local(sd_root: str, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists_local(sd_root, _ra_status_probe_paths())
     return (
-        _path_exists_local(sd_root, RA_MAIN_BINARY_PATH)
-        or _path_exists_local(sd_root, RA_SOUND_PATH)
+        probed[RA_MAIN_BINARY_PATH]
+        or probed[RA_SOUND_PATH]
         or _mister_ini_has_ra_block_local(sd_root)
-        or _any_expected_core_files_present_local(sd_root)
+        or _any_expected_core_files_present_local(sd_root, probed)
     )
 
 
@@ -692,16 +723,17 @@ def get_ra_cores_status(connection, check_latest: bool = False, log=None):
             "incomplete_component_keys": [],
         }
 
-    components = get_ra_core_components_status(connection)
+    probed = _probe_exists(connection, _ra_status_probe_paths())
+    components = get_ra_core_components_status(connection, probed)
     installed_component_keys = [component.get("key") for component in components if component.get("installed") and component.get("key")]
     incomplete_component_keys = [component.get("key") for component in components if component.get("incomplete") and component.get("key")]
     missing_component_keys = [component.get("key") for component in components if component.get("state") == "not_installed" and component.get("key")]
     incomplete_components = [component for component in components if component.get("incomplete")]
     all_components_installed = bool(components) and not missing_component_keys and not incomplete_components
-    base_installed = _base_ra_files_present(connection)
+    base_installed = _base_ra_files_present(connection, probed)
     installed = base_installed and bool(installed_component_keys) and not incomplete_components
     legacy_installed = False if installed else _is_legacy_ra_cores_installed(connection)
-    partial_installed = False if (installed or legacy_installed) else _is_ra_cores_partial_install(connection)
+    partial_installed = False if (installed or legacy_installed) else _is_ra_cores_partial_install(connection, probed)
 
     installed_versions = _read_versions(connection) if (installed or legacy_installed or partial_installed) else {"sources": {}}
 
@@ -783,7 +815,7 @@ def get_ra_cores_status(connection, check_latest: bool = False, log=None):
         "install_label": install_label,
         "install_enabled": install_enabled,
         "uninstall_enabled": uninstall_enabled,
-        "edit_config_enabled": _path_exists(connection, RA_CONFIG_PATH),
+        "edit_config_enabled": probed[RA_CONFIG_PATH],
     }
 
 def get_ra_cores_status_local(sd_root: str, check_latest: bool = False, log=None):
@@ -805,16 +837,17 @@ def get_ra_cores_status_local(sd_root: str, check_latest: bool = False, log=None
             "incomplete_component_keys": [],
         }
 
-    components = get_ra_core_components_status_local(sd_root)
+    probed = _probe_exists_local(sd_root, _ra_status_probe_paths())
+    components = get_ra_core_components_status_local(sd_root, probed)
     installed_component_keys = [component.get("key") for component in components if component.get("installed") and component.get("key")]
     incomplete_component_keys = [component.get("key") for component in components if component.get("incomplete") and component.get("key")]
     missing_component_keys = [component.get("key") for component in components if component.get("state") == "not_installed" and component.get("key")]
     incomplete_components = [component for component in components if component.get("incomplete")]
     all_components_installed = bool(components) and not missing_component_keys and not incomplete_components
-    base_installed = _base_ra_files_present_local(sd_root)
+    base_installed = _base_ra_files_present_local(sd_root, probed)
     installed = base_installed and bool(installed_component_keys) and not incomplete_components
     legacy_installed = False if installed else _is_legacy_ra_cores_installed_local(sd_root)
-    partial_installed = False if (installed or legacy_installed) else _is_ra_cores_partial_install_local(sd_root)
+    partial_installed = False if (installed or legacy_installed) else _is_ra_cores_partial_install_local(sd_root, probed)
 
     installed_versions = _read_versions_local(sd_root) if (installed or legacy_installed or partial_installed) else {"sources": {}}
 
@@ -896,7 +929,7 @@ def get_ra_cores_status_local(sd_root: str, check_latest: bool = False, log=None
         "install_label": install_label,
         "install_enabled": install_enabled,
         "uninstall_enabled": uninstall_enabled,
-        "edit_config_enabled": _path_exists_local(sd_root, RA_CONFIG_PATH),
+        "edit_config_enabled": probed[RA_CONFIG_PATH],
     }
 
 def _install_main_package(connection, release: dict, existing_config_present: bool, log) -> dict:
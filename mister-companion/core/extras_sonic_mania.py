@@ -11,11 +11,11 @@ from core.extras_common import (
     _ensure_local_dir,
     _ensure_remote_dir,
     _fetch_latest_zip_release,
-    _glob_exists,
-    _glob_exists_local,
     _normalize_ini_text_for_append,
     _path_exists,
     _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _read_local_text,
     _read_remote_text,
@@ -35,6 +35,9 @@ SONIC_MANIA_REMOTE_GAME_DIR = "/media/fat/games/sonic-mania"
 SONIC_MANIA_REMOTE_LAUNCHER_PATH = "/media/fat/MiSTer_SonicMania"
 SONIC_MANIA_REMOTE_VERSION_FILE = "/media/fat/games/sonic-mania/.mister_companion_version"
 SONIC_MANIA_REMOTE_DATA_RSDK_PATH = "/media/fat/games/sonic-mania/Data.rsdk"
+SONIC_MANIA_REMOTE_RBF_PATTERN = "/media/fat/_Other/Sonic_Mania*.rbf"
+SONIC_MANIA_INSTALL_PATHS = (SONIC_MANIA_REMOTE_GAME_DIR, SONIC_MANIA_REMOTE_LAUNCHER_PATH)
+SONIC_MANIA_STATUS_PROBE_PATHS = SONIC_MANIA_INSTALL_PATHS + (SONIC_MANIA_REMOTE_DATA_RSDK_PATH,)
 
 SONIC_MANIA_INI_BLOCKS = (
     "[Sonic Mania]\n"
@@ -47,28 +50,16 @@ SONIC_MANIA_INI_BLOCKS = (
 REMOTE_INI_PATH = "/media/fat/MiSTer.ini"
 
 
-def _has_sonic_mania_rbf(connection) -> bool:
-    return _glob_exists(connection, "/media/fat/_Other/Sonic_Mania*.rbf")
+def _is_sonic_mania_installed(connection, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists(connection, SONIC_MANIA_INSTALL_PATHS, (SONIC_MANIA_REMOTE_RBF_PATTERN,))
+    return probed[SONIC_MANIA_REMOTE_RBF_PATTERN] and all(probed[path] for path in SONIC_MANIA_INSTALL_PATHS)
 
 
-def _has_sonic_mania_rbf_local(sd_root: str) -> bool:
-    return _glob_exists_local(sd_root, "/media/fat/_Other/Sonic_Mania*.rbf")
-
-
-def _is_sonic_mania_installed(connection) -> bool:
-    return (
-        _has_sonic_mania_rbf(connection)
-        and _path_exists(connection, SONIC_MANIA_REMOTE_GAME_DIR)
-        and _path_exists(connection, SONIC_MANIA_REMOTE_LAUNCHER_PATH)
-    )
-
-
-def _is_sonic_mania_installed_local(sd_root: str) -> bool:
-    return (
-        _has_sonic_mania_rbf_local(sd_root)
-        and _path_exists_local(sd_root, SONIC_MANIA_REMOTE_GAME_DIR)
-        and _path_exists_local(sd_root, SONIC_MANIA_REMOTE_LAUNCHER_PATH)
-    )
+def _is_sonic_mania_installed_local(sd_root: str, probed=None) -> bool:
+    if probed is None:
+        probed = _probe_exists_local(sd_root, SONIC_MANIA_INSTALL_PATHS, (SONIC_MANIA_REMOTE_RBF_PATTERN,))
+    return probed[SONIC_MANIA_REMOTE_RBF_PATTERN] and all(probed[path] for path in SONIC_MANIA_INSTALL_PATHS)
 
 
 def _fetch_latest_sonic_mania_release():
@@ -214,9 +205,10 @@ def get_sonic_mania_status(connection, check_latest: bool = False):
         except Exception as exc:
             latest_error = str(exc)
 
-    installed = _is_sonic_mania_installed(connection)
+    probed = _probe_exists(connection, SONIC_MANIA_STATUS_PROBE_PATHS, (SONIC_MANIA_REMOTE_RBF_PATTERN,))
+    installed = _is_sonic_mania_installed(connection, probed)
     installed_version = _read_installed_sonic_mania_version(connection) if installed else ""
-    data_rsdk_present = _path_exists(connection, SONIC_MANIA_REMOTE_DATA_RSDK_PATH) if installed else False
+    data_rsdk_present = probed[SONIC_MANIA_REMOTE_DATA_RSDK_PATH] if installed else False
 
     update_available = False
     if check_latest:
@@ -274,9 +266,10 @@ def get_sonic_mania_status_local(sd_root: str, check_latest: bool = False):
         except Exception as exc:
             latest_error = str(exc)
 
-    installed = _is_sonic_mania_installed_local(sd_root)
+    probed = _probe_exists_local(sd_root, SONIC_MANIA_STATUS_PROBE_PATHS, (SONIC_MANIA_REMOTE_RBF_PATTERN,))
+    installed = _is_sonic_mania_installed_local(sd_root, probed)
     installed_version = _read_installed_sonic_mania_version_local(sd_root) if installed else ""
-    data_rsdk_present = _path_exists_local(sd_root, SONIC_MANIA_REMOTE_DATA_RSDK_PATH) if installed else False
+    data_rsdk_present = probed[SONIC_MANIA_REMOTE_DATA_RSDK_PATH] if installed else False
 
     update_available = False
     if check_latest:
@@ -366,7 +359,7 @@ def install_or_update_sonic_mania(connection, log):
         log("Inspecting archive contents...\n")
         payloads = _collect_sonic_mania_payloads(zf)
 
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             _ensure_remote_dir(connection, SONIC_MANIA_REMOTE_RBF_DIR)
             _ensure_remote_dir(connection, SONIC_MANIA_REMOTE_GAME_DIR)
@@ -552,7 +545,7 @@ def upload_sonic_mania_data_rsdk(connection, local_path: str, log):
             last_percent["value"] = percent
             log(f"[PROGRESS] {percent}%")
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         sftp.put(local_path, SONIC_MANIA_REMOTE_DATA_RSDK_PATH, callback=progress_callback)
     finally:
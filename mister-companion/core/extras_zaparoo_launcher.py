@@ -11,6 +11,8 @@ from core.extras_common import (
     _fetch_latest_zip_release,
     _path_exists,
     _path_exists_local,
+    _probe_exists,
+    _probe_exists_local,
     _quote,
     _read_local_text,
     _read_remote_text,
@@ -29,6 +31,11 @@ ZAPAROO_LAUNCHER_MAIN_PATH = "/media/fat/zaparoo/MiSTer_Zaparoo"
 ZAPAROO_LAUNCHER_UI_PATH = "/media/fat/zaparoo/frontend"
 ZAPAROO_LAUNCHER_OLD_UI_PATH = "/media/fat/zaparoo/launcher"
 ZAPAROO_LAUNCHER_MENU_CORE_PATH = "/media/fat/zaparoo/menu_zaparoo.rbf"
+ZAPAROO_LAUNCHER_INSTALL_PATHS = (
+    ZAPAROO_LAUNCHER_MAIN_PATH,
+    ZAPAROO_LAUNCHER_UI_PATH,
+    ZAPAROO_LAUNCHER_MENU_CORE_PATH,
+)
 
 ZAPAROO_LAUNCHER_SCRIPT_PATH = "/media/fat/Scripts/zaparoo.sh"
 ZAPAROO_LAUNCHER_BACKUP_SCRIPT_PATH = "/media/fat/Scripts/zaparoo.sh.companion"
@@ -396,19 +403,13 @@ def _remove_local_mister_ini_entries(sd_root: str, log):
 
 
 def _zaparoo_launcher_files_installed(connection) -> bool:
-    return (
-        _path_exists(connection, ZAPAROO_LAUNCHER_MAIN_PATH)
-        and _path_exists(connection, ZAPAROO_LAUNCHER_UI_PATH)
-        and _path_exists(connection, ZAPAROO_LAUNCHER_MENU_CORE_PATH)
-    )
+    probed = _probe_exists(connection, ZAPAROO_LAUNCHER_INSTALL_PATHS)
+    return all(probed[path] for path in ZAPAROO_LAUNCHER_INSTALL_PATHS)
 
 
 def _zaparoo_launcher_files_installed_local(sd_root: str) -> bool:
-    return (
-        _path_exists_local(sd_root, ZAPAROO_LAUNCHER_MAIN_PATH)
-        and _path_exists_local(sd_root, ZAPAROO_LAUNCHER_UI_PATH)
-        and _path_exists_local(sd_root, ZAPAROO_LAUNCHER_MENU_CORE_PATH)
-    )
+    probed = _probe_exists_local(sd_root, ZAPAROO_LAUNCHER_INSTALL_PATHS)
+    return all(probed[path] for path in ZAPAROO_LAUNCHER_INSTALL_PATHS)
 
 
 def _is_zaparoo_launcher_installed(connection) -> bool:
@@ -1,13 +1,34 @@
-import os
 import posixpath
+import shlex
 import shutil
 import stat
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 
+from core.delta_upload import DELTA_MIN_SIZE, delta_upload
+from core.resumable_transfer import resumable_get, resumable_put
+from core.sftp_transfer import collect_local_tree, download_tree, upload_files
+from core.tar_transfer import (
+    TAR_STREAM_THRESHOLD,
+    count_local_files,
+    count_remote_files,
+    download_tree_tar,
+    should_stream_as_tar,
+    upload_tree_tar,
+)
+
 SAFE_ROOTS = ["/media/fat", "/media/usb0"]
 DEFAULT_ROOT = "/media/fat"
 USB_ROOT = "/media/usb0"
 
+DEVICE_POLL_INTERVAL = 0.1
+DEVICE_PROGRESS_INTERVAL = 1.0
+DEVICE_READ_SIZE = 32768
+LISTING_CACHE_SIZE = 64
+PREFETCH_LIMIT = 8
+
 
 def normalize_remote_path(path):
     path = str(path or DEFAULT_ROOT).replace("\\", "/").strip()
@@ -90,7 +111,7 @@ def sftp_exists(sftp, path):
 
 def remote_exists(connection, path):
     path = clamp_to_root(path)
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         return sftp_exists(sftp, path)
     finally:
@@ -98,7 +119,7 @@ def remote_exists(connection, path):
 
 
 def available_roots(connection):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         roots = [{"name": "SD Card", "path": DEFAULT_ROOT, "available": sftp_exists(sftp, DEFAULT_ROOT)}]
         if sftp_exists(sftp, USB_ROOT):
@@ -108,33 +129,126 @@ def available_roots(connection):
         sftp.close()
 
 
-def list_directory(connection, remote_path):
+class DirectoryListingCache:
+    def __init__(self, max_entries=LISTING_CACHE_SIZE):
+        self.max_entries = int(max_entries)
+        self._lock = threading.Lock()
+        self._listings = OrderedDict()
+        self._visits = {}
+
+    def get(self, host, path):
+        with self._lock:
+            listing = self._listings.get((host, path))
+            if listing is not None:
+                self._listings.move_to_end((host, path))
+            return listing
+
+    def put(self, host, path, listing):
+        with self._lock:
+            self._listings[(host, path)] = listing
+            self._listings.move_to_end((host, path))
+            while len(self._listings) > self.max_entries:
+                self._listings.popitem(last=False)
+
+    def contains(self, host, path):
+        with self._lock:
+            return (host, path) in self._listings
+
+    def invalidate(self, host, path=None):
+        with self._lock:
+            for key in list(self._listings):
+                if key[0] != host:
+                    continue
+                if path is None or key[1] == path or key[1].startswith(path.rstrip("/") + "/"):
+                    del self._listings[key]
+
+    def record_visit(self, host, path):
+        with self._lock:
+            key = (host, path)
+            self._visits[key] = self._visits.get(key, 0) + 1
+
+    def visit_count(self, host, path):
+        with self._lock:
+            return self._visits.get((host, path), 0)
+
+
+_listing_cache = DirectoryListingCache()
+
+
+def get_listing_cache():
+    return _listing_cache
+
+
+def _read_directory(sftp, remote_path):
+    entries = []
+    for attr in sftp.listdir_attr(remote_path):
+        name = attr.filename
+        if name in {".", ".."}:
+            continue
+
+        is_dir = stat.S_ISDIR(attr.st_mode)
+        entries.append(
+            {
+                "name": name,
+                "path": join_remote_path(remote_path, name),
+                "is_dir": is_dir,
+                "type": "Folder" if is_dir else "File",
+                "size": int(attr.st_size or 0),
+                "mtime": int(attr.st_mtime or 0),
+            }
+        )
+
+    entries.sort(key=lambda item: (not item["is_dir"], item["name"].lower()))
+    return {"path": remote_path, "entries": entries}
+
+
+def cached_listing(connection, remote_path):
+    # Only for painting rows straight away: a folder's mtime has 1 s resolution and does not
+    # change when a file inside is rewritten, so a cached listing is always followed by a fresh one.
+    return _listing_cache.get(connection.host, clamp_to_root(remote_path))
+
+
+def list_directory(connection, remote_path, use_cache=True):
     remote_path = clamp_to_root(remote_path)
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
-        entries = []
-        for attr in sftp.listdir_attr(remote_path):
-            name = attr.filename
-            if name in {".", ".."}:
-                continue
+        listing = _read_directory(sftp, remote_path)
+    finally:
+        sftp.close()
+
+    if use_cache:
+        _listing_cache.put(connection.host, remote_path, listing)
+        _listing_cache.record_visit(connection.host, remote_path)
+    return listing
+
+
+def prefetch_candidates(connection, listing, limit=PREFETCH_LIMIT):
+    folders = [
+        entry["path"]
+        for entry in (listing or {}).get("entries", [])
+        if entry.get("is_dir") and not _listing_cache.contains(connection.host, entry["path"])
+    ]
+    folders.sort(key=lambda path: -_listing_cache.visit_count(connection.host, path))
+    return folders[:max(0, int(limit))]
 
-            is_dir = stat.S_ISDIR(attr.st_mode)
-            item_path = join_remote_path(remote_path, name)
-            entries.append(
-                {
-                    "name": name,
-                    "path": item_path,
-                    "is_dir": is_dir,
-                    "type": "Folder" if is_dir else "File",
-                    "size": int(attr.st_size or 0),
-                    "mtime": int(attr.st_mtime or 0),
-                }
-            )
 
-        entries.sort(key=lambda item: (not item["is_dir"], item["name"].lower()))
-        return {"path": remote_path, "entries": entries}
+def prefetch_directories(connection, paths, stop_checker=None):
+    fetched = []
+    sftp = connection.open_sftp()
+    try:
+        for path in paths:
+            if stop_checker and stop_checker():
+                break
+            try:
+                path = clamp_to_root(path)
+                _listing_cache.put(connection.host, path, _read_directory(sftp, path))
+                fetched.append(path)
+            except Exception:
+                if not connection.is_connected():
+                    break
     finally:
         sftp.close()
+    return fetched
 
 
 def ensure_remote_dir(sftp, remote_dir):
@@ -157,51 +271,90 @@ def ensure_target_available(sftp, target_path, overwrite=False):
     delete_path_with_sftp(sftp, target_path)
 
 
-def upload_path(connection, local_path, remote_dir, progress_callback=None, message_callback=None, target_name=None, overwrite=False):
-    local_path = Path(local_path)
-    remote_dir = clamp_to_root(remote_dir)
-    sftp = connection.client.open_sftp()
+def can_delta_upload(sftp, local_path, target_path, overwrite=False):
+    if not overwrite or local_path.is_dir():
+        return False
     try:
-        name = target_name or local_path.name
-        target_path = join_remote_path(remote_dir, name)
-        ensure_target_available(sftp, target_path, overwrite=overwrite)
+        attr = sftp.stat(target_path)
+    except Exception:
+        return False
+    return stat.S_ISREG(attr.st_mode) and local_path.stat().st_size >= DELTA_MIN_SIZE
 
-        if local_path.is_dir():
-            upload_folder(sftp, local_path, target_path, progress_callback, message_callback)
-            return target_path
 
+def upload_file_delta(connection, local_path, target_path, progress_callback=None, message_callback=None):
+    try:
+        stats = delta_upload(connection, local_path, target_path, progress_callback, message_callback)
+    except Exception as e:
+        if not connection.is_connected():
+            raise
         if message_callback:
-            message_callback(f"Uploading {local_path.name}...")
-        sftp.put(str(local_path), target_path, callback=progress_callback)
-        return target_path
-    finally:
-        sftp.close()
+            message_callback(f"Delta upload failed ({e}), sending the whole file...")
+        stats = None
 
+    if stats is None:
+        if message_callback:
+            message_callback(f"Uploading {Path(local_path).name}...")
+        resumable_put(connection, str(local_path), target_path, progress_callback, message_callback)
+        return
 
-def upload_folder(sftp, local_folder, remote_folder, progress_callback=None, message_callback=None):
-    ensure_remote_dir(sftp, remote_folder)
-    for root, dirs, files in os.walk(local_folder):
-        root_path = Path(root)
-        relative = root_path.relative_to(local_folder)
-        current_remote = remote_folder if str(relative) == "." else join_remote_path(remote_folder, str(relative).replace(os.sep, "/"))
-        ensure_remote_dir(sftp, current_remote)
+    if message_callback and stats["changed_blocks"]:
+        message_callback(
+            f"Delta upload sent {format_size(stats['bytes_sent'])} of {format_size(stats['size'])} "
+            f"({stats['changed_blocks']}/{stats['blocks']} blocks changed, saved {format_size(stats['bytes_saved'])})."
+        )
 
-        for dirname in dirs:
-            ensure_remote_dir(sftp, join_remote_path(current_remote, dirname))
 
-        for filename in files:
-            local_file = root_path / filename
-            remote_file = join_remote_path(current_remote, filename)
-            if message_callback:
-                message_callback(f"Uploading {local_file.name}...")
-            sftp.put(str(local_file), remote_file, callback=progress_callback)
+def upload_path(connection, local_path, remote_dir, progress_callback=None, message_callback=None, target_name=None, overwrite=False, tar_threshold=TAR_STREAM_THRESHOLD, compress=False, delta=True):
+    item = {"local_path": local_path, "remote_dir": remote_dir, "target_name": target_name, "overwrite": overwrite}
+    return upload_items(connection, [item], progress_callback, message_callback, tar_threshold, compress, delta)[0]
+
 
+def upload_items(connection, items, progress_callback=None, message_callback=None, tar_threshold=TAR_STREAM_THRESHOLD, compress=False, delta=True):
+    directories = []
+    jobs = []
+    targets = []
+    tar_folders = []
+    delta_files = []
+    sftp = connection.open_sftp()
+    try:
+        for item in items:
+            local_path = Path(item.get("local_path"))
+            remote_dir = clamp_to_root(item.get("remote_dir", DEFAULT_ROOT))
+            target_path = join_remote_path(remote_dir, item.get("target_name") or local_path.name)
+            overwrite = item.get("overwrite", False)
+
+            if delta and can_delta_upload(sftp, local_path, target_path, overwrite=overwrite):
+                delta_files.append((local_path, target_path))
+                targets.append(target_path)
+                continue
+
+            ensure_target_available(sftp, target_path, overwrite=overwrite)
+
+            if local_path.is_dir() and should_stream_as_tar(count_local_files(local_path, limit=tar_threshold), tar_threshold):
+                tar_folders.append((local_path, target_path))
+            elif local_path.is_dir():
+                item_directories, item_jobs = collect_local_tree(local_path, target_path)
+                directories.extend(item_directories)
+                jobs.extend(item_jobs)
+            else:
+                jobs.append((str(local_path), target_path, local_path.stat().st_size))
+            targets.append(target_path)
+    finally:
+        sftp.close()
 
-def download_path(connection, remote_path, local_dir, progress_callback=None, message_callback=None, target_name=None, overwrite=False):
+    upload_files(connection, jobs, progress_callback, message_callback, directories=directories)
+    for local_path, target_path in tar_folders:
+        upload_tree_tar(connection, local_path, target_path, progress_callback, message_callback, compress=compress)
+    for local_path, target_path in delta_files:
+        upload_file_delta(connection, local_path, target_path, progress_callback, message_callback)
+    return targets
+
+
+def download_path(connection, remote_path, local_dir, progress_callback=None, message_callback=None, target_name=None, overwrite=False, tar_threshold=TAR_STREAM_THRESHOLD, compress=False):
     remote_path = clamp_to_root(remote_path)
     local_dir = Path(local_dir)
     local_dir.mkdir(parents=True, exist_ok=True)
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         attr = sftp.stat(remote_path)
         name = target_name or posixpath.basename(remote_path.rstrip("/"))
@@ -214,38 +367,30 @@ def download_path(connection, remote_path, local_dir, progress_callback=None, me
             else:
                 target.unlink()
 
-        if stat.S_ISDIR(attr.st_mode):
-            download_folder(sftp, remote_path, target, progress_callback, message_callback)
-            return str(target)
+        is_file = not stat.S_ISDIR(attr.st_mode)
+    finally:
+        sftp.close()
 
+    if is_file:
         if message_callback:
             message_callback(f"Downloading {name}...")
-        sftp.get(remote_path, str(target), callback=progress_callback)
+        resumable_get(connection, remote_path, target, progress_callback, message_callback)
         return str(target)
-    finally:
-        sftp.close()
 
+    if should_stream_as_tar(count_remote_files(connection, remote_path), tar_threshold):
+        download_tree_tar(connection, remote_path, target, progress_callback, message_callback, compress=compress)
+    else:
+        download_folder(connection, remote_path, target, progress_callback, message_callback)
+    return str(target)
 
-def download_folder(sftp, remote_folder, local_folder, progress_callback=None, message_callback=None):
-    local_folder = Path(local_folder)
-    local_folder.mkdir(parents=True, exist_ok=True)
-    for attr in sftp.listdir_attr(remote_folder):
-        name = attr.filename
-        if name in {".", ".."}:
-            continue
-        remote_item = join_remote_path(remote_folder, name)
-        local_item = local_folder / name
-        if stat.S_ISDIR(attr.st_mode):
-            download_folder(sftp, remote_item, local_item, progress_callback, message_callback)
-        else:
-            if message_callback:
-                message_callback(f"Downloading {name}...")
-            sftp.get(remote_item, str(local_item), callback=progress_callback)
+
+def download_folder(connection, remote_folder, local_folder, progress_callback=None, message_callback=None):
+    download_tree(connection, remote_folder, local_folder, progress_callback, message_callback)
 
 
 def make_directory(connection, remote_path):
     remote_path = clamp_to_root(remote_path)
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         sftp.mkdir(remote_path)
     finally:
@@ -257,7 +402,7 @@ def rename_path(connection, old_path, new_path, overwrite=False):
     new_path = clamp_to_root(new_path)
     if root_for_path(old_path) != root_for_path(new_path):
         raise ValueError("Items cannot be moved outside the selected storage root.")
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         ensure_target_available(sftp, new_path, overwrite=overwrite)
         sftp.rename(old_path, new_path)
@@ -265,6 +410,90 @@ def rename_path(connection, old_path, new_path, overwrite=False):
         sftp.close()
 
 
+def remote_file_size(connection, remote_path):
+    output = connection.run_command(f"stat -c %s {shlex.quote(remote_path)} 2>/dev/null") or ""
+    try:
+        return int(output.split()[0])
+    except (ValueError, IndexError):
+        return 0
+
+
+def run_on_device(connection, command, target_path, total=0, progress_callback=None, is_file=False):
+    transport = connection.client.get_transport() if connection.client else None
+    if transport is None or not transport.is_active():
+        raise RuntimeError("Not connected")
+
+    # Walking a whole tree with du would compete with the copy for SD card I/O, so only a single
+    # file reports progress while it is being written.
+    poll_progress = bool(progress_callback and is_file and total)
+    next_progress = time.monotonic() + DEVICE_PROGRESS_INTERVAL
+    errors = []
+
+    channel = transport.open_session()
+    try:
+        channel.exec_command(command)
+        while not channel.exit_status_ready():
+            # cp and mv can print a warning per file; unread output would fill the channel window
+            # and stall the command.
+            while channel.recv_stderr_ready():
+                errors.append(channel.recv_stderr(DEVICE_READ_SIZE))
+            while channel.recv_ready():
+                channel.recv(DEVICE_READ_SIZE)
+
+            if poll_progress and time.monotonic() >= next_progress:
+                progress_callback(min(remote_file_size(connection, target_path), total), total)
+                next_progress = time.monotonic() + DEVICE_PROGRESS_INTERVAL
+
+            time.sleep(DEVICE_POLL_INTERVAL)
+
+        exit_status = channel.recv_exit_status()
+        while True:
+            data = channel.recv_stderr(DEVICE_READ_SIZE)
+            if not data:
+                break
+            errors.append(data)
+    finally:
+        channel.close()
+
+    if exit_status == 0 and progress_callback:
+        progress_callback(total, total)
+
+    return exit_status, b"".join(errors).decode("utf-8", errors="ignore").strip()
+
+
+def _copy_on_device(connection, source_path, target_path, progress_callback=None, message_callback=None, is_file=False):
+    if message_callback:
+        message_callback(f"Copying {posixpath.basename(source_path)} on MiSTer...")
+
+    total = remote_file_size(connection, source_path) if is_file else 0
+    exit_status, error = run_on_device(
+        connection,
+        f"cp -a {shlex.quote(source_path)} {shlex.quote(target_path)}",
+        target_path,
+        total,
+        progress_callback,
+        is_file,
+    )
+    if exit_status != 0:
+        connection.run_command(f"rm -rf {shlex.quote(target_path)}")
+        raise RuntimeError(error or f"cp failed with exit code {exit_status}.")
+
+
+def _move_on_device(connection, source_path, target_path, progress_callback=None, message_callback=None, is_file=False):
+    if message_callback:
+        message_callback(f"Moving {posixpath.basename(source_path)} on MiSTer...")
+
+    total = remote_file_size(connection, source_path) if is_file else 0
+    return run_on_device(
+        connection,
+        f"mv {shlex.quote(source_path)} {shlex.quote(target_path)}",
+        target_path,
+        total,
+        progress_callback,
+        is_file,
+    )
+
+
 def copy_path(connection, source_path, target_dir, target_name=None, overwrite=False, progress_callback=None, message_callback=None):
     source_path = clamp_to_root(source_path)
     target_dir = clamp_to_root(target_dir)
@@ -273,14 +502,33 @@ def copy_path(connection, source_path, target_dir, target_name=None, overwrite=F
     if not source_root or not target_root:
         raise ValueError("Source and destination must be inside MiSTer storage.")
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         attr = sftp.stat(source_path)
         name = target_name or posixpath.basename(source_path.rstrip("/"))
         target_path = join_remote_path(target_dir, name)
         if source_path == target_path:
             raise ValueError("Source and destination are the same.")
+        if stat.S_ISDIR(attr.st_mode) and target_path.startswith(source_path + "/"):
+            raise ValueError("A folder cannot be copied into itself.")
         ensure_target_available(sftp, target_path, overwrite=overwrite)
+
+        try:
+            _copy_on_device(
+                connection,
+                source_path,
+                target_path,
+                progress_callback,
+                message_callback,
+                is_file=not stat.S_ISDIR(attr.st_mode),
+            )
+            return target_path
+        except Exception as e:
+            if not connection.is_connected():
+                raise
+            if message_callback:
+                message_callback(f"Copy on MiSTer failed ({e}), falling back to SFTP...")
+
         if stat.S_ISDIR(attr.st_mode):
             copy_folder_with_sftp(sftp, source_path, target_path, progress_callback, message_callback)
         else:
@@ -300,22 +548,49 @@ def move_path(connection, source_path, target_dir, target_name=None, overwrite=F
     if source_path == source_root:
         raise ValueError("The storage root cannot be moved.")
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         name = target_name or posixpath.basename(source_path.rstrip("/"))
         target_path = join_remote_path(target_dir, name)
         if source_path == target_path:
             raise ValueError("Source and destination are the same.")
+        if target_path.startswith(source_path + "/"):
+            raise ValueError("A folder cannot be moved into itself.")
         ensure_target_available(sftp, target_path, overwrite=overwrite)
         try:
             sftp.rename(source_path, target_path)
+            return target_path
         except Exception:
-            attr = sftp.stat(source_path)
-            if stat.S_ISDIR(attr.st_mode):
-                copy_folder_with_sftp(sftp, source_path, target_path, progress_callback, message_callback)
-            else:
-                copy_file_with_sftp(sftp, source_path, target_path, progress_callback, message_callback)
-            delete_path_with_sftp(sftp, source_path)
+            pass
+
+        attr = sftp.stat(source_path)
+        try:
+            exit_status, error = _move_on_device(
+                connection,
+                source_path,
+                target_path,
+                progress_callback,
+                message_callback,
+                is_file=not stat.S_ISDIR(attr.st_mode),
+            )
+        except Exception as e:
+            if not connection.is_connected():
+                raise
+            if message_callback:
+                message_callback(f"Move on MiSTer failed ({e}), falling back to SFTP...")
+        else:
+            if exit_status != 0:
+                # A cross-device mv that fails partway leaves the source intact and a partial target.
+                source = shlex.quote(source_path)
+                connection.run_command(f"[ -e {source} ] && rm -rf {shlex.quote(target_path)}")
+                raise RuntimeError(error or f"mv failed with exit code {exit_status}.")
+            return target_path
+
+        if stat.S_ISDIR(attr.st_mode):
+            copy_folder_with_sftp(sftp, source_path, target_path, progress_callback, message_callback)
+        else:
+            copy_file_with_sftp(sftp, source_path, target_path, progress_callback, message_callback)
+        delete_path_with_sftp(sftp, source_path)
         return target_path
     finally:
         sftp.close()
@@ -358,7 +633,7 @@ def delete_path(connection, remote_path):
     root = root_for_path(remote_path)
     if not root or remote_path == root:
         raise ValueError("The storage root cannot be deleted.")
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         delete_path_with_sftp(sftp, remote_path)
     finally:
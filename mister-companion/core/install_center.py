@@ -1216,7 +1216,7 @@ def _write_rom_manifest(context: InstallCenterContext, manifest: dict):
         path.write_text(text, encoding="utf-8")
         return
 
-    sftp = context.connection.client.open_sftp()
+    sftp = context.connection.open_sftp()
     try:
         ensure_remote_dir(sftp, "/media/fat/Scripts/.config/mister_companion/install_center")
         with sftp.open(ROM_MANIFEST_REMOTE_PATH, "w") as handle:
@@ -1287,7 +1287,7 @@ def _write_rom_file(context: InstallCenterContext, target_relative: str, data: b
         target.write_bytes(data)
     else:
         target = resolve_mister_relative_path(context, target_relative)
-        sftp = context.connection.client.open_sftp()
+        sftp = context.connection.open_sftp()
         try:
             ensure_remote_dir(sftp, str(Path(target).parent).replace("\\", "/"))
             with sftp.open(target, "wb") as handle:
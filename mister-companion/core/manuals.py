@@ -4,6 +4,7 @@ from pathlib import Path
 
 from core.app_paths import app_base_dir, generated_path
 from core.open_helpers import open_local_folder
+from core.resumable_transfer import resumable_get
 from shlex import quote
 
 
@@ -280,30 +281,15 @@ def cache_remote_pdf(
     else:
         local_path = get_temp_pdf_path(system_name, filename)
 
-    temp_path = local_path.with_suffix(local_path.suffix + ".tmp")
+    resumable_get(connection, remote_path, local_path, verify=False)
 
-    if temp_path.exists():
+    if not local_path.exists() or local_path.stat().st_size <= 0:
         try:
-            temp_path.unlink()
-        except Exception:
-            pass
-
-    sftp = connection.client.open_sftp()
-
-    try:
-        sftp.get(remote_path, str(temp_path))
-    finally:
-        sftp.close()
-
-    if not temp_path.exists() or temp_path.stat().st_size <= 0:
-        try:
-            temp_path.unlink()
+            local_path.unlink()
         except Exception:
             pass
         raise RuntimeError("Downloaded PDF is empty or missing.")
 
-    temp_path.replace(local_path)
-
     return local_path
 
 
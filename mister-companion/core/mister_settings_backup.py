@@ -171,7 +171,7 @@ def create_mister_settings_backup(
     if not ok:
         return False, message, ""
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         sftp.get(remote_mister_ini_path(ini_filename), backup_file)
     finally:
@@ -206,7 +206,7 @@ def restore_mister_settings_backup(
 ):
     ini_filename = normalize_mister_ini_filename(ini_filename)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         sftp.put(backup_path, remote_mister_ini_path(ini_filename))
     finally:
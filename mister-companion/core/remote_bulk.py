@@ -0,0 +1,138 @@
+import io
+import shlex
+import tarfile
+import time
+import uuid
+
+
+BULK_TEMP_SUFFIX = ".mc_tmp"
+BULK_FILE_MODE = 0o644
+
+
+def build_read_many_command(paths):
+    # Each file is copied to a temp file first, so the announced size is exactly what cat sends
+    # even if the original grows or shrinks meanwhile, and every frame ends with a "D" marker.
+    parts = ['t=$(mktemp) || exit 1']
+
+    for index, path in enumerate(paths):
+        quoted = shlex.quote(path)
+        parts.append(
+            f"if [ ! -f {quoted} ]; then printf 'M %s 0\\n' {index}; "
+            f"elif cat {quoted} >\"$t\" 2>/dev/null; then "
+            f"printf 'F %s %s\\n' {index} \"$(stat -c %s \"$t\")\"; cat \"$t\"; printf 'D %s\\n' {index}; "
+            f"else printf 'E %s 0\\n' {index}; fi"
+        )
+
+    parts.append('rm -f "$t"')
+    return "; ".join(parts)
+
+
+def parse_read_many_output(data, paths):
+    paths = list(paths)
+    result = {}
+    failed = []
+    position = 0
+
+    def malformed():
+        return RuntimeError("Unexpected output while reading files from MiSTer.")
+
+    while position < len(data):
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            raise malformed()
+
+        fields = data[position:newline].decode("ascii", errors="ignore").split()
+        position = newline + 1
+
+        if len(fields) != 3 or fields[0] not in {"F", "M", "E"}:
+            raise malformed()
+
+        try:
+            index = int(fields[1])
+            size = int(fields[2])
+        except ValueError:
+            raise malformed()
+
+        if not 0 <= index < len(paths) or paths[index] in result:
+            raise malformed()
+
+        path = paths[index]
+        if fields[0] == "M":
+            result[path] = None
+        elif fields[0] == "E":
+            result[path] = None
+            failed.append(path)
+        else:
+            end = position + size
+            trailer = f"D {index}\n".encode("ascii")
+            if data[end:end + len(trailer)] != trailer:
+                raise malformed()
+            result[path] = bytes(data[position:end])
+            position = end + len(trailer)
+
+    if failed:
+        raise RuntimeError("Failed to read:\n" + "\n".join(failed))
+    if len(result) != len(paths):
+        raise malformed()
+    return result
+
+
+def _temp_path(path, token):
+    return f"{path}{BULK_TEMP_SUFFIX}{token}"
+
+
+def build_write_many_payload(files, token=None):
+    token = token or uuid.uuid4().hex[:8]
+    buffer = io.BytesIO()
+    writes = []
+    removals = []
+
+    with tarfile.open(fileobj=buffer, mode="w", format=tarfile.USTAR_FORMAT) as archive:
+        for path, data in files.items():
+            if data is None:
+                removals.append(path)
+                continue
+
+            if isinstance(data, str):
+                data = data.encode("utf-8")
+
+            temp_path = _temp_path(path, token)
+            info = tarfile.TarInfo(temp_path.lstrip("/"))
+            info.size = len(data)
+            info.mode = BULK_FILE_MODE
+            info.mtime = int(time.time())
+            archive.addfile(info, io.BytesIO(data))
+            writes.append((path, temp_path))
+
+    commands = []
+    if writes:
+        cleanup = " ".join(shlex.quote(temp_path) for _path, temp_path in writes)
+        commands.append(f"tar -xf - -C / || {{ rm -f {cleanup}; exit 1; }}")
+    else:
+        commands.append("cat >/dev/null")
+
+    # New files get BULK_FILE_MODE; existing files keep their mode, and symlinks are written
+    # through (non-atomically) instead of being replaced by a plain file.
+    for path, temp_path in writes:
+        quoted = shlex.quote(path)
+        temp = shlex.quote(temp_path)
+        commands.append(
+            f"if [ -L {quoted} ]; then cat {temp} >{quoted} && rm -f {temp}; "
+            f"else {{ [ ! -e {quoted} ] || chmod \"$(stat -c %a {quoted})\" {temp}; }} && mv -f {temp} {quoted}; fi "
+            f"|| {{ rm -f {temp}; printf 'F %s\\n' {quoted}; }}"
+        )
+
+    for path in removals:
+        commands.append(
+            f"rm -f {shlex.quote(path)} || printf 'F %s\\n' {shlex.quote(path)}"
+        )
+
+    commands.append("sync")
+
+    return buffer.getvalue(), "; ".join(commands)
+
+
+def parse_write_many_output(output):
+    return [line[2:] for line in (output or "").splitlines() if line.startswith("F ")]
+
+
@@ -0,0 +1,198 @@
+import fnmatch
+import glob
+import os
+import posixpath
+import shlex
+from pathlib import Path
+
+
+MEDIA_FAT_PREFIX = "/media/fat"
+
+PROBE_FILE = "file"
+PROBE_DIR = "dir"
+PROBE_OTHER = "other"
+
+_REMOTE_TYPES = {"f": PROBE_FILE, "d": PROBE_DIR, "o": PROBE_OTHER}
+
+_PROBE_FUNCTION = (
+    "_mc_probe() { "
+    'if [ -d "$3" ]; then t=d; elif [ -f "$3" ]; then t=f; elif [ -e "$3" ]; then t=o; '
+    "else [ \"$1\" = p ] && printf 'p\\t%s\\t-\\t\\t\\n' \"$2\"; return 0; fi; "
+    "printf '%s\\t%s\\t%s\\t%s\\t%s\\n' \"$1\" \"$2\" \"$t\" "
+    "\"$(stat -c '%s %Y' \"$3\" 2>/dev/null)\" \"$3\"; "
+    "}"
+)
+
+
+def _missing(path):
+    return {"exists": False, "type": "", "size": 0, "mtime": 0, "path": path}
+
+
+def _entry(path, kind, size=0, mtime=0):
+    return {"exists": True, "type": kind, "size": int(size or 0), "mtime": int(mtime or 0), "path": path}
+
+
+def _has_magic(value):
+    return any(char in value for char in "*?[")
+
+
+def build_probe_command(paths=(), globs=()):
+    paths = list(paths or [])
+    globs = list(globs or [])
+
+    parts = [_PROBE_FUNCTION]
+
+    for index, path in enumerate(paths):
+        parts.append(f"_mc_probe p {index} {shlex.quote(path)}")
+
+    if globs:
+        parts.append("IFS=''")
+        for index, pattern in enumerate(globs):
+            parts.append(
+                f"_mc_g={shlex.quote(pattern)}; "
+                f'for _mc_f in $_mc_g; do _mc_probe g {index} "$_mc_f"; done'
+            )
+
+    return "; ".join(parts)
+
+
+def parse_probe_output(output, paths=(), globs=()):
+    paths = list(paths or [])
+    globs = list(globs or [])
+
+    result = {path: _missing(path) for path in paths}
+    for pattern in globs:
+        result[pattern] = {"exists": False, "matches": []}
+
+    for line in (output or "").splitlines():
+        fields = line.split("\t")
+        if len(fields) < 3 or fields[0] not in {"p", "g"}:
+            continue
+
+        try:
+            index = int(fields[1])
+        except ValueError:
+            continue
+
+        kind = _REMOTE_TYPES.get(fields[2])
+        if kind is None:
+            continue
+
+        size = mtime = 0
+        if len(fields) > 3:
+            stat_fields = fields[3].split()
+            if len(stat_fields) == 2 and all(value.isdigit() for value in stat_fields):
+                size, mtime = int(stat_fields[0]), int(stat_fields[1])
+
+        matched_path = fields[4] if len(fields) > 4 else ""
+
+        if fields[0] == "p" and 0 <= index < len(paths):
+            result[paths[index]] = _entry(paths[index], kind, size, mtime)
+        elif fields[0] == "g" and 0 <= index < len(globs):
+            entry = result[globs[index]]
+            entry["exists"] = True
+            entry["matches"].append(_entry(matched_path, kind, size, mtime))
+
+    return result
+
+
+def _local_path(sd_root, remote_path):
+    remote_path = str(remote_path).replace("\\", "/")
+    if remote_path == MEDIA_FAT_PREFIX:
+        relative = ""
+    elif remote_path.startswith(MEDIA_FAT_PREFIX + "/"):
+        relative = remote_path[len(MEDIA_FAT_PREFIX) + 1:]
+    else:
+        return None
+    return Path(str(sd_root)).expanduser() / relative
+
+
+class _LocalScanner:
+    def __init__(self):
+        self._listings = {}
+
+    def listing(self, directory):
+        key = str(directory)
+        if key not in self._listings:
+            entries = {}
+            try:
+                with os.scandir(key) as iterator:
+                    for entry in iterator:
+                        entries[entry.name] = entry
+            except OSError:
+                entries = None
+            self._listings[key] = entries
+        return self._listings[key]
+
+    def describe(self, remote_path, local_path):
+        entries = self.listing(local_path.parent)
+        entry = entries.get(local_path.name) if entries else None
+
+        try:
+            if entry is not None:
+                if entry.is_dir():
+                    kind = PROBE_DIR
+                elif entry.is_file():
+                    kind = PROBE_FILE
+                else:
+                    kind = PROBE_OTHER
+                stat_result = entry.stat()
+            else:
+                stat_result = os.stat(local_path)
+                if os.path.isdir(local_path):
+                    kind = PROBE_DIR
+                elif os.path.isfile(local_path):
+                    kind = PROBE_FILE
+                else:
+                    kind = PROBE_OTHER
+        except OSError:
+            return None
+
+        return _entry(remote_path, kind, stat_result.st_size, stat_result.st_mtime)
+
+
+def probe_local(sd_root, paths=(), globs=()):
+    paths = list(paths or [])
+    globs = list(globs or [])
+    scanner = _LocalScanner()
+
+    result = {}
+
+    for path in paths:
+        local_path = _local_path(sd_root, path) if sd_root else None
+        described = scanner.describe(path, local_path) if local_path is not None else None
+        result[path] = described or _missing(path)
+
+    for pattern in globs:
+        entry = {"exists": False, "matches": []}
+        result[pattern] = entry
+
+        local_pattern = _local_path(sd_root, pattern) if sd_root else None
+        if local_pattern is None:
+            continue
+
+        remote_dir, name_pattern = posixpath.split(pattern)
+
+        if _has_magic(remote_dir):
+            matches = sorted(glob.glob(str(local_pattern)))
+            remote_root = Path(str(sd_root)).expanduser()
+            candidates = [
+                (MEDIA_FAT_PREFIX + "/" + Path(match).relative_to(remote_root).as_posix(), Path(match))
+                for match in matches
+            ]
+        else:
+            entries = scanner.listing(local_pattern.parent) or {}
+            candidates = [
+                (posixpath.join(remote_dir, name), local_pattern.parent / name)
+                for name in sorted(entries)
+                if fnmatch.fnmatch(name, name_pattern)
+                and (name_pattern.startswith(".") or not name.startswith("."))
+            ]
+
+        for remote_match, local_match in candidates:
+            described = scanner.describe(remote_match, local_match)
+            if described:
+                entry["exists"] = True
+                entry["matches"].append(described)
+
+    return result
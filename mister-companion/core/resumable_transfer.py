@@ -0,0 +1,374 @@
+import hashlib
+import json
+import os
+import shlex
+import threading
+import time
+from pathlib import Path
+
+from core.app_paths import generated_path
+
+
+TRANSFER_JOURNAL_PATH = generated_path("transfer_journal.json")
+PART_SUFFIX = ".mcpart"
+RESUME_MIN_SIZE = 4 * 1024 * 1024
+RESUME_MAX_ATTEMPTS = 5
+RESUME_CHUNK_SIZE = 32768
+RESUME_UPLOAD_REWIND = 4 * 1024 * 1024
+JOURNAL_SAVE_INTERVAL = 2.0
+JOURNAL_MAX_AGE = 7 * 24 * 60 * 60
+
+CHECKSUM_COMMANDS = (
+    ("md5sum", hashlib.md5),
+    ("sha1sum", hashlib.sha1),
+)
+
+
+class TransferJournal:
+    def __init__(self, path=TRANSFER_JOURNAL_PATH):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries = None
+        self._last_save = 0.0
+
+    def _load(self):
+        if self._entries is not None:
+            return
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            data = {}
+
+        self._entries = {
+            key: entry
+            for key, entry in (data if isinstance(data, dict) else {}).items()
+            if isinstance(entry, dict)
+        }
+
+        # Expired downloads leave their part file on this machine, so it goes right away. Expired
+        # uploads stay listed until the next transfer with that MiSTer removes their remote part.
+        expired = False
+        for key in list(self._entries):
+            direction, _host, part_path = _parse_key(key)
+            if direction == "get" and self._expired(self._entries[key]):
+                try:
+                    Path(part_path).unlink(missing_ok=True)
+                except OSError:
+                    continue
+                del self._entries[key]
+                expired = True
+        if expired:
+            self._save()
+
+    def _expired(self, entry):
+        return time.time() - float(entry.get("updated", 0)) >= JOURNAL_MAX_AGE
+
+    def _save(self):
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps(self._entries, indent=2), encoding="utf-8")
+            temp_path.replace(self.path)
+        except Exception:
+            pass
+        self._last_save = time.monotonic()
+
+    def get(self, key):
+        with self._lock:
+            self._load()
+            entry = self._entries.get(key)
+            return dict(entry) if entry and not self._expired(entry) else None
+
+    def take_expired_uploads(self, host):
+        # Entries are dropped as they are handed out, so parallel workers never sweep the same part.
+        with self._lock:
+            self._load()
+            parts = []
+            for key in list(self._entries):
+                direction, entry_host, part_path = _parse_key(key)
+                if direction == "put" and entry_host == host and self._expired(self._entries[key]):
+                    del self._entries[key]
+                    parts.append(part_path)
+            if parts:
+                self._save()
+            return parts
+
+    def update(self, key, force=False, **values):
+        with self._lock:
+            self._load()
+            entry = self._entries.setdefault(key, {})
+            entry.update(values)
+            entry["updated"] = time.time()
+            if force or time.monotonic() - self._last_save >= JOURNAL_SAVE_INTERVAL:
+                self._save()
+
+    def remove(self, key):
+        with self._lock:
+            self._load()
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+
+_journal = TransferJournal()
+
+
+def get_transfer_journal():
+    return _journal
+
+
+def journal_key(direction, host, remote_path, local_path):
+    return f"{direction}|{host}|{remote_path}|{Path(local_path).resolve()}"
+
+
+def _parse_key(key):
+    # Returns (direction, host, part path); the part file sits next to the transfer's target.
+    direction, host, paths = (key.split("|", 2) + ["", ""])[:3]
+    remote_path, _sep, local_path = paths.rpartition("|")
+    target = local_path if direction == "get" else remote_path
+    return direction, host, target + PART_SUFFIX
+
+
+def _sweep_expired_uploads(connection, sftp, journal):
+    for part_path in journal.take_expired_uploads(connection.host):
+        try:
+            sftp.remove(part_path)
+        except IOError:
+            pass
+
+
+def remote_checksum(connection, remote_path):
+    quoted = shlex.quote(remote_path)
+    for command, factory in CHECKSUM_COMMANDS:
+        output = connection.run_command(f"{command} {quoted} 2>/dev/null") or ""
+        digest = output.split()[0].lower() if output.split() else ""
+        if digest and all(char in "0123456789abcdef" for char in digest):
+            return command, factory, digest
+    return "", None, ""
+
+
+def local_checksum(local_path, factory):
+    digest = factory()
+    with open(local_path, "rb") as handle:
+        while True:
+            chunk = handle.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def verify_transfer(connection, remote_path, local_path, message_callback=None):
+    command, factory, remote_digest = remote_checksum(connection, remote_path)
+    if not factory:
+        if message_callback:
+            message_callback("Checksum tools are not available on MiSTer, skipping verification.")
+        return True
+
+    if local_checksum(local_path, factory) != remote_digest:
+        raise RuntimeError(f"Checksum mismatch after transfer ({command}): {remote_path}")
+
+    if message_callback:
+        name = os.path.basename(str(local_path))
+        if name.endswith(PART_SUFFIX):
+            name = name[:-len(PART_SUFFIX)]
+        message_callback(f"Verified {name} ({command}).")
+    return True
+
+
+def _remote_exists(sftp, path):
+    try:
+        sftp.stat(path)
+        return True
+    except Exception:
+        return False
+
+
+def _replace_remote(sftp, source_path, target_path):
+    try:
+        sftp.posix_rename(source_path, target_path)
+        return
+    except Exception:
+        pass
+
+    if _remote_exists(sftp, target_path):
+        sftp.remove(target_path)
+    sftp.rename(source_path, target_path)
+
+
+def _get_attempt(connection, sftp, remote_path, local_path, progress, journal):
+    _sweep_expired_uploads(connection, sftp, journal)
+    attr = sftp.stat(remote_path)
+    size = int(attr.st_size or 0)
+    mtime = int(attr.st_mtime or 0)
+    part_path = Path(str(local_path) + PART_SUFFIX)
+    key = journal_key("get", connection.host, remote_path, local_path)
+
+    entry = journal.get(key)
+    offset = 0
+    if entry and entry.get("size") == size and entry.get("mtime") == mtime and part_path.exists():
+        offset = min(part_path.stat().st_size, size)
+    elif part_path.exists():
+        part_path.unlink()
+
+    journal.update(key, force=True, size=size, mtime=mtime, offset=offset)
+    if progress:
+        progress(offset, size)
+
+    with sftp.open(remote_path, "rb") as source_file:
+        source_file.seek(offset)
+        if size > offset:
+            source_file.prefetch(size)
+        with open(part_path, "r+b" if offset else "wb") as target_file:
+            target_file.seek(offset)
+            transferred = offset
+            while True:
+                chunk = source_file.read(RESUME_CHUNK_SIZE)
+                if not chunk:
+                    break
+                target_file.write(chunk)
+                transferred += len(chunk)
+                journal.update(key, offset=transferred)
+                if progress:
+                    progress(transferred, size)
+            target_file.truncate(transferred)
+
+    return key, part_path
+
+
+def _put_attempt(connection, sftp, local_path, remote_path, progress, journal):
+    _sweep_expired_uploads(connection, sftp, journal)
+    local_stat = Path(local_path).stat()
+    size = int(local_stat.st_size)
+    mtime = int(local_stat.st_mtime)
+    part_path = remote_path + PART_SUFFIX
+    key = journal_key("put", connection.host, remote_path, local_path)
+
+    entry = journal.get(key)
+    offset = 0
+    if entry and entry.get("size") == size and entry.get("mtime") == mtime:
+        try:
+            offset = min(int(sftp.stat(part_path).st_size or 0), size)
+        except Exception:
+            offset = 0
+        # Pipelined writes can land out of order, so the tail of the part file is not trusted.
+        offset = max(0, offset - RESUME_UPLOAD_REWIND)
+
+    journal.update(key, force=True, size=size, mtime=mtime, offset=offset)
+    if progress:
+        progress(offset, size)
+
+    with open(local_path, "rb") as source_file:
+        source_file.seek(offset)
+        with sftp.open(part_path, "r+b" if offset else "wb") as target_file:
+            target_file.seek(offset)
+            target_file.set_pipelined(True)
+            transferred = offset
+            while True:
+                chunk = source_file.read(RESUME_CHUNK_SIZE)
+                if not chunk:
+                    break
+                target_file.write(chunk)
+                transferred += len(chunk)
+                journal.update(key, offset=transferred)
+                if progress:
+                    progress(transferred, size)
+            target_file.truncate(transferred)
+
+    return key, part_path
+
+
+def _with_resume(connection, attempt, message_callback=None):
+    attempts = 0
+    while True:
+        sftp = None
+        try:
+            sftp = connection.open_sftp()
+            return attempt(sftp)
+        except Exception:
+            if connection.is_connected() or attempts >= RESUME_MAX_ATTEMPTS:
+                raise
+            attempts += 1
+            if message_callback:
+                message_callback("Connection lost, waiting for MiSTer to resume the transfer...")
+            if not connection.wait_for_reconnect():
+                raise
+            if message_callback:
+                message_callback("Reconnected, resuming transfer...")
+        finally:
+            if sftp is not None:
+                sftp.close()
+
+
+def _remove_remote_part(connection, part_path):
+    try:
+        sftp = connection.open_sftp()
+    except Exception:
+        return
+    try:
+        sftp.remove(part_path)
+    except IOError:
+        pass
+    finally:
+        sftp.close()
+
+
+def resumable_get(connection, remote_path, local_path, progress_callback=None, message_callback=None, verify=True, journal=None):
+    journal = journal or _journal
+    local_path = Path(local_path)
+    local_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        key, part_path = _with_resume(
+            connection,
+            lambda sftp: _get_attempt(connection, sftp, remote_path, local_path, progress_callback, journal),
+            message_callback,
+        )
+    except Exception:
+        # Only a lost connection is worth resuming later; any other failure leaves a useless part.
+        if connection.is_connected():
+            Path(str(local_path) + PART_SUFFIX).unlink(missing_ok=True)
+            journal.remove(journal_key("get", connection.host, remote_path, local_path))
+        raise
+
+    try:
+        if verify:
+            verify_transfer(connection, remote_path, part_path, message_callback)
+    except Exception:
+        part_path.unlink(missing_ok=True)
+        journal.remove(key)
+        raise
+
+    part_path.replace(local_path)
+    journal.remove(key)
+    return str(local_path)
+
+
+def resumable_put(connection, local_path, remote_path, progress_callback=None, message_callback=None, verify=True, journal=None):
+    journal = journal or _journal
+
+    try:
+        key, part_path = _with_resume(
+            connection,
+            lambda sftp: _put_attempt(connection, sftp, local_path, remote_path, progress_callback, journal),
+            message_callback,
+        )
+    except Exception:
+        if connection.is_connected():
+            _remove_remote_part(connection, remote_path + PART_SUFFIX)
+            journal.remove(journal_key("put", connection.host, remote_path, local_path))
+        raise
+
+    def finish(sftp):
+        try:
+            if verify:
+                verify_transfer(connection, part_path, local_path, message_callback)
+        except Exception:
+            sftp.remove(part_path)
+            journal.remove(key)
+            raise
+        _replace_remote(sftp, part_path, remote_path)
+
+    _with_resume(connection, finish, message_callback)
+    journal.remove(key)
+    return remote_path
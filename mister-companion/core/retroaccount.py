@@ -40,7 +40,7 @@ def _write_remote_text(connection, path, text):
 
     _ensure_remote_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.file(path, "w") as f:
             f.write(text)
@@ -52,7 +52,7 @@ def _read_remote_text(connection, path):
     if not connection.is_connected():
         raise RuntimeError("Not connected")
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.file(path, "r") as f:
             return f.read().decode("utf-8", errors="ignore")
@@ -64,7 +64,7 @@ def _remote_exists(connection, path):
     if not connection.is_connected():
         raise RuntimeError("Not connected")
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         try:
             sftp.stat(path)
@@ -0,0 +1,191 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from core.app_paths import generated_path
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+OBJECTS_ROOT = generated_path("SaveManager", "objects")
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+HASH_CHUNK_SIZE = 1024 * 1024
+OBJECT_MODE = 0o444
+FICLONE = 0x40049409
+
+
+def object_path(digest):
+    return OBJECTS_ROOT / digest[:2] / digest
+
+
+def hash_file(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _seal_object(path):
+    # Every manifest that references an object shares it, so keep it read-only where unlink still works.
+    if os.name != "nt":
+        os.chmod(path, OBJECT_MODE)
+
+
+def _commit_object(temp_path, digest):
+    target = object_path(digest)
+    if target.exists():
+        os.remove(temp_path)
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    _seal_object(temp_path)
+    os.replace(temp_path, target)
+    return target
+
+
+def _reflink(source, target):
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+
+    with open(source, "rb") as source_handle, open(target, "wb") as target_handle:
+        try:
+            fcntl.ioctl(target_handle.fileno(), FICLONE, source_handle.fileno())
+        except OSError:
+            return False
+    return True
+
+
+def export_object(source, target):
+    # Objects never leave the store by hardlink: anything writing the exported file in place would
+    # rewrite every backup that references it. A copy-on-write clone is safe where the filesystem has one.
+    target = Path(target)
+    target.unlink(missing_ok=True)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if _reflink(source, target):
+            return True
+    except OSError:
+        pass
+    shutil.copyfile(source, target)
+    return False
+
+
+def store_file(path, move=False):
+    path = Path(path)
+    digest = hash_file(path)
+    target = object_path(digest)
+    if target.exists():
+        if move:
+            path.unlink()
+        return digest
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if move:
+        _seal_object(path)
+        os.replace(path, target)
+        return digest
+
+    handle, temp_path = tempfile.mkstemp(prefix=digest[:8] + ".", suffix=".tmp", dir=str(target.parent))
+    os.close(handle)
+    try:
+        shutil.copyfile(path, temp_path)
+        _commit_object(temp_path, digest)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return digest
+
+
+def manifest_path(device_root, backup_name):
+    return Path(device_root) / f"{backup_name}{MANIFEST_SUFFIX}"
+
+
+def is_manifest(path):
+    return Path(path).name.endswith(MANIFEST_SUFFIX) and Path(path).is_file()
+
+
+def backup_name_from_manifest(path):
+    return Path(path).name[:-len(MANIFEST_SUFFIX)]
+
+
+def load_manifest(path):
+    with open(path, "r", encoding="utf-8") as handle:
+        data = json.load(handle)
+    if not isinstance(data, dict) or not isinstance(data.get("files"), dict):
+        raise RuntimeError(f"Invalid backup manifest: {path}")
+    return data
+
+
+def write_manifest(path, files, **extra):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"version": MANIFEST_VERSION, "created": int(time.time()), **extra, "files": files}
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(json.dumps(data, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(temp_path, path)
+    return data
+
+
+def manifest_entry(digest, size, mtime):
+    return {"hash": digest, "size": int(size), "mtime": int(mtime or 0)}
+
+
+def referenced_objects(backup_root):
+    referenced = set()
+    backup_root = Path(backup_root)
+    if not backup_root.exists():
+        return referenced
+
+    for path in backup_root.glob(f"*/*{MANIFEST_SUFFIX}"):
+        try:
+            files = load_manifest(path)["files"]
+        except Exception:
+            # An unreadable manifest keeps the whole store alive rather than risk deleting live objects.
+            return None
+        referenced.update(entry.get("hash") for entry in files.values() if isinstance(entry, dict))
+
+    return referenced
+
+
+def collect_garbage(backup_root):
+    referenced = referenced_objects(backup_root)
+    if referenced is None or not OBJECTS_ROOT.exists():
+        return 0, 0
+
+    removed = 0
+    freed = 0
+    for bucket in OBJECTS_ROOT.iterdir():
+        if not bucket.is_dir():
+            continue
+        for item in bucket.iterdir():
+            if item.name in referenced:
+                continue
+            try:
+                size = item.stat().st_size
+                item.unlink()
+            except OSError:
+                continue
+            removed += 1
+            freed += size
+        try:
+            bucket.rmdir()
+        except OSError:
+            pass
+
+    return removed, freed
@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from core.app_paths import generated_path
+
+
+SYNC_STATE_PATH = generated_path("SaveManager", "sync_state.json")
+SYNC_STATE_VERSION = 1
+
+SYNC_DOWNLOAD = "download"
+SYNC_UPLOAD = "upload"
+SYNC_SKIP = "skip"
+SYNC_COMPARE = "compare"
+
+PREFER_LOCAL = "local"
+PREFER_REMOTE = "remote"
+
+
+def load_sync_state(path=SYNC_STATE_PATH):
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except Exception:
+        data = {}
+    if not isinstance(data, dict) or not isinstance(data.get("devices"), dict):
+        data = {"version": SYNC_STATE_VERSION, "devices": {}}
+    return data
+
+
+def save_sync_state(state, path=SYNC_STATE_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + ".tmp")
+    temp_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def device_sync_state(state, device_key):
+    device = state["devices"].setdefault(device_key, {})
+    device.setdefault("files", {})
+    device.setdefault("conflicts", {})
+    return device
+
+
+def get_sync_conflicts(device_key, path=SYNC_STATE_PATH):
+    device = load_sync_state(path)["devices"].get(device_key) or {}
+    conflicts = device.get("conflicts") or {}
+    return [{"path": relative, **entry} for relative, entry in sorted(conflicts.items())]
+
+
+def resolve_sync_conflict(device_key, relative, prefer, path=SYNC_STATE_PATH):
+    if prefer not in {PREFER_LOCAL, PREFER_REMOTE}:
+        raise ValueError(f"Unknown conflict resolution: {prefer}")
+
+    state = load_sync_state(path)
+    conflict = device_sync_state(state, device_key)["conflicts"].get(relative)
+    if conflict is None:
+        return False
+    conflict["prefer"] = prefer
+    save_sync_state(state, path)
+    return True
+
+
+def resolve_all_sync_conflicts(device_key, prefer, path=SYNC_STATE_PATH):
+    if prefer not in {PREFER_LOCAL, PREFER_REMOTE}:
+        raise ValueError(f"Unknown conflict resolution: {prefer}")
+
+    state = load_sync_state(path)
+    conflicts = device_sync_state(state, device_key)["conflicts"]
+    for conflict in conflicts.values():
+        conflict["prefer"] = prefer
+    save_sync_state(state, path)
+    return len(conflicts)
+
+
+def md5_file(path):
+    digest = hashlib.md5()
+    with open(path, "rb") as handle:
+        while True:
+            chunk = handle.read(1024 * 1024)
+            if not chunk:
+                break
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _stat_pair(value):
+    return [int(value[0]), int(value[1])] if value else None
+
+
+def classify_sync_path(base, local_stat, remote_stat, local_hash, prefer=None):
+    if local_stat is None:
+        return SYNC_DOWNLOAD
+    if remote_stat is None:
+        return SYNC_UPLOAD
+    if prefer == PREFER_LOCAL:
+        return SYNC_UPLOAD
+    if prefer == PREFER_REMOTE:
+        return SYNC_DOWNLOAD
+    if not base:
+        return SYNC_COMPARE
+
+    # Each side is only compared with its own previous stat, so clock skew between the PC and a
+    # MiSTer without an RTC cannot pick the wrong direction.
+    local_changed = _stat_pair(local_stat) != base.get("local") and local_hash() != base.get("hash")
+    remote_changed = _stat_pair(remote_stat) != base.get("remote")
+
+    if local_changed and remote_changed:
+        return SYNC_COMPARE
+    if local_changed:
+        return SYNC_UPLOAD
+    if remote_changed:
+        return SYNC_DOWNLOAD
+    return SYNC_SKIP
+
+
+def plan_sync(device, local_files, remote_files, local_path_for, remote_hashes):
+    files = device["files"]
+    conflicts = device["conflicts"]
+    local_hashes = {}
+
+    def local_hash(relative):
+        if relative not in local_hashes:
+            local_hashes[relative] = md5_file(local_path_for(relative))
+        return local_hashes[relative]
+
+    plan = {SYNC_DOWNLOAD: [], SYNC_UPLOAD: [], SYNC_SKIP: []}
+    compare = []
+
+    for relative in sorted(set(local_files) | set(remote_files)):
+        prefer = (conflicts.get(relative) or {}).get("prefer")
+        action = classify_sync_path(
+            files.get(relative),
+            local_files.get(relative),
+            remote_files.get(relative),
+            lambda relative=relative: local_hash(relative),
+            prefer,
+        )
+        if action == SYNC_COMPARE:
+            compare.append(relative)
+        else:
+            plan[action].append(relative)
+
+    new_conflicts = {}
+    if compare:
+        hashes = remote_hashes(compare)
+        for relative in compare:
+            if hashes.get(relative) and hashes[relative] == local_hash(relative):
+                plan[SYNC_SKIP].append(relative)
+            elif not files.get(relative):
+                # No merge has been recorded for this path yet (first run after upgrading), so keep
+                # the old newer-wins behaviour instead of asking about every differing file.
+                newer_remote = int(remote_files[relative][1]) > int(local_files[relative][1])
+                plan[SYNC_DOWNLOAD if newer_remote else SYNC_UPLOAD].append(relative)
+            else:
+                new_conflicts[relative] = {
+                    "detected": int(time.time()),
+                    "local": _stat_pair(local_files.get(relative)),
+                    "remote": _stat_pair(remote_files.get(relative)),
+                }
+
+    device["conflicts"] = new_conflicts
+    return plan, local_hashes
+
+
+def record_synced(device, relative, digest, local_stat, remote_stat):
+    device["files"][relative] = {
+        "hash": digest,
+        "local": _stat_pair(local_stat),
+        "remote": _stat_pair(remote_stat),
+    }
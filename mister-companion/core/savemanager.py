@@ -1,20 +1,50 @@
+import json
 import os
+import posixpath
+import shlex
 import shutil
-import stat
 import subprocess
 import sys
 import time
+import uuid
+import zipfile
 from pathlib import Path
 
 from core.config import save_config
 from core.app_paths import generated_path
 from core.open_helpers import open_local_folder
 from core.profile_folder_sync import get_profile_or_ip_folder_name
+from core.save_store import (
+    backup_name_from_manifest,
+    collect_garbage,
+    export_object,
+    is_manifest,
+    load_manifest,
+    manifest_entry,
+    manifest_path,
+    object_path,
+    store_file,
+    write_manifest,
+)
+from core.save_sync import (
+    SYNC_DOWNLOAD,
+    SYNC_SKIP,
+    SYNC_UPLOAD,
+    device_sync_state,
+    get_sync_conflicts,
+    load_sync_state,
+    md5_file,
+    plan_sync,
+    record_synced,
+    save_sync_state,
+)
+from core.sftp_transfer import download_files, upload_files
 
 
 SAVE_ROOT = generated_path("SaveManager")
 BACKUP_ROOT = SAVE_ROOT / "backups"
 SYNC_ROOT = SAVE_ROOT / "sync"
+STAGING_ROOT = SAVE_ROOT / "staging"
 
 REMOTE_SAVES_DIR = "/media/fat/saves"
 REMOTE_SAVESTATES_DIR = "/media/fat/savestates"
@@ -22,6 +52,19 @@ REMOTE_SAVESTATES_DIR = "/media/fat/savestates"
 LOCAL_SAVES_DIR = "saves"
 LOCAL_SAVESTATES_DIR = "savestates"
 
+BACKUP_SECTIONS = (
+    (LOCAL_SAVES_DIR, REMOTE_SAVES_DIR),
+    (LOCAL_SAVESTATES_DIR, REMOTE_SAVESTATES_DIR),
+)
+
+BACKUP_FORMAT_STORE = "store"
+BACKUP_FORMAT_ZIP = "zip"
+BACKUP_FORMATS = (BACKUP_FORMAT_STORE, BACKUP_FORMAT_ZIP)
+ARCHIVE_SUFFIX = ".zip"
+ARCHIVE_MANIFEST_NAME = ".manifest.json"
+ARCHIVE_CHUNK_SIZE = 1024 * 1024
+MD5_BATCH_LENGTH = 16000
+
 
 def ensure_savemanager_dirs():
     BACKUP_ROOT.mkdir(parents=True, exist_ok=True)
@@ -69,22 +112,31 @@ def get_device_backup_root(profile_name: str = "", ip_address: str = "") -> Path
     return BACKUP_ROOT / device_name
 
 
-def get_backup_count(profile_name: str = "", ip_address: str = "") -> int:
-    device_root = get_device_backup_root(profile_name, ip_address)
+def _backup_entries(device_root: Path):
     if not device_root.exists():
-        return 0
+        return {}
 
-    return len([p for p in device_root.iterdir() if p.is_dir()])
+    entries = {}
+    for path in device_root.iterdir():
+        if path.is_dir():
+            entries[path.name] = path
+        elif is_manifest(path):
+            entries[backup_name_from_manifest(path)] = path
+        elif path.suffix == ARCHIVE_SUFFIX and path.is_file():
+            entries[path.stem] = path
+    return entries
 
 
-def list_backups_for_device(profile_name: str = "", ip_address: str = ""):
-    device_root = get_device_backup_root(profile_name, ip_address)
-    if not device_root.exists():
-        return []
+def _list_backup_names(device_root: Path):
+    return sorted(_backup_entries(device_root), reverse=True)
+
+
+def get_backup_count(profile_name: str = "", ip_address: str = "") -> int:
+    return len(_backup_entries(get_device_backup_root(profile_name, ip_address)))
+
 
-    backups = [p.name for p in device_root.iterdir() if p.is_dir()]
-    backups.sort(reverse=True)
-    return backups
+def list_backups_for_device(profile_name: str = "", ip_address: str = ""):
+    return _list_backup_names(get_device_backup_root(profile_name, ip_address))
 
 
 def get_device_backup_root_by_name(device_name: str) -> Path:
@@ -101,30 +153,115 @@ def list_backup_devices():
 
     devices = []
     for device_root in sorted([p for p in BACKUP_ROOT.iterdir() if p.is_dir()], key=lambda p: p.name.lower()):
-        backups = [p.name for p in device_root.iterdir() if p.is_dir()]
-        backups.sort(reverse=True)
+        backups = _list_backup_names(device_root)
         if backups:
             devices.append({"name": device_root.name, "backups": backups})
 
     return devices
 
 
+def load_backup_files(device_root: Path, backup_name: str):
+    path = _backup_entries(device_root).get(backup_name)
+    if path is None:
+        raise RuntimeError("Selected backup was not found.")
+
+    if is_manifest(path):
+        files = {}
+        for relative, entry in load_manifest(path)["files"].items():
+            files[relative] = {**entry, "source": object_path(entry["hash"])}
+        return files
+
+    if path.suffix == ARCHIVE_SUFFIX:
+        return _load_archive_files(path)
+
+    files = {}
+    for section, _remote_dir in BACKUP_SECTIONS:
+        section_root = path / section
+        if not section_root.exists():
+            continue
+        for root, _dirs, names in os.walk(section_root):
+            for name in names:
+                source = Path(root) / name
+                info = source.stat()
+                relative = source.relative_to(path).as_posix()
+                files[relative] = {"size": info.st_size, "mtime": int(info.st_mtime), "source": source}
+    return files
+
+
+def _load_archive_files(path: Path):
+    files = {}
+    with zipfile.ZipFile(path) as archive:
+        try:
+            recorded = json.loads(archive.read(ARCHIVE_MANIFEST_NAME).decode("utf-8"))
+        except KeyError:
+            recorded = {}
+
+        for info in archive.infolist():
+            if info.is_dir() or info.filename == ARCHIVE_MANIFEST_NAME:
+                continue
+            mtime = recorded.get(info.filename, {}).get("mtime") or int(time.mktime(info.date_time + (0, 0, -1)))
+            files[info.filename] = {
+                "size": info.file_size,
+                "compressed_size": info.compress_size,
+                "mtime": int(mtime),
+                "archive": path,
+                "member": info.filename,
+            }
+    return files
+
+
+def list_backup_contents(device_name: str, backup_name: str):
+    files = load_backup_files(get_device_backup_root_by_name(device_name), backup_name)
+    return [
+        {"path": relative, "size": int(entry.get("size", 0)), "mtime": int(entry.get("mtime") or 0)}
+        for relative, entry in sorted(files.items())
+    ]
+
+
+def _open_backup_entry(entry, archives):
+    if not entry.get("archive"):
+        return open(entry["source"], "rb")
+
+    archive = archives.get(entry["archive"])
+    if archive is None:
+        archive = archives[entry["archive"]] = zipfile.ZipFile(entry["archive"])
+    return archive.open(entry["member"])
+
+
+def _close_archives(archives):
+    for archive in archives.values():
+        archive.close()
+    archives.clear()
+
+
+def _remove_backup(path: Path):
+    if path.is_dir():
+        shutil.rmtree(path, ignore_errors=True)
+    else:
+        path.unlink(missing_ok=True)
+
+
 def enforce_backup_retention(config_data, profile_name: str = "", ip_address: str = "", log_callback=None):
     retention = int(config_data.get("backup_retention", 10))
     if retention < 1:
         retention = 1
 
     device_root = get_device_backup_root(profile_name, ip_address)
-    if not device_root.exists():
-        return
-
-    backups = sorted([p for p in device_root.iterdir() if p.is_dir()], key=lambda p: p.name)
+    entries = _backup_entries(device_root)
+    backups = sorted(entries)
+    removed_manifest = False
 
     while len(backups) > retention:
         oldest = backups.pop(0)
-        shutil.rmtree(oldest, ignore_errors=True)
+        removed_manifest = removed_manifest or is_manifest(entries[oldest])
+        _remove_backup(entries[oldest])
         if log_callback:
-            log_callback(f"Old backup removed: {oldest.name}")
+            log_callback(f"Old backup removed: {oldest}")
+
+    if removed_manifest:
+        removed, freed = collect_garbage(BACKUP_ROOT)
+        if removed and log_callback:
+            log_callback(f"Removed {removed} unreferenced save objects ({freed // 1024} KB).")
 
 
 def save_retention_setting(config_data, value: int):
@@ -141,148 +278,248 @@ def save_retention_setting(config_data, value: int):
     return value
 
 
+def get_backup_format(config_data):
+    value = str(config_data.get("backup_format", BACKUP_FORMAT_STORE))
+    return value if value in BACKUP_FORMATS else BACKUP_FORMAT_STORE
+
+
+def save_backup_format_setting(config_data, value: str):
+    value = value if value in BACKUP_FORMATS else BACKUP_FORMAT_STORE
+    config_data["backup_format"] = value
+    save_config(config_data)
+    return value
+
+
 def open_folder(path: Path):
     path = Path(path).resolve()
     path.mkdir(parents=True, exist_ok=True)
     open_local_folder(path)
 
 
-def _download_dir(sftp, remote_dir: str, local_dir: Path):
-    local_dir.mkdir(parents=True, exist_ok=True)
+def _replace_file(source: Path, target: Path, mtime):
+    target.unlink(missing_ok=True)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(source, target)
+    if mtime:
+        os.utime(target, (mtime, mtime))
 
-    for item in sftp.listdir_attr(remote_dir):
-        remote_path = f"{remote_dir}/{item.filename}"
-        local_path = local_dir / item.filename
 
-        if stat.S_ISDIR(item.st_mode):
-            _download_dir(sftp, remote_path, local_path)
-        else:
-            sftp.get(remote_path, str(local_path))
+def _write_backup_entry(entry, target: Path, archives):
+    target.unlink(missing_ok=True)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with _open_backup_entry(entry, archives) as source, open(target, "wb") as handle:
+        shutil.copyfileobj(source, handle, ARCHIVE_CHUNK_SIZE)
+    mtime = int(entry.get("mtime") or 0)
+    if mtime:
+        os.utime(target, (mtime, mtime))
 
 
-def _upload_dir(connection, sftp, local_dir: Path, remote_dir: str):
-    if not local_dir.exists():
-        return
+def _place_sync_file(entry, target: Path, archives):
+    if entry.get("archive"):
+        _write_backup_entry(entry, target, archives)
+        return False
 
-    try:
-        connection.run_command(f'mkdir -p "{remote_dir}"')
-    except Exception:
-        pass
+    cloned = export_object(entry["source"], target)
+    mtime = int(entry.get("mtime") or 0)
+    if mtime:
+        os.utime(target, (mtime, mtime))
+    return cloned
 
-    for item in local_dir.iterdir():
-        remote_path = f"{remote_dir}/{item.name}"
 
-        if item.is_dir():
-            _upload_dir(connection, sftp, item, remote_path)
-        else:
-            sftp.put(str(item), remote_path)
+def _scan_sync_files(links=None):
+    existing = {}
+    for section, _remote_dir in BACKUP_SECTIONS:
+        for root, _dirs, names in os.walk(SYNC_ROOT / section):
+            for name in names:
+                path = Path(root) / name
+                try:
+                    info = path.stat()
+                except OSError:
+                    continue
+                relative = path.relative_to(SYNC_ROOT).as_posix()
+                existing[relative] = (int(info.st_size), int(info.st_mtime))
+                if links is not None and info.st_nlink > 1:
+                    links.add(relative)
+    return existing
 
 
-def _copy_dir(source_dir: Path, target_dir: Path):
-    if not source_dir.exists():
-        target_dir.mkdir(parents=True, exist_ok=True)
-        return
+def _prune_empty_dirs(root: Path):
+    for current, dirs, files in os.walk(root, topdown=False):
+        if Path(current) != root and not dirs and not files:
+            try:
+                os.rmdir(current)
+            except OSError:
+                pass
 
-    target_dir.mkdir(parents=True, exist_ok=True)
 
-    for item in source_dir.iterdir():
-        target_path = target_dir / item.name
+def rebuild_sync_folder_from_latest_backups(log_callback=None):
+    started = time.monotonic()
+    ensure_savemanager_dirs()
 
-        if item.is_dir():
-            _copy_dir(item, target_path)
-        else:
-            target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(item, target_path)
+    for section, _remote_dir in BACKUP_SECTIONS:
+        (SYNC_ROOT / section).mkdir(parents=True, exist_ok=True)
 
+    newest = {}
+    device_folders = sorted([p for p in BACKUP_ROOT.iterdir() if p.is_dir()], key=lambda p: p.name.lower())
 
-def _merge_remote_newer_into_local(sftp, remote_dir: str, local_dir: Path):
-    local_dir.mkdir(parents=True, exist_ok=True)
+    for device_folder in device_folders:
+        backups = _list_backup_names(device_folder)
 
-    for item in sftp.listdir_attr(remote_dir):
-        remote_path = f"{remote_dir}/{item.filename}"
-        local_path = local_dir / item.filename
+        if not backups:
+            continue
 
-        if stat.S_ISDIR(item.st_mode):
-            _merge_remote_newer_into_local(sftp, remote_path, local_path)
-        else:
-            remote_time = item.st_mtime
+        latest_backup = backups[0]
 
-            if local_path.exists():
-                try:
-                    local_time = local_path.stat().st_mtime
-                except Exception:
-                    local_time = 0
+        if log_callback:
+            log_callback(f"Merging latest backup from {device_folder.name}: {latest_backup}")
+
+        for relative, entry in load_backup_files(device_folder, latest_backup).items():
+            current = newest.get(relative)
+            if current is None or int(entry.get("mtime") or 0) > int(current.get("mtime") or 0):
+                newest[relative] = entry
+
+    # The merge folder's own size and mtime record what the previous rebuild placed there.
+    # Older versions hardlinked merge folder files into the store, so those are always replaced.
+    links = set()
+    existing = _scan_sync_files(links)
+    removed = 0
+    updated = 0
+    cloned = 0
+
+    for relative in set(existing) - set(newest):
+        (SYNC_ROOT / Path(*relative.split("/"))).unlink(missing_ok=True)
+        removed += 1
+
+    archives = {}
+    try:
+        for relative, entry in newest.items():
+            if relative not in links and existing.get(relative) == (int(entry["size"]), int(entry.get("mtime") or 0)):
+                continue
+            if _place_sync_file(entry, SYNC_ROOT / Path(*relative.split("/")), archives):
+                cloned += 1
+            updated += 1
+    finally:
+        _close_archives(archives)
 
-                if remote_time > local_time:
-                    sftp.get(remote_path, str(local_path))
-            else:
-                sftp.get(remote_path, str(local_path))
+    for section, _remote_dir in BACKUP_SECTIONS:
+        _prune_empty_dirs(SYNC_ROOT / section)
 
+    if log_callback:
+        log_callback(
+            f"Merge folder rebuilt in {time.monotonic() - started:.2f}s: "
+            f"{updated} updated ({cloned} reflinked), {removed} removed, "
+            f"{len(newest) - updated} unchanged."
+        )
 
-def _merge_local_dir_newer_into_local(source_dir: Path, target_dir: Path):
-    if not source_dir.exists():
-        return
 
-    target_dir.mkdir(parents=True, exist_ok=True)
+def _new_backup_name(device_root: Path):
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
+    if timestamp not in _backup_entries(device_root):
+        return timestamp
+    index = 2
+    while f"{timestamp}_{index}" in _backup_entries(device_root):
+        index += 1
+    return f"{timestamp}_{index}"
 
-    for item in source_dir.iterdir():
-        target_path = target_dir / item.name
 
-        if item.is_dir():
-            _merge_local_dir_newer_into_local(item, target_path)
-        else:
-            source_time = item.stat().st_mtime
+def _zip_date_time(mtime):
+    return time.localtime(max(int(mtime or 0), 315532800))[:6]
 
-            if target_path.exists():
-                try:
-                    target_time = target_path.stat().st_mtime
-                except Exception:
-                    target_time = 0
 
-                if source_time > target_time:
-                    shutil.copy2(item, target_path)
-            else:
-                shutil.copy2(item, target_path)
+def _write_backup_archive(archive_path: Path, items, log_callback=None):
+    temp_path = archive_path.with_name(archive_path.name + ".tmp")
+    recorded = {}
+    total = 0
 
+    try:
+        with zipfile.ZipFile(temp_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6, allowZip64=True) as archive:
+            for relative, size, mtime, opener in items:
+                info = zipfile.ZipInfo(relative, date_time=_zip_date_time(mtime))
+                info.compress_type = zipfile.ZIP_DEFLATED
+                with opener() as source, archive.open(info, "w", force_zip64=size > 0x7FFFFFFF) as target:
+                    shutil.copyfileobj(source, target, ARCHIVE_CHUNK_SIZE)
+                recorded[relative] = {"size": int(size), "mtime": int(mtime or 0)}
+                total += int(size)
+            archive.writestr(ARCHIVE_MANIFEST_NAME, json.dumps(recorded, indent=2, sort_keys=True))
+        os.replace(temp_path, archive_path)
+    except Exception:
+        temp_path.unlink(missing_ok=True)
+        raise
 
-def rebuild_sync_folder_from_latest_backups(log_callback=None):
-    ensure_savemanager_dirs()
+    if log_callback:
+        compressed = archive_path.stat().st_size
+        log_callback(
+            f"Backup archive written: {archive_path.name} "
+            f"({len(recorded)} files, {total // 1024} KB -> {compressed // 1024} KB)"
+        )
+    return recorded
 
-    sync_saves_path = SYNC_ROOT / "saves"
-    sync_savestates_path = SYNC_ROOT / "savestates"
 
-    if sync_saves_path.exists():
-        shutil.rmtree(sync_saves_path, ignore_errors=True)
-    if sync_savestates_path.exists():
-        shutil.rmtree(sync_savestates_path, ignore_errors=True)
+def _finish_backup(config_data, device_root: Path, backup_name: str, files, profile_name, ip_address, log_callback, archived=False):
+    if archived:
+        backup_path = device_root / f"{backup_name}{ARCHIVE_SUFFIX}"
+    else:
+        backup_path = manifest_path(device_root, backup_name)
+        write_manifest(backup_path, files, device=device_root.name)
 
-    sync_saves_path.mkdir(parents=True, exist_ok=True)
-    sync_savestates_path.mkdir(parents=True, exist_ok=True)
+    if log_callback:
+        total = sum(entry["size"] for entry in files.values())
+        log_callback(f"Backup created: {backup_name} ({len(files)} files, {total // 1024} KB)")
 
-    if not BACKUP_ROOT.exists():
-        return
+    enforce_backup_retention(config_data, profile_name, ip_address, log_callback=log_callback)
 
-    device_folders = sorted([p for p in BACKUP_ROOT.iterdir() if p.is_dir()], key=lambda p: p.name.lower())
+    if log_callback:
+        log_callback("Rebuilding merge folder from latest backups...")
 
-    for device_folder in device_folders:
-        backups = sorted(
-            [p for p in device_folder.iterdir() if p.is_dir()],
-            key=lambda p: p.name,
-            reverse=True,
-        )
+    rebuild_sync_folder_from_latest_backups(log_callback=log_callback)
 
-        if not backups:
-            continue
+    return backup_path
 
-        latest_backup = backups[0]
-        latest_saves = latest_backup / "saves"
-        latest_savestates = latest_backup / "savestates"
 
-        if log_callback:
-            log_callback(f"Merging latest backup from {device_folder.name}: {latest_backup.name}")
+def _previous_backup_files(device_root: Path):
+    backups = _list_backup_names(device_root)
+    if not backups:
+        return {}
+    try:
+        return load_backup_files(device_root, backups[0])
+    except Exception:
+        return {}
+
+
+def _reuse_previous_entry(previous, relative, size, mtime):
+    entry = previous.get(relative)
+    if not entry or int(entry.get("size", -1)) != int(size) or int(entry.get("mtime") or 0) != int(mtime or 0):
+        return None
 
-        _merge_local_dir_newer_into_local(latest_saves, sync_saves_path)
-        _merge_local_dir_newer_into_local(latest_savestates, sync_savestates_path)
+    digest = entry.get("hash")
+    if not digest and not entry.get("source"):
+        return None
+    if not digest:
+        # Files from folder-style backups are pulled into the store the first time they are reused.
+        digest = store_file(entry["source"])
+    return manifest_entry(digest, size, mtime)
+
+
+def build_remote_manifest_command():
+    sections = " ".join(section for section, _remote_dir in BACKUP_SECTIONS)
+    return (
+        f"cd /media/fat && "
+        f"{{ find {sections} -type f -exec stat -c '%s %Y %n' {{}} + 2>/dev/null "
+        f"|| find {sections} -type f 2>/dev/null | while IFS= read -r f; do stat -c '%s %Y %n' \"$f\"; done; }}"
+    )
+
+
+def parse_remote_manifest(output):
+    remote = {}
+    for line in (output or "").splitlines():
+        fields = line.split(" ", 2)
+        if len(fields) != 3 or not fields[0].isdigit() or not fields[1].isdigit():
+            continue
+        relative = posixpath.normpath(fields[2])
+        if relative.split("/", 1)[0] not in dict(BACKUP_SECTIONS):
+            continue
+        remote[relative] = (int(fields[0]), int(fields[1]))
+    return remote
 
 
 def create_backup(connection, config_data, profile_name: str = "", ip_address: str = "", log_callback=None):
@@ -293,34 +530,63 @@ def create_backup(connection, config_data, profile_name: str = "", ip_address: s
     if not device_root.name:
         raise RuntimeError("No device name or IP available.")
 
-    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-    backup_path = device_root / timestamp
-    saves_path = backup_path / "saves"
-    savestates_path = backup_path / "savestates"
-
-    backup_path.mkdir(parents=True, exist_ok=True)
+    backup_name = _new_backup_name(device_root)
+    previous = _previous_backup_files(device_root)
+    staging = STAGING_ROOT / uuid.uuid4().hex
 
     if log_callback:
         log_callback("Starting backup...")
 
-    sftp = connection.client.open_sftp()
-    try:
-        _download_dir(sftp, REMOTE_SAVES_DIR, saves_path)
-        _download_dir(sftp, REMOTE_SAVESTATES_DIR, savestates_path)
-    finally:
-        sftp.close()
+    remote = parse_remote_manifest(connection.run_command(build_remote_manifest_command()))
+    remote_roots = dict(BACKUP_SECTIONS)
+
+    if get_backup_format(config_data) == BACKUP_FORMAT_ZIP:
+        device_root.mkdir(parents=True, exist_ok=True)
+        sftp = connection.open_sftp()
+        try:
+            def remote_opener(remote_path, size):
+                def opener():
+                    handle = sftp.open(remote_path, "rb")
+                    if size:
+                        handle.prefetch(size)
+                    return handle
+                return opener
+
+            items = []
+            for relative, (size, mtime) in sorted(remote.items()):
+                section, _, rest = relative.partition("/")
+                items.append((relative, size, mtime, remote_opener(posixpath.join(remote_roots[section], rest), size)))
+
+            files = _write_backup_archive(device_root / f"{backup_name}{ARCHIVE_SUFFIX}", items, log_callback)
+        finally:
+            sftp.close()
+
+        return _finish_backup(config_data, device_root, backup_name, files, profile_name, ip_address, log_callback, archived=True)
+
+    files = {}
+    jobs = []
+    for relative, (size, mtime) in sorted(remote.items()):
+        entry = _reuse_previous_entry(previous, relative, size, mtime)
+        if entry is not None:
+            files[relative] = entry
+            continue
+        section, _, rest = relative.partition("/")
+        local_path = staging / Path(*relative.split("/"))
+        jobs.append((posixpath.join(remote_roots[section], rest), str(local_path), size))
 
     if log_callback:
-        log_callback(f"Backup created: {backup_path}")
-
-    enforce_backup_retention(config_data, profile_name, ip_address, log_callback=log_callback)
+        log_callback(f"{len(jobs)} of {len(remote)} files are new or changed since the last backup.")
 
-    if log_callback:
-        log_callback("Rebuilding merge folder from latest backups...")
+    try:
+        download_files(connection, jobs, directories={Path(local_path).parent for _r, local_path, _s in jobs})
 
-    rebuild_sync_folder_from_latest_backups(log_callback=log_callback)
+        for remote_path, local_path, size in jobs:
+            relative = Path(local_path).relative_to(staging).as_posix()
+            files[relative] = manifest_entry(store_file(local_path, move=True), size, remote[relative][1])
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
 
-    return backup_path
+    return _finish_backup(config_data, device_root, backup_name, files, profile_name, ip_address, log_callback)
 
 
 def create_backup_local(sd_root, config_data, profile_name: str = "", ip_address: str = "", log_callback=None):
@@ -332,91 +598,127 @@ def create_backup_local(sd_root, config_data, profile_name: str = "", ip_address
     if not device_root.name:
         raise RuntimeError("No device name available.")
 
-    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
-    backup_path = device_root / timestamp
-    saves_path = backup_path / "saves"
-    savestates_path = backup_path / "savestates"
-
-    backup_path.mkdir(parents=True, exist_ok=True)
+    backup_name = _new_backup_name(device_root)
+    previous = _previous_backup_files(device_root)
 
     if log_callback:
         log_callback("Starting offline backup...")
 
-    _copy_dir(sd_root / LOCAL_SAVES_DIR, saves_path)
-    _copy_dir(sd_root / LOCAL_SAVESTATES_DIR, savestates_path)
+    if get_backup_format(config_data) == BACKUP_FORMAT_ZIP:
+        device_root.mkdir(parents=True, exist_ok=True)
+        items = []
+        for section, _remote_dir in BACKUP_SECTIONS:
+            for root, _dirs, names in os.walk(sd_root / section):
+                for name in sorted(names):
+                    source = Path(root) / name
+                    info = source.stat()
+                    items.append(
+                        (source.relative_to(sd_root).as_posix(), info.st_size, int(info.st_mtime), lambda source=source: open(source, "rb"))
+                    )
+
+        files = _write_backup_archive(device_root / f"{backup_name}{ARCHIVE_SUFFIX}", items, log_callback)
+        return _finish_backup(config_data, device_root, backup_name, files, profile_name, ip_address, log_callback, archived=True)
+
+    files = {}
+    changed = 0
+    for section, _remote_dir in BACKUP_SECTIONS:
+        for root, _dirs, names in os.walk(sd_root / section):
+            for name in names:
+                source = Path(root) / name
+                info = source.stat()
+                relative = source.relative_to(sd_root).as_posix()
+                entry = _reuse_previous_entry(previous, relative, info.st_size, int(info.st_mtime))
+                if entry is None:
+                    changed += 1
+                    entry = manifest_entry(store_file(source), info.st_size, info.st_mtime)
+                files[relative] = entry
 
     if log_callback:
-        log_callback(f"Backup created: {backup_path}")
-
-    enforce_backup_retention(config_data, profile_name, ip_address, log_callback=log_callback)
+        log_callback(f"{changed} of {len(files)} files are new or changed since the last backup.")
 
-    if log_callback:
-        log_callback("Rebuilding merge folder from latest backups...")
+    return _finish_backup(config_data, device_root, backup_name, files, profile_name, ip_address, log_callback)
 
-    rebuild_sync_folder_from_latest_backups(log_callback=log_callback)
 
-    return backup_path
+def _restore_device_root(profile_name, ip_address, source_device_name):
+    if source_device_name:
+        return get_device_backup_root_by_name(source_device_name)
+    return get_device_backup_root(profile_name, ip_address)
 
 
 def restore_backup(connection, backup_name: str, profile_name: str = "", ip_address: str = "", source_device_name: str = "", log_callback=None):
     ensure_remote_save_dirs(connection, log_callback=log_callback)
 
-    if source_device_name:
-        device_root = get_device_backup_root_by_name(source_device_name)
-    else:
-        device_root = get_device_backup_root(profile_name, ip_address)
-    backup_path = device_root / backup_name
+    device_root = _restore_device_root(profile_name, ip_address, source_device_name)
+    files = load_backup_files(device_root, backup_name)
 
-    if not backup_path.exists():
-        raise RuntimeError("Selected backup was not found.")
+    if log_callback:
+        log_callback(f"Restoring backup from {device_root.name}: {backup_name}")
+
+    remote_roots = dict(BACKUP_SECTIONS)
+    directories = []
+    jobs = []
+    archived = []
+    for relative, entry in sorted(files.items()):
+        section, _, rest = relative.partition("/")
+        remote_path = posixpath.join(remote_roots[section], rest)
+        directories.append(posixpath.dirname(remote_path))
+        if entry.get("archive"):
+            archived.append((entry, remote_path))
+        else:
+            jobs.append((str(entry["source"]), remote_path, int(entry["size"])))
+
+    upload_files(connection, jobs, directories=directories)
 
-    saves_path = backup_path / "saves"
-    savestates_path = backup_path / "savestates"
+    if archived:
+        _upload_archive_entries(connection, archived)
 
     if log_callback:
-        log_callback(f"Restoring backup from {device_root.name}: {backup_name}")
+        log_callback("Restore completed successfully.")
+
 
-    sftp = connection.client.open_sftp()
+def _upload_archive_entries(connection, archived):
+    archives = {}
+    sftp = connection.open_sftp()
     try:
-        _upload_dir(connection, sftp, saves_path, REMOTE_SAVES_DIR)
-        _upload_dir(connection, sftp, savestates_path, REMOTE_SAVESTATES_DIR)
+        for entry, remote_path in archived:
+            with _open_backup_entry(entry, archives) as source, sftp.open(remote_path, "wb") as target:
+                target.set_pipelined(True)
+                shutil.copyfileobj(source, target, ARCHIVE_CHUNK_SIZE)
+            if entry.get("mtime"):
+                sftp.utime(remote_path, (entry["mtime"], entry["mtime"]))
     finally:
         sftp.close()
-
-    if log_callback:
-        log_callback("Restore completed successfully.")
+        _close_archives(archives)
 
 
 def restore_backup_local(sd_root, backup_name: str, profile_name: str = "", ip_address: str = "", source_device_name: str = "", log_callback=None):
     ensure_local_save_dirs(sd_root, log_callback=log_callback)
 
     sd_root = Path(sd_root)
-    if source_device_name:
-        device_root = get_device_backup_root_by_name(source_device_name)
-    else:
-        device_root = get_device_backup_root(profile_name, ip_address)
-    backup_path = device_root / backup_name
-
-    if not backup_path.exists():
-        raise RuntimeError("Selected backup was not found.")
-
-    saves_path = backup_path / "saves"
-    savestates_path = backup_path / "savestates"
+    device_root = _restore_device_root(profile_name, ip_address, source_device_name)
+    files = load_backup_files(device_root, backup_name)
 
     if log_callback:
         log_callback(f"Restoring backup from {device_root.name}: {backup_name}")
 
-    _copy_dir(saves_path, sd_root / LOCAL_SAVES_DIR)
-    _copy_dir(savestates_path, sd_root / LOCAL_SAVESTATES_DIR)
+    archives = {}
+    try:
+        for relative, entry in sorted(files.items()):
+            _write_backup_entry(entry, sd_root / Path(*relative.split("/")), archives)
+    finally:
+        _close_archives(archives)
 
     if log_callback:
         log_callback("Restore completed successfully.")
 
 
-def sync_saves(connection, log_callback=None):
-    ensure_savemanager_dirs()
-    ensure_remote_save_dirs(connection, log_callback=log_callback)
+def get_sync_device_key(profile_name: str = "", ip_address: str = "", sd_root=None):
+    if sd_root is not None:
+        return "sd:" + str(Path(sd_root).resolve())
+    return get_device_folder_name(profile_name, ip_address) or str(ip_address or "")
+
 
+def _prepare_sync_folder(log_callback=None):
     sync_saves_path = SYNC_ROOT / "saves"
     sync_savestates_path = SYNC_ROOT / "savestates"
 
@@ -425,51 +727,180 @@ def sync_saves(connection, log_callback=None):
             log_callback("Merge folder missing, rebuilding from latest backups...")
         rebuild_sync_folder_from_latest_backups(log_callback=log_callback)
 
+
+def _sync_path(relative):
+    return SYNC_ROOT / Path(*relative.split("/"))
+
+
+def _remote_save_path(relative):
+    section, _, rest = relative.partition("/")
+    return posixpath.join(dict(BACKUP_SECTIONS)[section], rest)
+
+
+def _remote_md5(connection, relatives):
+    hashes = {}
+    batch = []
+    length = 0
+
+    def run(batch):
+        output = connection.run_command(
+            "cd /media/fat && md5sum " + " ".join(shlex.quote(relative) for relative in batch) + " 2>/dev/null"
+        )
+        for line in (output or "").splitlines():
+            fields = line.split(None, 1)
+            if len(fields) == 2 and len(fields[0]) == 32:
+                hashes[fields[1].strip()] = fields[0].lower()
+
+    for relative in relatives:
+        if batch and length + len(relative) > MD5_BATCH_LENGTH:
+            run(batch)
+            batch = []
+            length = 0
+        batch.append(relative)
+        length += len(relative) + 3
+
+    if batch:
+        run(batch)
+    return hashes
+
+
+def _run_sync(device_key, local_files, remote_files, remote_hashes, transfer, relist, log_callback=None):
+    state = load_sync_state()
+    device = device_sync_state(state, device_key)
+    plan, local_hashes = plan_sync(device, local_files, remote_files, _sync_path, remote_hashes)
+
+    downloads = plan[SYNC_DOWNLOAD]
+    uploads = plan[SYNC_UPLOAD]
+    conflicts = sorted(device["conflicts"])
+
     if log_callback:
-        log_callback("Downloading newest saves from MiSTer...")
+        log_callback(
+            f"Sync plan: {len(downloads)} to merge folder, {len(uploads)} to device, "
+            f"{len(plan[SYNC_SKIP])} unchanged, {len(conflicts)} conflicts."
+        )
 
-    sftp = connection.client.open_sftp()
-    try:
-        _merge_remote_newer_into_local(sftp, REMOTE_SAVES_DIR, sync_saves_path)
-        _merge_remote_newer_into_local(sftp, REMOTE_SAVESTATES_DIR, sync_savestates_path)
+    transfer(downloads, uploads)
+    if uploads:
+        remote_files = relist()
+
+    downloaded = set(downloads)
+    for relative in downloads + uploads + plan[SYNC_SKIP]:
+        local_path = _sync_path(relative)
+        info = local_path.stat()
+        base = device["files"].get(relative) or {}
+        if relative in downloaded:
+            digest = md5_file(local_path)
+        else:
+            digest = local_hashes.get(relative) or base.get("hash") or md5_file(local_path)
+        record_synced(device, relative, digest, (info.st_size, info.st_mtime), remote_files.get(relative))
 
-        if log_callback:
-            log_callback("Uploading newest saves to MiSTer...")
+    known = set(local_files) | set(remote_files)
+    for relative in list(device["files"]):
+        if relative not in known:
+            del device["files"][relative]
 
-        _upload_dir(connection, sftp, sync_saves_path, REMOTE_SAVES_DIR)
-        _upload_dir(connection, sftp, sync_savestates_path, REMOTE_SAVESTATES_DIR)
-    finally:
-        sftp.close()
+    save_sync_state(state)
 
     if log_callback:
-        log_callback("Merge completed successfully.")
+        for relative in conflicts:
+            log_callback(f"Conflict: {relative} changed on both sides, left untouched.")
 
+    return {
+        "downloaded": len(downloads),
+        "uploaded": len(uploads),
+        "unchanged": len(plan[SYNC_SKIP]),
+        "conflicts": get_sync_conflicts(device_key),
+    }
 
-def sync_saves_local(sd_root, log_callback=None):
+
+def sync_saves(connection, profile_name: str = "", ip_address: str = "", log_callback=None):
     ensure_savemanager_dirs()
-    ensure_local_save_dirs(sd_root, log_callback=log_callback)
+    ensure_remote_save_dirs(connection, log_callback=log_callback)
+    _prepare_sync_folder(log_callback)
 
-    sd_root = Path(sd_root)
+    if log_callback:
+        log_callback("Comparing merge folder with MiSTer...")
 
-    sync_saves_path = SYNC_ROOT / "saves"
-    sync_savestates_path = SYNC_ROOT / "savestates"
+    def relist():
+        return parse_remote_manifest(connection.run_command(build_remote_manifest_command()))
 
-    if not sync_saves_path.exists() or not sync_savestates_path.exists():
-        if log_callback:
-            log_callback("Merge folder missing, rebuilding from latest backups...")
-        rebuild_sync_folder_from_latest_backups(log_callback=log_callback)
+    remote_files = relist()
 
-    if log_callback:
-        log_callback("Merging newest saves from local SD Card...")
+    def transfer(downloads, uploads):
+        for relative in downloads:
+            # Merge folder files from older versions may still be hardlinks into the backup store.
+            _sync_path(relative).unlink(missing_ok=True)
+
+        download_files(
+            connection,
+            [(_remote_save_path(relative), str(_sync_path(relative)), remote_files[relative][0]) for relative in downloads],
+            directories={_sync_path(relative).parent for relative in downloads},
+        )
+        for relative in downloads:
+            mtime = remote_files[relative][1]
+            os.utime(_sync_path(relative), (mtime, mtime))
+
+        upload_files(
+            connection,
+            [(str(_sync_path(relative)), _remote_save_path(relative), _sync_path(relative).stat().st_size) for relative in uploads],
+            directories={posixpath.dirname(_remote_save_path(relative)) for relative in uploads},
+        )
 
-    _merge_local_dir_newer_into_local(sd_root / LOCAL_SAVES_DIR, sync_saves_path)
-    _merge_local_dir_newer_into_local(sd_root / LOCAL_SAVESTATES_DIR, sync_savestates_path)
+    result = _run_sync(
+        get_sync_device_key(profile_name, ip_address or connection.host),
+        _scan_sync_files(),
+        remote_files,
+        lambda relatives: _remote_md5(connection, relatives),
+        transfer,
+        relist,
+        log_callback,
+    )
 
     if log_callback:
-        log_callback("Writing newest saves to local SD Card...")
+        log_callback("Merge completed successfully.")
+    return result
 
-    _merge_local_dir_newer_into_local(sync_saves_path, sd_root / LOCAL_SAVES_DIR)
-    _merge_local_dir_newer_into_local(sync_savestates_path, sd_root / LOCAL_SAVESTATES_DIR)
+
+def _scan_local_save_files(sd_root: Path):
+    files = {}
+    for section, _remote_dir in BACKUP_SECTIONS:
+        for root, _dirs, names in os.walk(sd_root / section):
+            for name in names:
+                path = Path(root) / name
+                info = path.stat()
+                files[path.relative_to(sd_root).as_posix()] = (int(info.st_size), int(info.st_mtime))
+    return files
+
+
+def sync_saves_local(sd_root, log_callback=None):
+    ensure_savemanager_dirs()
+    ensure_local_save_dirs(sd_root, log_callback=log_callback)
+    _prepare_sync_folder(log_callback)
+
+    sd_root = Path(sd_root)
 
     if log_callback:
-        log_callback("Merge completed successfully.")
\ No newline at end of file
+        log_callback("Comparing merge folder with local SD Card...")
+
+    def sd_path(relative):
+        return sd_root / Path(*relative.split("/"))
+
+    def transfer(downloads, uploads):
+        for relative in downloads:
+            _replace_file(sd_path(relative), _sync_path(relative), int(sd_path(relative).stat().st_mtime))
+        for relative in uploads:
+            _replace_file(_sync_path(relative), sd_path(relative), int(_sync_path(relative).stat().st_mtime))
+
+    result = _run_sync(
+        get_sync_device_key(sd_root=sd_root),
+        _scan_sync_files(),
+        _scan_local_save_files(sd_root),
+        lambda relatives: {relative: md5_file(sd_path(relative)) for relative in relatives},
+        transfer,
+        lambda: _scan_local_save_files(sd_root),
+        log_callback,
+    )
+
+    if log_callback:
+        log_callback("Merge completed successfully.")
+    return result
@@ -25,7 +25,7 @@ def install_cd_game_organizer(connection, log):
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(CD_GAME_ORGANIZER_SCRIPT_PATH, "wb") as remote_file:
             remote_file.write(script_data)
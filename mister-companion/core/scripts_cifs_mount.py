@@ -128,7 +128,7 @@ def install_cifs_mount(connection, log):
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(CIFS_MOUNT_SCRIPT_PATH, "wb") as remote_file:
             remote_file.write(mount_script)
@@ -247,7 +247,7 @@ def save_cifs_config(
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(CIFS_CONFIG_PATH, "w") as remote_file:
             remote_file.write(ini)
@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 from core.open_helpers import open_local_folder, open_smb_share
+from core.remote_probe import PROBE_FILE, build_probe_command, parse_probe_output, probe_local
 
 
 UPDATE_ALL_JSON_PATH = "/media/fat/Scripts/.config/update_all/update_all.json"
@@ -37,6 +38,34 @@ STATIC_WALLPAPER_TARGET_JPG = "/media/fat/menu.jpg"
 STATIC_WALLPAPER_TARGET_PNG = "/media/fat/menu.png"
 MISTER_MENU_RELOAD_CMD = 'echo "load_core /media/fat/menu.rbf" > /dev/MiSTer_cmd'
 
+STATIC_WALLPAPER_PROBE_PATHS = (
+    STATIC_WALLPAPER_SCRIPT_PATH,
+    STATIC_WALLPAPER_CONFIG_PATH,
+    STATIC_WALLPAPER_TARGET_JPG,
+    STATIC_WALLPAPER_TARGET_PNG,
+)
+
+SCRIPTS_STATUS_CHECKS = (
+    ("update_all_installed", "/media/fat/Scripts/update_all.sh"),
+    ("update_all_initialized", UPDATE_ALL_JSON_PATH),
+    ("zaparoo_installed", "/media/fat/Scripts/zaparoo.sh"),
+    ("migrate_sd_installed", "/media/fat/Scripts/migrate_sd.sh"),
+    ("cifs_installed", CIFS_MOUNT_SCRIPT_PATH),
+    ("cifs_umount_installed", CIFS_UMOUNT_SCRIPT_PATH),
+    ("cifs_configured", "/media/fat/Scripts/cifs_mount.ini"),
+    ("cifs_common_installed", CIFS_COMMON_SCRIPT_PATH),
+    ("auto_time_installed", "/media/fat/Scripts/auto_time.sh"),
+    ("cd_game_organizer_installed", "/media/fat/Scripts/cd_game_organizer.sh"),
+    ("dav_browser_installed", "/media/fat/Scripts/dav_browser.sh"),
+    ("dav_browser_configured", DAV_BROWSER_CONFIG_PATH),
+    ("ftp_save_sync_installed", "/media/fat/Scripts/ftp_save_sync.sh"),
+    ("ftp_save_sync_configured", FTP_SAVE_SYNC_CONFIG_PATH),
+    ("static_wallpaper_installed", STATIC_WALLPAPER_SCRIPT_PATH),
+    ("static_wallpaper_saved", STATIC_WALLPAPER_CONFIG_PATH),
+    ("static_wallpaper_jpg", STATIC_WALLPAPER_TARGET_JPG),
+    ("static_wallpaper_png", STATIC_WALLPAPER_TARGET_PNG),
+)
+
 DEFAULT_UPDATE_ALL_JSON = """{"migration_version": 6, "theme": "Blue Installer", "mirror": "", "countdown_time": 15, "log_viewer": true, "use_settings_screen_theme_in_log_viewer": true, "autoreboot": true, "download_beta_cores": false, "names_region": "JP", "names_char_code": "CHAR18", "names_sort_code": "Common", "introduced_arcade_names_txt": true, "pocket_firmware_update": false, "pocket_backup": false, "timeline_after_logs": true, "overscan": "medium", "monochrome_ui": false}
 """
 
@@ -182,7 +211,7 @@ def _remote_file_exists(sftp, path):
 
 
 def _write_remote_bytes(connection, path, data):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "wb") as remote_file:
             remote_file.write(data)
@@ -191,7 +220,7 @@ def _write_remote_bytes(connection, path, data):
 
 
 def _write_remote_text(connection, path, text):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "w") as remote_file:
             remote_file.write(text)
@@ -200,7 +229,7 @@ def _write_remote_text(connection, path, text):
 
 
 def _read_remote_bytes(connection, path):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "rb") as remote_file:
             return remote_file.read()
@@ -209,7 +238,7 @@ def _read_remote_bytes(connection, path):
 
 
 def _read_remote_text(connection, path):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "r") as remote_file:
             return remote_file.read()
@@ -233,7 +262,7 @@ def ensure_update_all_config_bootstrap(connection):
         "downloader_ini_created": False,
     }
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         if not _remote_file_exists(sftp, UPDATE_ALL_JSON_PATH):
             with sftp.open(UPDATE_ALL_JSON_PATH, "w") as handle:
@@ -280,7 +309,7 @@ def check_update_all_initialized(connection) -> bool:
 
     sftp = None
     try:
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         sftp.stat(UPDATE_ALL_JSON_PATH)
         return True
     except Exception:
@@ -325,17 +354,16 @@ def reload_mister_menu(connection):
     connection.run_command(MISTER_MENU_RELOAD_CMD)
 
 
+def _probed_files(probed: dict) -> dict:
+    return {path: entry["type"] == PROBE_FILE for path, entry in probed.items()}
+
+
 def is_static_wallpaper_active(connection) -> bool:
     if not connection.is_connected():
         return False
 
-    jpg_check = connection.run_command(
-        f"test -f {STATIC_WALLPAPER_TARGET_JPG} && echo EXISTS"
-    )
-    png_check = connection.run_command(
-        f"test -f {STATIC_WALLPAPER_TARGET_PNG} && echo EXISTS"
-    )
-    return ("EXISTS" in (jpg_check or "")) or ("EXISTS" in (png_check or ""))
+    files = _probed_files(connection.probe((STATIC_WALLPAPER_TARGET_JPG, STATIC_WALLPAPER_TARGET_PNG)))
+    return files[STATIC_WALLPAPER_TARGET_JPG] or files[STATIC_WALLPAPER_TARGET_PNG]
 
 
 def is_static_wallpaper_active_local(sd_root) -> bool:
@@ -390,44 +418,36 @@ def get_static_wallpaper_state(connection) -> dict:
             "saved_name": "",
         }
 
-    installed_check = connection.run_command(
-        f"test -f {STATIC_WALLPAPER_SCRIPT_PATH} && echo EXISTS"
-    )
-    jpg_check = connection.run_command(
-        f"test -f {STATIC_WALLPAPER_TARGET_JPG} && echo EXISTS"
-    )
-    png_check = connection.run_command(
-        f"test -f {STATIC_WALLPAPER_TARGET_PNG} && echo EXISTS"
+    files = _probed_files(connection.probe(STATIC_WALLPAPER_PROBE_PATHS))
+    saved_path = (
+        get_static_wallpaper_saved_selection(connection)
+        if files[STATIC_WALLPAPER_CONFIG_PATH]
+        else ""
     )
-    saved_path = get_static_wallpaper_saved_selection(connection)
 
-    active_target = ""
-    if "EXISTS" in (jpg_check or ""):
-        active_target = "menu.jpg"
-    elif "EXISTS" in (png_check or ""):
-        active_target = "menu.png"
-
-    return {
-        "installed": "EXISTS" in (installed_check or ""),
-        "active": bool(active_target),
-        "active_target": active_target,
-        "saved": bool(saved_path),
-        "saved_path": saved_path,
-        "saved_name": os.path.basename(saved_path) if saved_path else "",
-    }
+    return _static_wallpaper_state_from_files(files, saved_path)
 
 
 def get_static_wallpaper_state_local(sd_root) -> dict:
-    saved_path = get_static_wallpaper_saved_selection_local(sd_root)
+    files = _probed_files(probe_local(sd_root, STATIC_WALLPAPER_PROBE_PATHS))
+    saved_path = (
+        get_static_wallpaper_saved_selection_local(sd_root)
+        if files[STATIC_WALLPAPER_CONFIG_PATH]
+        else ""
+    )
 
+    return _static_wallpaper_state_from_files(files, saved_path)
+
+
+def _static_wallpaper_state_from_files(files: dict, saved_path: str) -> dict:
     active_target = ""
-    if _local_file_exists(sd_root, STATIC_WALLPAPER_TARGET_JPG):
+    if files[STATIC_WALLPAPER_TARGET_JPG]:
         active_target = "menu.jpg"
-    elif _local_file_exists(sd_root, STATIC_WALLPAPER_TARGET_PNG):
+    elif files[STATIC_WALLPAPER_TARGET_PNG]:
         active_target = "menu.png"
 
     return {
-        "installed": _local_file_exists(sd_root, STATIC_WALLPAPER_SCRIPT_PATH),
+        "installed": files[STATIC_WALLPAPER_SCRIPT_PATH],
         "active": bool(active_target),
         "active_target": active_target,
         "saved": bool(saved_path),
@@ -440,42 +460,20 @@ def get_scripts_status(connection) -> ScriptsStatus:
     if not connection.is_connected():
         return empty_scripts_status()
 
-    checks = [
-        ("update_all_installed", "/media/fat/Scripts/update_all.sh"),
-        ("update_all_initialized", UPDATE_ALL_JSON_PATH),
-        ("zaparoo_installed", "/media/fat/Scripts/zaparoo.sh"),
-        ("migrate_sd_installed", "/media/fat/Scripts/migrate_sd.sh"),
-        ("cifs_installed", CIFS_MOUNT_SCRIPT_PATH),
-        ("cifs_umount_installed", CIFS_UMOUNT_SCRIPT_PATH),
-        ("cifs_configured", "/media/fat/Scripts/cifs_mount.ini"),
-        ("cifs_common_installed", CIFS_COMMON_SCRIPT_PATH),
-        ("auto_time_installed", "/media/fat/Scripts/auto_time.sh"),
-        ("cd_game_organizer_installed", "/media/fat/Scripts/cd_game_organizer.sh"),
-        ("dav_browser_installed", "/media/fat/Scripts/dav_browser.sh"),
-        ("dav_browser_configured", DAV_BROWSER_CONFIG_PATH),
-        ("ftp_save_sync_installed", "/media/fat/Scripts/ftp_save_sync.sh"),
-        ("ftp_save_sync_configured", FTP_SAVE_SYNC_CONFIG_PATH),
-        ("static_wallpaper_installed", STATIC_WALLPAPER_SCRIPT_PATH),
-        ("static_wallpaper_saved", STATIC_WALLPAPER_CONFIG_PATH),
-        ("static_wallpaper_jpg", STATIC_WALLPAPER_TARGET_JPG),
-        ("static_wallpaper_png", STATIC_WALLPAPER_TARGET_PNG),
-    ]
-
+    paths = [path for _key, path in SCRIPTS_STATUS_CHECKS]
     command_parts = [
-        f"test -f '{path}' && printf '{key}=1\n' || printf '{key}=0\n'"
-        for key, path in checks
-    ]
-    command_parts.extend([
+        build_probe_command(paths),
         "grep -q 'mrext/zaparoo' /media/fat/linux/user-startup.sh 2>/dev/null "
         "&& printf 'zaparoo_service_enabled=1\n' || printf 'zaparoo_service_enabled=0\n'",
         f"grep -Fq '{FTP_SAVE_SYNC_DAEMON_LINE}' {FTP_SAVE_SYNC_STARTUP_PATH} 2>/dev/null "
         "&& printf 'ftp_save_sync_service_enabled=1\n' || printf 'ftp_save_sync_service_enabled=0\n'",
         f"grep -q 'cifs_common.sh' {CIFS_MOUNT_SCRIPT_PATH} 2>/dev/null "
         "&& printf 'cifs_common_required=1\n' || printf 'cifs_common_required=0\n'",
-    ])
+    ]
 
     output = connection.run_command("; ".join(command_parts)) or ""
-    values = {}
+    files = _probed_files(parse_probe_output(output, paths))
+    values = {key: files[path] for key, path in SCRIPTS_STATUS_CHECKS}
     for line in output.splitlines():
         key, separator, value = line.partition("=")
         if separator and value in {"0", "1"}:
@@ -514,23 +512,26 @@ def get_scripts_status_local(sd_root) -> ScriptsStatus:
         return empty_scripts_status()
 
     try:
-        update_all_installed = _local_file_exists(sd_root, "/media/fat/Scripts/update_all.sh")
-        zaparoo_installed = _local_file_exists(sd_root, "/media/fat/Scripts/zaparoo.sh")
-        migrate_sd_installed = _local_file_exists(sd_root, "/media/fat/Scripts/migrate_sd.sh")
-        cifs_installed = _local_file_exists(sd_root, CIFS_MOUNT_SCRIPT_PATH)
-        cifs_umount_installed = _local_file_exists(sd_root, CIFS_UMOUNT_SCRIPT_PATH)
-        cifs_configured = _local_file_exists(sd_root, "/media/fat/Scripts/cifs_mount.ini")
-        cifs_common_installed = _local_file_exists(sd_root, CIFS_COMMON_SCRIPT_PATH)
+        files = _probed_files(probe_local(sd_root, [path for _key, path in SCRIPTS_STATUS_CHECKS]))
+        values = {key: files[path] for key, path in SCRIPTS_STATUS_CHECKS}
+
+        update_all_installed = values["update_all_installed"]
+        zaparoo_installed = values["zaparoo_installed"]
+        migrate_sd_installed = values["migrate_sd_installed"]
+        cifs_installed = values["cifs_installed"]
+        cifs_umount_installed = values["cifs_umount_installed"]
+        cifs_configured = values["cifs_configured"]
+        cifs_common_installed = values["cifs_common_installed"]
         cifs_common_required = _cifs_mount_text_requires_common(_read_local_text(sd_root, CIFS_MOUNT_SCRIPT_PATH)) if cifs_installed else False
-        auto_time_installed = _local_file_exists(sd_root, "/media/fat/Scripts/auto_time.sh")
-        cd_game_organizer_installed = _local_file_exists(sd_root, "/media/fat/Scripts/cd_game_organizer.sh")
-        dav_browser_installed = _local_file_exists(sd_root, "/media/fat/Scripts/dav_browser.sh")
-        dav_browser_configured = _local_file_exists(sd_root, DAV_BROWSER_CONFIG_PATH)
-        ftp_save_sync_installed = _local_file_exists(sd_root, "/media/fat/Scripts/ftp_save_sync.sh")
-        ftp_save_sync_configured = _local_file_exists(sd_root, FTP_SAVE_SYNC_CONFIG_PATH)
-        static_wallpaper_installed = _local_file_exists(sd_root, STATIC_WALLPAPER_SCRIPT_PATH)
-        static_wallpaper_active = is_static_wallpaper_active_local(sd_root)
-        static_wallpaper_saved = has_static_wallpaper_saved_selection_local(sd_root)
+        auto_time_installed = values["auto_time_installed"]
+        cd_game_organizer_installed = values["cd_game_organizer_installed"]
+        dav_browser_installed = values["dav_browser_installed"]
+        dav_browser_configured = values["dav_browser_configured"]
+        ftp_save_sync_installed = values["ftp_save_sync_installed"]
+        ftp_save_sync_configured = values["ftp_save_sync_configured"]
+        static_wallpaper_installed = values["static_wallpaper_installed"]
+        static_wallpaper_active = values["static_wallpaper_jpg"] or values["static_wallpaper_png"]
+        static_wallpaper_saved = values["static_wallpaper_saved"]
 
         zaparoo_service_enabled = False
         startup_path = _local_path(sd_root, "/media/fat/linux/user-startup.sh")
@@ -546,7 +547,7 @@ def get_scripts_status_local(sd_root) -> ScriptsStatus:
 
         return ScriptsStatus(
             update_all_installed=update_all_installed,
-            update_all_initialized=check_update_all_initialized_local(sd_root) if update_all_installed else False,
+            update_all_initialized=values["update_all_initialized"] if update_all_installed else False,
             zaparoo_installed=zaparoo_installed,
             zaparoo_service_enabled=zaparoo_service_enabled,
             migrate_sd_installed=migrate_sd_installed,
@@ -177,7 +177,7 @@ def install_dav_browser(connection, log):
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(DAV_BROWSER_SCRIPT_PATH, "wb") as remote_file:
             remote_file.write(script_data)
@@ -257,7 +257,7 @@ def save_dav_browser_config(
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(DAV_BROWSER_CONFIG_PATH, "w") as remote_file:
             remote_file.write(ini)
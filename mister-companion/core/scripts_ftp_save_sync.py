@@ -781,7 +781,7 @@ def save_ftp_save_sync_config(
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(FTP_SAVE_SYNC_CONFIG_PATH, "w") as remote_file:
             remote_file.write(ini)
@@ -837,7 +837,7 @@ def enable_ftp_save_sync_service(connection):
         script = f"""#!/bin/sh
 
 {_ftp_save_sync_startup_block()}"""
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             with sftp.open(FTP_SAVE_SYNC_STARTUP_PATH, "w") as handle:
                 handle.write(script)
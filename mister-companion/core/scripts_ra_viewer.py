@@ -70,7 +70,7 @@ def _ensure_remote_dir(connection, remote_dir: str):
 
 
 def _write_remote_bytes(connection, path: str, data: bytes):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         remote_dir = posixpath.dirname(path)
         _ensure_remote_dir(connection, remote_dir)
@@ -86,7 +86,7 @@ def _write_remote_text(connection, path: str, text: str):
 
 
 def _read_remote_text(connection, path: str, default: str = "") -> str:
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "r") as remote_file:
             data = remote_file.read()
@@ -128,7 +128,7 @@ esac
 
 
 def _write_remote_bytes(connection, path, data):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "wb") as remote_file:
             remote_file.write(data)
@@ -137,7 +137,7 @@ def _write_remote_bytes(connection, path, data):
 
 
 def _write_remote_text(connection, path, text):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(path, "w") as remote_file:
             remote_file.write(text)
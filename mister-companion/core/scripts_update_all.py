@@ -46,7 +46,7 @@ def install_update_all(connection, log):
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(UPDATE_ALL_SCRIPT_PATH, "wb") as remote_file:
             remote_file.write(script_data)
@@ -93,7 +93,7 @@ def ensure_update_all_config_bootstrap(connection):
         "downloader_ini_created": False,
     }
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         if not _remote_file_exists(sftp, UPDATE_ALL_JSON_PATH):
             with sftp.open(UPDATE_ALL_JSON_PATH, "w") as handle:
@@ -203,7 +203,7 @@ def install_zaparoo(connection, log):
 
     ensure_remote_scripts_dir(connection)
 
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         with sftp.open(ZAPAROO_SCRIPT_PATH, "wb") as remote_file:
             remote_file.write(zaparoo_data)
@@ -234,7 +234,7 @@ def enable_zaparoo_service(connection):
     )
 
     if "EXISTS" not in (exists or ""):
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             with sftp.open(ZAPAROO_STARTUP_PATH, "w") as handle:
                 handle.write(_zaparoo_startup_block())
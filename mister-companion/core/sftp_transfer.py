@@ -0,0 +1,349 @@
+import os
+import posixpath
+import queue
+import shlex
+import stat
+import threading
+import time
+from pathlib import Path
+
+from core.resumable_transfer import RESUME_MIN_SIZE, resumable_get, resumable_put
+
+
+TRANSFER_WORKERS = 4
+TRANSFER_CHUNK_SIZE = 32768
+TRANSFER_STATUS_INTERVAL = 1.0
+MKDIR_BATCH_LENGTH = 16000
+
+
+def format_rate(bytes_per_second):
+    value = float(bytes_per_second or 0)
+    for unit in ("B/s", "KB/s", "MB/s", "GB/s"):
+        if value < 1024.0 or unit == "GB/s":
+            return f"{value:.0f} {unit}" if unit == "B/s" else f"{value:.1f} {unit}"
+        value /= 1024.0
+    return f"{value:.1f} GB/s"
+
+
+def format_eta(seconds):
+    if seconds is None:
+        return "--:--"
+    seconds = max(0, int(seconds))
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+class TransferProgress:
+    def __init__(self, total_files, total_bytes, progress_callback=None, message_callback=None, label="Transferred"):
+        self.total_files = int(total_files)
+        self.total_bytes = int(total_bytes)
+        self.files_done = 0
+        self.bytes_done = 0
+        self.started = time.monotonic()
+        self.progress_callback = progress_callback
+        self.message_callback = message_callback
+        self.label = label
+        self._last_status = self.started
+        self._lock = threading.Lock()
+
+    def bytes_per_second(self):
+        elapsed = time.monotonic() - self.started
+        if elapsed <= 0:
+            return 0.0
+        return self.bytes_done / elapsed
+
+    def eta_seconds(self):
+        rate = self.bytes_per_second()
+        if rate <= 0:
+            return None
+        return max(0, self.total_bytes - self.bytes_done) / rate
+
+    def status_text(self):
+        return (
+            f"{self.label} {self.files_done}/{self.total_files} files, "
+            f"{format_rate(self.bytes_per_second())}, ETA {format_eta(self.eta_seconds())}"
+        )
+
+    def add_bytes(self, count):
+        with self._lock:
+            self.bytes_done += count
+            done = self.bytes_done
+            now = time.monotonic()
+            emit_status = now - self._last_status >= TRANSFER_STATUS_INTERVAL
+            if emit_status:
+                self._last_status = now
+                status = self.status_text()
+
+        if self.progress_callback:
+            self.progress_callback(done, self.total_bytes)
+        if emit_status and self.message_callback:
+            self.message_callback(status)
+
+    def file_done(self):
+        with self._lock:
+            self.files_done += 1
+
+    def finish(self):
+        if self.message_callback and self.total_files:
+            self.message_callback(self.status_text())
+
+
+def collect_local_tree(local_folder, remote_folder):
+    local_folder = Path(local_folder)
+    directories = [remote_folder]
+    jobs = []
+
+    for root, dirs, files in os.walk(local_folder):
+        root_path = Path(root)
+        relative = root_path.relative_to(local_folder).as_posix()
+        current_remote = remote_folder if relative == "." else posixpath.join(remote_folder, relative)
+
+        for dirname in sorted(dirs):
+            directories.append(posixpath.join(current_remote, dirname))
+
+        for filename in sorted(files):
+            local_file = root_path / filename
+            try:
+                size = local_file.stat().st_size
+            except OSError:
+                size = 0
+            jobs.append((str(local_file), posixpath.join(current_remote, filename), size))
+
+    return directories, jobs
+
+
+def collect_remote_tree(sftp, remote_folder, local_folder, mtimes=None):
+    local_folder = Path(local_folder)
+    directories = [local_folder]
+    jobs = []
+    pending = [(remote_folder, local_folder)]
+
+    while pending:
+        remote_dir, local_dir = pending.pop()
+        for attr in sftp.listdir_attr(remote_dir):
+            name = attr.filename
+            if name in {".", ".."}:
+                continue
+            remote_item = posixpath.join(remote_dir, name)
+            local_item = local_dir / name
+            if stat.S_ISDIR(attr.st_mode):
+                directories.append(local_item)
+                pending.append((remote_item, local_item))
+            else:
+                jobs.append((remote_item, str(local_item), int(attr.st_size or 0)))
+                if mtimes is not None:
+                    mtimes[remote_item] = attr.st_mtime
+
+    return directories, jobs
+
+
+def make_remote_dirs(connection, directories):
+    batch = []
+    length = 0
+
+    for directory in dict.fromkeys(directories):
+        quoted = shlex.quote(directory)
+        if batch and length + len(quoted) > MKDIR_BATCH_LENGTH:
+            connection.run_command("mkdir -p " + " ".join(batch))
+            batch = []
+            length = 0
+        batch.append(quoted)
+        length += len(quoted) + 1
+
+    if batch:
+        connection.run_command("mkdir -p " + " ".join(batch))
+
+
+def make_local_dirs(directories):
+    for directory in directories:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+
+
+def _put_file(connection, sftp, local_path, remote_path, size, add_bytes):
+    if size >= RESUME_MIN_SIZE:
+        resumable_put(connection, local_path, remote_path, _resume_progress(add_bytes))
+        return
+
+    with open(local_path, "rb") as source_file:
+        with sftp.open(remote_path, "wb") as target_file:
+            target_file.set_pipelined(True)
+            while True:
+                chunk = source_file.read(TRANSFER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                target_file.write(chunk)
+                add_bytes(len(chunk))
+
+
+def _get_file(connection, sftp, remote_path, local_path, size, add_bytes):
+    if size >= RESUME_MIN_SIZE:
+        resumable_get(connection, remote_path, local_path, _resume_progress(add_bytes))
+        return
+
+    with sftp.open(remote_path, "rb") as source_file:
+        if size:
+            source_file.prefetch(size)
+        with open(local_path, "wb") as target_file:
+            while True:
+                chunk = source_file.read(TRANSFER_CHUNK_SIZE)
+                if not chunk:
+                    break
+                target_file.write(chunk)
+                add_bytes(len(chunk))
+
+
+def _resume_progress(add_bytes):
+    reported = [0]
+
+    def callback(transferred, _total):
+        add_bytes(transferred - reported[0])
+        reported[0] = transferred
+
+    return callback
+
+
+def _run_jobs(connection, jobs, transfer, progress, workers=TRANSFER_WORKERS, message_callback=None):
+    job_queue = queue.Queue()
+    for job in jobs:
+        job_queue.put(job)
+
+    errors = []
+    abort = threading.Event()
+
+    def worker():
+        sftp = None
+        try:
+            while not abort.is_set():
+                try:
+                    source, target, size = job_queue.get_nowait()
+                except queue.Empty:
+                    return
+
+                counted = [0]
+
+                def add_bytes(count):
+                    counted[0] += count
+                    progress.add_bytes(count)
+
+                try:
+                    if sftp is None:
+                        sftp = connection.open_sftp()
+                    transfer(connection, sftp, source, target, size, add_bytes)
+                except Exception:
+                    progress.add_bytes(-counted[0])
+                    if connection.is_connected():
+                        raise
+                    if message_callback:
+                        message_callback("Connection lost, waiting for MiSTer to resume the transfer...")
+                    if sftp is not None:
+                        sftp.close()
+                        sftp = None
+                    if not connection.wait_for_reconnect():
+                        raise
+                    job_queue.put((source, target, size))
+                    continue
+
+                progress.file_done()
+        except Exception as e:
+            errors.append(e)
+            abort.set()
+        finally:
+            if sftp is not None:
+                sftp.close()
+
+    count = max(1, min(int(workers or 1), len(jobs)))
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if errors:
+        raise errors[0]
+
+    progress.finish()
+
+
+def upload_files(connection, jobs, progress_callback=None, message_callback=None, directories=(), workers=TRANSFER_WORKERS):
+    jobs = list(jobs)
+    if directories:
+        make_remote_dirs(connection, directories)
+    if not jobs:
+        return
+
+    progress = TransferProgress(
+        len(jobs),
+        sum(size for _source, _target, size in jobs),
+        progress_callback,
+        message_callback if len(jobs) > 1 else None,
+        label="Uploaded",
+    )
+    if message_callback and len(jobs) > 1:
+        message_callback(f"Uploading {len(jobs)} files...")
+    _run_jobs(
+        connection,
+        jobs,
+        _put_file,
+        progress,
+        workers=workers,
+        message_callback=message_callback,
+    )
+
+
+def download_files(connection, jobs, progress_callback=None, message_callback=None, directories=(), workers=TRANSFER_WORKERS):
+    jobs = list(jobs)
+    make_local_dirs(directories)
+    if not jobs:
+        return
+
+    progress = TransferProgress(
+        len(jobs),
+        sum(size for _source, _target, size in jobs),
+        progress_callback,
+        message_callback if len(jobs) > 1 else None,
+        label="Downloaded",
+    )
+    if message_callback and len(jobs) > 1:
+        message_callback(f"Downloading {len(jobs)} files...")
+    _run_jobs(
+        connection,
+        jobs,
+        _get_file,
+        progress,
+        workers=workers,
+        message_callback=message_callback,
+    )
+
+
+def upload_tree(connection, local_folder, remote_folder, progress_callback=None, message_callback=None, workers=TRANSFER_WORKERS):
+    directories, jobs = collect_local_tree(local_folder, remote_folder)
+    upload_files(
+        connection,
+        jobs,
+        progress_callback=progress_callback,
+        message_callback=message_callback,
+        directories=directories,
+        workers=workers,
+    )
+    return jobs
+
+
+def download_tree(connection, remote_folder, local_folder, progress_callback=None, message_callback=None, workers=TRANSFER_WORKERS):
+    sftp = connection.open_sftp()
+    try:
+        directories, jobs = collect_remote_tree(sftp, remote_folder, local_folder)
+    finally:
+        sftp.close()
+
+    download_files(
+        connection,
+        jobs,
+        progress_callback=progress_callback,
+        message_callback=message_callback,
+        directories=directories,
+        workers=workers,
+    )
+    return jobs
@@ -0,0 +1,210 @@
+import os
+import shlex
+import tarfile
+import threading
+from pathlib import Path, PurePosixPath
+
+from core.sftp_transfer import TRANSFER_CHUNK_SIZE, TransferProgress
+
+
+TAR_STREAM_THRESHOLD = 500
+
+
+class _CountingReader:
+    def __init__(self, handle, progress):
+        self.handle = handle
+        self.progress = progress
+
+    def read(self, size=-1):
+        data = self.handle.read(size)
+        if data:
+            self.progress.add_bytes(len(data))
+        return data
+
+
+class _ChannelWriter:
+    def __init__(self, stdin):
+        self.stdin = stdin
+
+    def write(self, data):
+        self.stdin.write(data)
+        return len(data)
+
+    def flush(self):
+        self.stdin.flush()
+
+
+def count_remote_files(connection, remote_folder):
+    output = connection.run_command(
+        f"find {shlex.quote(remote_folder)} -type f 2>/dev/null | wc -l"
+    )
+    try:
+        return int((output or "0").strip().splitlines()[-1])
+    except (ValueError, IndexError):
+        return 0
+
+
+def count_local_files(local_folder, limit=None):
+    count = 0
+    for _root, _dirs, files in os.walk(local_folder):
+        count += len(files)
+        if limit is not None and count >= limit:
+            break
+    return count
+
+
+def should_stream_as_tar(file_count, threshold=TAR_STREAM_THRESHOLD):
+    try:
+        threshold = int(threshold)
+    except (TypeError, ValueError):
+        threshold = TAR_STREAM_THRESHOLD
+    return threshold > 0 and file_count >= threshold
+
+
+def _drain_stderr(channel, errors):
+    while True:
+        data = channel.recv_stderr(TRANSFER_CHUNK_SIZE)
+        if not data:
+            break
+        errors.append(data)
+
+
+def _start_command(connection, command):
+    stdin, stdout, _stderr = connection.client.exec_command(command)
+    errors = []
+    # tar can print a warning per file; reading it only at the end would let it fill the channel
+    # window and stall the remote side while this side is still streaming.
+    reader = threading.Thread(target=_drain_stderr, args=(stdout.channel, errors), daemon=True)
+    reader.start()
+    return stdin, stdout, reader, errors
+
+
+def _finish_command(stdout, reader, errors, action):
+    exit_status = stdout.channel.recv_exit_status()
+    reader.join()
+    error = b"".join(errors).decode("utf-8", errors="ignore").strip()
+    if exit_status != 0:
+        raise RuntimeError(error or f"tar {action} failed with exit code {exit_status}.")
+
+
+def upload_tree_tar(connection, local_folder, remote_folder, progress_callback=None, message_callback=None, compress=False):
+    if not connection.is_connected():
+        raise RuntimeError("Not connected")
+
+    local_folder = Path(local_folder)
+    entries = []
+    total_bytes = 0
+
+    for root, dirs, files in os.walk(local_folder):
+        root_path = Path(root)
+        dirs.sort()
+        for name in sorted(dirs):
+            entries.append(root_path / name)
+        for name in sorted(files):
+            path = root_path / name
+            entries.append(path)
+            try:
+                total_bytes += path.stat().st_size
+            except OSError:
+                pass
+
+    file_count = sum(1 for entry in entries if not entry.is_dir())
+    progress = TransferProgress(file_count, total_bytes, progress_callback, message_callback, label="Uploaded")
+
+    if message_callback:
+        message_callback(f"Streaming {file_count} files as tar{' (gzip)' if compress else ''}...")
+
+    quoted = shlex.quote(remote_folder)
+    command = f"mkdir -p {quoted} && tar -x{'z' if compress else ''}f - -C {quoted}"
+
+    stdin, stdout, reader, errors = _start_command(connection, command)
+    try:
+        with tarfile.open(fileobj=_ChannelWriter(stdin), mode="w|gz" if compress else "w|", format=tarfile.GNU_FORMAT) as archive:
+            for entry in entries:
+                arcname = entry.relative_to(local_folder).as_posix()
+                info = archive.gettarinfo(str(entry), arcname=arcname)
+                info.uid = info.gid = 0
+                info.uname = info.gname = "root"
+                if info.isfile():
+                    with open(entry, "rb") as handle:
+                        archive.addfile(info, _CountingReader(handle, progress))
+                    progress.file_done()
+                elif info.isdir():
+                    archive.addfile(info)
+        stdin.flush()
+        stdin.channel.shutdown_write()
+    except Exception:
+        # Closing the channel ends the remote tar instead of leaving it waiting on stdin.
+        stdout.channel.close()
+        raise
+
+    _finish_command(stdout, reader, errors, "upload")
+    progress.finish()
+
+
+def _safe_member_path(local_folder, name):
+    parts = [part for part in PurePosixPath(name).parts if part not in {"", "."}]
+    if not parts or any(part == ".." for part in parts) or PurePosixPath(name).is_absolute():
+        return None
+    return local_folder.joinpath(*parts)
+
+
+def download_tree_tar(connection, remote_folder, local_folder, progress_callback=None, message_callback=None, compress=False):
+    if not connection.is_connected():
+        raise RuntimeError("Not connected")
+
+    local_folder = Path(local_folder)
+    local_folder.mkdir(parents=True, exist_ok=True)
+
+    quoted = shlex.quote(remote_folder)
+    totals = connection.run_command(
+        f"find {quoted} -type f 2>/dev/null | wc -l; du -sk {quoted} 2>/dev/null | cut -f1"
+    ).split()
+    try:
+        file_count, total_bytes = int(totals[0]), int(totals[1]) * 1024
+    except (ValueError, IndexError):
+        file_count, total_bytes = 0, 0
+
+    progress = TransferProgress(file_count, total_bytes, progress_callback, message_callback, label="Downloaded")
+
+    if message_callback:
+        message_callback(f"Streaming {file_count} files as tar{' (gzip)' if compress else ''}...")
+
+    command = f"tar -c{'z' if compress else ''}f - -C {quoted} ."
+
+    stdin, stdout, reader, errors = _start_command(connection, command)
+    try:
+        stdin.close()
+        with tarfile.open(fileobj=stdout, mode="r|gz" if compress else "r|") as archive:
+            for member in archive:
+                target = _safe_member_path(local_folder, member.name)
+                if target is None:
+                    continue
+
+                if member.isdir():
+                    target.mkdir(parents=True, exist_ok=True)
+                    continue
+
+                if not member.isfile():
+                    continue
+
+                target.parent.mkdir(parents=True, exist_ok=True)
+                source = archive.extractfile(member)
+                with open(target, "wb") as handle:
+                    while True:
+                        chunk = source.read(TRANSFER_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        handle.write(chunk)
+                        progress.add_bytes(len(chunk))
+                try:
+                    os.utime(target, (member.mtime, member.mtime))
+                except OSError:
+                    pass
+                progress.file_done()
+    except Exception:
+        stdout.channel.close()
+        raise
+
+    _finish_command(stdout, reader, errors, "download")
+    progress.finish()
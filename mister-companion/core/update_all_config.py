@@ -113,22 +113,6 @@ def local_path(sd_root, remote_path):
     return Path(sd_root).expanduser().resolve() / relative
 
 
-def read_remote_text(sftp, path, default=""):
-    try:
-        with sftp.open(path, "r") as f:
-            data = f.read()
-            if isinstance(data, bytes):
-                return data.decode()
-            return data
-    except Exception:
-        return default
-
-
-def write_remote_text(sftp, path, text):
-    with sftp.open(path, "w") as f:
-        f.write(text)
-
-
 def remote_path_exists(sftp, path):
     try:
         sftp.stat(path)
@@ -137,13 +121,6 @@ def remote_path_exists(sftp, path):
         return False
 
 
-def remove_remote_file(sftp, path):
-    try:
-        sftp.remove(path)
-    except Exception:
-        pass
-
-
 def read_local_text(sd_root, path, default=""):
     try:
         local = local_path(sd_root, path)
@@ -176,16 +153,6 @@ def remove_local_file(sd_root, path):
         pass
 
 
-def read_downloader_files(sftp):
-    paths = split_downloader_paths()
-    return {
-        "main": read_remote_text(sftp, paths["main"], ""),
-        "arcade": read_remote_text(sftp, paths["arcade"], ""),
-        "bios": read_remote_text(sftp, paths["bios"], ""),
-        "manualsdb": read_remote_text(sftp, paths["manualsdb"], ""),
-    }
-
-
 def read_downloader_files_local(sd_root):
     paths = split_downloader_paths()
     return {
@@ -315,12 +282,12 @@ def normalize_manualsdb_selected(selected_ids):
     return selected
 
 
-def ensure_split_downloader_configs(sftp):
+def _split_downloader_texts(main_text, arcade_text, bios_text):
     paths = split_downloader_paths()
 
-    main_lines = read_remote_text(sftp, paths["main"], "").splitlines()
-    arcade_lines = read_remote_text(sftp, paths["arcade"], "").splitlines()
-    bios_lines = read_remote_text(sftp, paths["bios"], "").splitlines()
+    main_lines = main_text.splitlines()
+    arcade_lines = arcade_text.splitlines()
+    bios_lines = bios_text.splitlines()
 
     changed_main = False
     changed_arcade = False
@@ -348,53 +315,66 @@ def ensure_split_downloader_configs(sftp):
         changed_main = True
         changed_bios = True
 
+    changes = {}
     if changed_main:
-        write_remote_text(sftp, paths["main"], "\n".join(main_lines).rstrip() + "\n")
+        changes[paths["main"]] = "\n".join(main_lines).rstrip() + "\n"
     if changed_arcade:
-        write_remote_text(sftp, paths["arcade"], "\n".join(arcade_lines).rstrip() + "\n")
+        changes[paths["arcade"]] = "\n".join(arcade_lines).rstrip() + "\n"
     if changed_bios:
-        write_remote_text(sftp, paths["bios"], "\n".join(bios_lines).rstrip() + "\n")
+        changes[paths["bios"]] = "\n".join(bios_lines).rstrip() + "\n"
+
+    return changes
 
 
 def ensure_split_downloader_configs_local(sd_root):
     paths = split_downloader_paths()
 
-    main_lines = read_local_text(sd_root, paths["main"], "").splitlines()
-    arcade_lines = read_local_text(sd_root, paths["arcade"], "").splitlines()
-    bios_lines = read_local_text(sd_root, paths["bios"], "").splitlines()
+    changes = _split_downloader_texts(
+        read_local_text(sd_root, paths["main"], ""),
+        read_local_text(sd_root, paths["arcade"], ""),
+        read_local_text(sd_root, paths["bios"], ""),
+    )
 
-    changed_main = False
-    changed_arcade = False
-    changed_bios = False
+    for path, text in changes.items():
+        write_local_text(sd_root, path, text)
 
-    arcade_section = extract_section_from_lines(main_lines, "arcade_roms_db")
-    if arcade_section:
-        arcade_lines = upsert_section_lines(
-            arcade_lines,
-            "arcade_roms_db",
-            arcade_section
-        )
-        main_lines = remove_section_from_lines(main_lines, "arcade_roms_db")
-        changed_main = True
-        changed_arcade = True
 
-    bios_section = extract_section_from_lines(main_lines, "bios_db")
-    if bios_section:
-        bios_lines = upsert_section_lines(
-            bios_lines,
-            "bios_db",
-            bios_section
-        )
-        main_lines = remove_section_from_lines(main_lines, "bios_db")
-        changed_main = True
-        changed_bios = True
+def _update_all_config_paths():
+    paths = split_downloader_paths()
+    return [
+        paths["main"],
+        paths["arcade"],
+        paths["bios"],
+        paths["manualsdb"],
+        JSON_PATH,
+        ARCADE_ORGANIZER_INI_PATH,
+        MISTER_INI_PATH,
+    ]
 
-    if changed_main:
-        write_local_text(sd_root, paths["main"], "\n".join(main_lines).rstrip() + "\n")
-    if changed_arcade:
-        write_local_text(sd_root, paths["arcade"], "\n".join(arcade_lines).rstrip() + "\n")
-    if changed_bios:
-        write_local_text(sd_root, paths["bios"], "\n".join(bios_lines).rstrip() + "\n")
+
+def _read_update_all_files(connection):
+    paths = split_downloader_paths()
+
+    texts = {
+        path: (data or b"").decode("utf-8", errors="ignore")
+        for path, data in connection.read_many(_update_all_config_paths()).items()
+    }
+
+    changes = _split_downloader_texts(
+        texts[paths["main"]],
+        texts[paths["arcade"]],
+        texts[paths["bios"]],
+    )
+    texts.update(changes)
+
+    return texts, changes
+
+
+def _parse_update_all_json(text):
+    try:
+        return json.loads(text or "{}")
+    except Exception:
+        return {}
 
 
 def _build_config_data(ini_data, json_data, arcade_org_ini, manualsdb_ini="", mister_ini=""):
@@ -474,38 +454,24 @@ def _build_config_data(ini_data, json_data, arcade_org_ini, manualsdb_ini="", mi
 
 
 def load_update_all_config(connection):
-    sftp = connection.client.open_sftp()
-    try:
-        ensure_split_downloader_configs(sftp)
-
-        files = read_downloader_files(sftp)
-        ini_data = "\n".join([
-            files["main"],
-            files["arcade"],
-            files["bios"],
-        ])
-
-        try:
-            with sftp.open(JSON_PATH, "r") as f:
-                raw = f.read()
-                if isinstance(raw, bytes):
-                    raw = raw.decode()
-                json_data = json.loads(raw)
-        except Exception:
-            json_data = {}
-
-        arcade_org_ini = read_remote_text(sftp, ARCADE_ORGANIZER_INI_PATH, "")
-        mister_ini = read_remote_text(sftp, MISTER_INI_PATH, "")
-
-        return _build_config_data(
-            ini_data,
-            json_data,
-            arcade_org_ini,
-            files["manualsdb"],
-            mister_ini,
-        )
-    finally:
-        sftp.close()
+    texts, changes = _read_update_all_files(connection)
+    if changes:
+        connection.write_many(changes)
+
+    paths = split_downloader_paths()
+    ini_data = "\n".join([
+        texts[paths["main"]],
+        texts[paths["arcade"]],
+        texts[paths["bios"]],
+    ])
+
+    return _build_config_data(
+        ini_data,
+        _parse_update_all_json(texts[JSON_PATH]),
+        texts[ARCADE_ORGANIZER_INI_PATH],
+        texts[paths["manualsdb"]],
+        texts[MISTER_INI_PATH],
+    )
 
 
 def load_update_all_config_local(sd_root):
@@ -902,29 +868,25 @@ def _apply_zaparoo_frontend_mister_ini_text(text, enabled):
     return _remove_zaparoo_launcher_from_mister_ini(text)
 
 
-def _save_remote_zaparoo_frontend_state(sftp, enabled):
-    current = read_remote_text(sftp, MISTER_INI_PATH, "")
-
+def _zaparoo_frontend_mister_ini_update(current, enabled):
     if not current and not enabled:
-        return
+        return None
 
     patched = _apply_zaparoo_frontend_mister_ini_text(current, enabled)
     current_normalized = current.replace("\r\n", "\n").replace("\r", "\n")
 
     if patched != current_normalized:
-        write_remote_text(sftp, MISTER_INI_PATH, patched)
+        return patched
+    return None
 
 
 def _save_local_zaparoo_frontend_state(sd_root, enabled):
-    current = read_local_text(sd_root, MISTER_INI_PATH, "")
-
-    if not current and not enabled:
-        return
-
-    patched = _apply_zaparoo_frontend_mister_ini_text(current, enabled)
-    current_normalized = current.replace("\r\n", "\n").replace("\r", "\n")
+    patched = _zaparoo_frontend_mister_ini_update(
+        read_local_text(sd_root, MISTER_INI_PATH, ""),
+        enabled,
+    )
 
-    if patched != current_normalized:
+    if patched is not None:
         write_local_text(sd_root, MISTER_INI_PATH, patched)
 
 
@@ -941,62 +903,39 @@ def _prepare_manualsdb_ini(config):
 
 
 def save_update_all_config(connection, config):
-    sftp = connection.client.open_sftp()
-    try:
-        ensure_split_downloader_configs(sftp)
-
-        paths = split_downloader_paths()
-
-        main_lines = read_remote_text(sftp, paths["main"], "").splitlines()
-        arcade_lines = read_remote_text(sftp, paths["arcade"], "").splitlines()
-        bios_lines = read_remote_text(sftp, paths["bios"], "").splitlines()
-
-        try:
-            with sftp.open(JSON_PATH, "r") as f:
-                raw = f.read()
-                if isinstance(raw, bytes):
-                    raw = raw.decode()
-                json_data = json.loads(raw)
-        except Exception:
-            json_data = {}
-
-        if config.get("arcade_org", False):
-            write_remote_text(
-                sftp,
-                ARCADE_ORGANIZER_INI_PATH,
-                "ARCADE_ORGANIZER=true\nSKIPALTS=false\n"
-            )
-        else:
-            remove_remote_file(sftp, ARCADE_ORGANIZER_INI_PATH)
+    texts, writes = _read_update_all_files(connection)
 
-        main_lines, arcade_lines, bios_lines, json_data = _prepare_config_lines_and_json(
-            config,
-            main_lines,
-            arcade_lines,
-            bios_lines,
-            json_data,
-        )
+    paths = split_downloader_paths()
 
-        paths = split_downloader_paths()
-        write_remote_text(sftp, paths["main"], "\n".join(main_lines).rstrip() + "\n")
-        write_remote_text(sftp, paths["arcade"], "\n".join(arcade_lines).rstrip() + "\n")
-        write_remote_text(sftp, paths["bios"], "\n".join(bios_lines).rstrip() + "\n")
+    if config.get("arcade_org", False):
+        writes[ARCADE_ORGANIZER_INI_PATH] = "ARCADE_ORGANIZER=true\nSKIPALTS=false\n"
+    else:
+        writes[ARCADE_ORGANIZER_INI_PATH] = None
 
-        manualsdb_ini = _prepare_manualsdb_ini(config)
-        if manualsdb_ini:
-            write_remote_text(sftp, paths["manualsdb"], manualsdb_ini)
-        else:
-            remove_remote_file(sftp, paths["manualsdb"])
+    main_lines, arcade_lines, bios_lines, json_data = _prepare_config_lines_and_json(
+        config,
+        texts[paths["main"]].splitlines(),
+        texts[paths["arcade"]].splitlines(),
+        texts[paths["bios"]].splitlines(),
+        _parse_update_all_json(texts[JSON_PATH]),
+    )
 
-        _save_remote_zaparoo_frontend_state(
-            sftp,
-            bool(config.get("zaparoo_frontend", False)),
-        )
+    writes[paths["main"]] = "\n".join(main_lines).rstrip() + "\n"
+    writes[paths["arcade"]] = "\n".join(arcade_lines).rstrip() + "\n"
+    writes[paths["bios"]] = "\n".join(bios_lines).rstrip() + "\n"
+
+    writes[paths["manualsdb"]] = _prepare_manualsdb_ini(config) or None
+
+    patched_mister_ini = _zaparoo_frontend_mister_ini_update(
+        texts[MISTER_INI_PATH],
+        bool(config.get("zaparoo_frontend", False)),
+    )
+    if patched_mister_ini is not None:
+        writes[MISTER_INI_PATH] = patched_mister_ini
+
+    writes[JSON_PATH] = json.dumps(json_data, indent=4)
 
-        with sftp.open(JSON_PATH, "w") as f:
-            f.write(json.dumps(json_data, indent=4))
-    finally:
-        sftp.close()
+    connection.write_many(writes)
 
 
 def save_update_all_config_local(sd_root, config):
@@ -268,7 +268,7 @@ def upload_wallpaper(connection, name: str, data: bytes) -> bool:
 
     sftp = None
     try:
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         remote_path = f"{WALLPAPER_DIR}/{name}"
 
         with sftp.file(remote_path, "wb") as remote_file:
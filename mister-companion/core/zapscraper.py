@@ -1,17 +1,23 @@
-import binascii
 import hashlib
 import html
 import json
+import math
+import os
 import posixpath
 from io import BytesIO
 import re
 import shutil
 import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
 import zipfile
+from xml.sax.saxutils import escape as escape_xml
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
@@ -27,6 +33,14 @@ except Exception:
 
 from core.screenscraper_private import get_dev_credentials
 from core.app_paths import generated_path
+from core.zapscraper_hashing import (
+    DEFAULT_HASH_POLICY,
+    RomHashCache,
+    RomHashPool,
+    calculate_rom_hashes,
+    has_strong_hashes,
+    needs_strong_hashes,
+)
 from core.zapscraper_systems import (
     DISC_HELPER_EXTENSIONS,
     OUTPUT_FORMAT_RECALBOX,
@@ -48,6 +62,7 @@ from core.zapscraper_systems import (
 
 
 CACHE_FILENAME = ".zapscraper_cache.json"
+CACHE_JOURNAL_FILENAME = ".zapscraper_cache.jsonl"
 GAMELIST_FILENAME = "gamelist.xml"
 SCREENSCRAPER_API_BASE = "https://api.screenscraper.fr/api2"
 
@@ -58,20 +73,55 @@ REQUEST_STREAM_CHUNK_SIZE = 1024 * 128
 REQUEST_MAX_IMAGE_BYTES = 35_000_000
 REQUEST_DELAY_SECONDS = 0.3
 
+SCRAPE_MAX_API_THREADS = 8
+SCRAPE_LOOKAHEAD_PER_THREAD = 4
+SCRAPE_MEDIA_WORKERS = 4
+SCRAPE_MAX_ENCODE_WORKERS = 4
+SCRAPE_POLL_SECONDS = 0.2
+
 MAX_IMAGE_SIZE_BYTES = 1_500_000
 TARGET_IMAGE_SIZE_BYTES = 1_000_000
 IMAGE_COMPRESSION_START_QUALITY = 90
 IMAGE_COMPRESSION_MIN_QUALITY = 55
 IMAGE_COMPRESSION_QUALITY_STEP = 5
-IMAGE_COMPRESSION_RESIZE_STEP = 0.90
+IMAGE_COMPRESSION_RESIZE_MARGIN = 0.95
+IMAGE_COMPRESSION_MAX_RESIZE_PASSES = 4
 IMAGE_COMPRESSION_MIN_DIMENSION = 320
+IMAGE_COMPRESSION_QUALITY_SPAN = 3
+IMAGE_COMPRESSION_DRAFT_MIN_RATIO = 16
 
 CRT_IMAGE_MAX_DIMENSION = 125
 CRT_IMAGE_QUALITY = 78
 CRT_IMAGE_MIN_QUALITY = 65
 
+GAMELIST_FLUSH_INTERVAL_SECONDS = 30.0
+GAMELIST_FLUSH_EVERY_GAMES = 25
+
+ZAPAROO_CHILD_CLEARED_TAGS = (
+    "name",
+    "desc",
+    "rating",
+    "releasedate",
+    "developer",
+    "publisher",
+    "genre",
+    "players",
+    "region",
+    "lang",
+    "image",
+    "thumbnail",
+    "marquee",
+    "wheel",
+    "screenshot",
+    "titlescreen",
+    "boxart2d",
+    "boxart3d",
+    "logo",
+)
+
 
 SCAN_CACHE_VERSION = 1
+SCAN_SNAPSHOT_VERSION = 3
 DEFAULT_OUTPUT_FORMAT = OUTPUT_FORMAT_RECALBOX
 
 ARCADE_SYSTEM_FOLDER = "Arcade"
@@ -80,8 +130,6 @@ ARCADE_SCREENSCRAPER_ID = 75
 ARCADE_MRA_EXTENSION = ".mra"
 
 
-_last_screenscraper_request_at = 0.0
-
 def _is_zaparoo_format(output_format: str) -> bool:
     return output_format == OUTPUT_FORMAT_ZAPAROO_COMPANION
 
@@ -107,16 +155,56 @@ def build_screenscraper_daily_quota_message(details: str = "") -> str:
     return message
 
 
-def _wait_for_screenscraper_rate_limit():
-    global _last_screenscraper_request_at
+class ScreenScraperRateLimiter:
+    # Token bucket: one token per request, refilled at the account's request rate and
+    # holding at most one token per allowed thread, so bursts never exceed the allowance.
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self.configure()
+
+    def configure(self, threads: int | None = 1, requests_per_minute: int | None = None):
+        threads = max(1, int(threads or 1))
+        rate = threads / REQUEST_DELAY_SECONDS
+
+        if requests_per_minute and int(requests_per_minute) > 0:
+            rate = min(rate, int(requests_per_minute) / 60.0)
+
+        with self._lock:
+            self.threads = threads
+            self.rate = rate
+            self.capacity = float(threads)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def update_from_quota(self, quota: dict[str, Any]):
+        minute_limit = quota.get("minute_limit") if isinstance(quota, dict) else None
+        if minute_limit:
+            self.configure(self.threads, minute_limit)
+
+    def acquire(self, stop_checker=None):
+        while True:
+            _check_stopped(stop_checker)
+
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+
+                wait = (1.0 - self._tokens) / self.rate
+
+            time.sleep(min(wait, SCRAPE_POLL_SECONDS))
+
 
-    now = time.monotonic()
-    elapsed = now - _last_screenscraper_request_at
+_screenscraper_rate_limiter = ScreenScraperRateLimiter()
 
-    if elapsed < REQUEST_DELAY_SECONDS:
-        time.sleep(REQUEST_DELAY_SECONDS - elapsed)
 
-    _last_screenscraper_request_at = time.monotonic()
+def _wait_for_screenscraper_rate_limit(stop_checker=None):
+    _screenscraper_rate_limiter.acquire(stop_checker)
 
 
 def _walk_values(value: Any):
@@ -313,6 +401,7 @@ def extract_screenscraper_quota_info(data: dict[str, Any]) -> dict[str, Any]:
         data,
         {
             "maxrequestsperminute",
+            "maxrequestspermin",
             "maxrequestsminute",
             "requestslimitminute",
             "minute_limit",
@@ -620,10 +709,25 @@ def load_scan_cache_systems(source_mode: str, source_path: str | Path) -> list[d
     return [system for system in systems if isinstance(system, dict)]
 
 
+def load_scan_snapshots(source_mode: str, source_path: str | Path) -> dict[str, Any]:
+    data = load_scan_cache(source_mode, source_path)
+    snapshots = data.get("snapshots") if isinstance(data, dict) else None
+
+    if not isinstance(snapshots, dict) or snapshots.get("version") != SCAN_SNAPSHOT_VERSION:
+        return {}
+
+    systems = snapshots.get("systems")
+    if not isinstance(systems, dict):
+        return {}
+
+    return {folder: dirs for folder, dirs in systems.items() if isinstance(dirs, dict)}
+
+
 def save_scan_cache(
     source_mode: str,
     source_path: str | Path,
     systems: list[dict[str, Any]],
+    snapshots: dict[str, Any] | None = None,
 ) -> Path:
     cache_path = get_scan_cache_path(source_mode, source_path)
     games_location = scan_cache_games_location(source_mode, source_path)
@@ -637,6 +741,9 @@ def save_scan_cache(
         "systems": systems or [],
     }
 
+    if snapshots:
+        data["snapshots"] = {"version": SCAN_SNAPSHOT_VERSION, "systems": snapshots}
+
     with cache_path.open("w", encoding="utf-8") as handle:
         json.dump(data, handle, indent=2, ensure_ascii=False)
 
@@ -659,6 +766,40 @@ def clear_scan_cache(source_mode: str, source_path: str | Path) -> bool:
         return False
 
 
+def get_rom_hash_cache_dir() -> Path:
+    return get_scan_cache_dir() / "hashes"
+
+
+def get_rom_hash_cache_path(system_path: str | Path) -> Path:
+    key_source = str(system_path or "").replace("\\", "/").rstrip("/").lower()
+
+    if not key_source:
+        raise RuntimeError("Cannot create hash cache path without a system folder.")
+
+    cache_key = hashlib.sha1(key_source.encode("utf-8", errors="ignore")).hexdigest()
+    return get_rom_hash_cache_dir() / f"{cache_key}.zapscraper_hashes.json"
+
+
+def clear_rom_hash_cache(system_paths=None) -> int:
+    if system_paths is None:
+        paths = list(get_rom_hash_cache_dir().glob("*.zapscraper_hashes.json"))
+    else:
+        paths = []
+        for system_path in system_paths:
+            try:
+                paths.append(get_rom_hash_cache_path(system_path))
+            except Exception:
+                continue
+
+    removed = 0
+    for path in paths:
+        try:
+            path.unlink()
+            removed += 1
+        except Exception:
+            continue
+
+    return removed
 
 
 def normalize_output_format(output_format: str = "") -> str:
@@ -753,6 +894,7 @@ def scan_sd_card(
     zaparoo_media_source_names=None,
     fast_skip_completed: bool = False,
     crt_mode: bool = False,
+    scan_snapshots: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     sd_root = Path(sd_root)
 
@@ -781,6 +923,7 @@ def scan_sd_card(
         zaparoo_media_source_names=zaparoo_media_source_names,
         fast_skip_completed=fast_skip_completed,
         crt_mode=crt_mode,
+        scan_snapshots=scan_snapshots,
     )
 
     if callable(stop_checker) and stop_checker():
@@ -831,6 +974,7 @@ def scan_games_folder(
     zaparoo_media_source_names=None,
     fast_skip_completed: bool = False,
     crt_mode: bool = False,
+    scan_snapshots: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     games_root = Path(games_root)
 
@@ -843,6 +987,7 @@ def scan_games_folder(
     systems: list[ZapScraperSystem] = []
     total_games_found = 0
     supported_items = list(SUPPORTED_SYSTEMS.items())
+    fresh_snapshots: dict[str, Any] = {}
 
     if callable(progress_callback):
         progress_callback(
@@ -888,6 +1033,10 @@ def scan_games_folder(
                 crt_mode=crt_mode,
             )
 
+        directory_snapshots = None
+        if scan_snapshots is not None:
+            directory_snapshots = dict(scan_snapshots.get(folder_name) or {})
+
         roms = scan_system_folder(
             system_path,
             folder_name,
@@ -898,11 +1047,15 @@ def scan_games_folder(
             games_found_before=total_games_found,
             system_label=label,
             completed_checker=completed_checker,
+            directory_snapshots=directory_snapshots,
         )
 
         if callable(stop_checker) and stop_checker():
             break
 
+        if directory_snapshots:
+            fresh_snapshots[folder_name] = directory_snapshots
+
         if not roms:
             continue
 
@@ -926,6 +1079,10 @@ def scan_games_folder(
             )
         )
 
+    if scan_snapshots is not None and not (callable(stop_checker) and stop_checker()):
+        scan_snapshots.clear()
+        scan_snapshots.update(fresh_snapshots)
+
     if callable(progress_callback):
         progress_callback(
             "Scan complete.",
@@ -981,81 +1138,165 @@ def _scan_zip_contents(
     return results
 
 
-def scan_system_folder(
-    system_path: Path,
-    system_folder: str,
-    progress_callback=None,
-    stop_checker=None,
-    system_index: int = 0,
-    system_total: int = 0,
-    games_found_before: int = 0,
-    system_label: str = "",
-    completed_checker=None,
-) -> list[ZapScraperRom]:
-    roms: list[ZapScraperRom] = []
-    checked_files = 0
-    last_reported_folder = ""
-    referenced_disc_helpers = _cue_referenced_local_paths(system_path)
+def _file_stamp(entry: os.DirEntry) -> list[int] | None:
+    try:
+        info = entry.stat()
+    except OSError:
+        return None
+    return [int(info.st_size), int(info.st_mtime_ns)]
+
+
+def _directory_fingerprint(names: list[str], files: list[os.DirEntry]) -> str:
+    # Files overwritten in place keep their name and FAT/NTFS folders keep their mtime, so each
+    # file's own size and mtime are part of the fingerprint as well.
+    stamps = [f"{entry.name}\0{_file_stamp(entry)}" for entry in files]
+    joined = "\0".join(sorted(names)) + "\1" + "\0".join(sorted(stamps))
+    return hashlib.sha1(joined.encode("utf-8", errors="surrogateescape")).hexdigest()
+
+
+def _iter_system_directories(system_path: Path, stop_checker=None):
+    pending = [system_path]
 
-    for path in system_path.rglob("*"):
+    while pending:
         if callable(stop_checker) and stop_checker():
-            break
+            return
 
-        if not path.is_file():
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+            mtime = os.stat(directory).st_mtime_ns
+        except OSError:
             continue
 
-        checked_files += 1
+        files = []
+        subdirectories = []
+        for entry in entries:
+            try:
+                # Same rules as Path.rglob: follow file symlinks but never descend into linked folders.
+                if entry.is_dir() and not entry.is_symlink():
+                    # Media folders only hold scraped images, so prune them instead of walking every file.
+                    if entry.name.lower() != "media":
+                        subdirectories.append(Path(entry.path))
+                elif entry.is_file():
+                    files.append(entry)
+            except OSError:
+                continue
 
-        if checked_files == 1 or checked_files % 100 == 0:
-            current_folder = str(path.parent)
+        yield directory, mtime, [entry.name for entry in entries], files
+        pending.extend(reversed(subdirectories))
 
-            if current_folder != last_reported_folder or checked_files % 250 == 0:
-                last_reported_folder = current_folder
 
-                if callable(progress_callback):
-                    total_games_found = games_found_before + len(roms)
-                    label = system_label or system_folder
-                    progress_callback(
-                        f"Scanning {label}: {len(roms)} games found, {checked_files} files checked...",
-                        system_index,
-                        system_total,
-                        total_games_found,
-                    )
+def _read_cue_helper_references(path: Path) -> list[str]:
+    try:
+        cue_text = path.read_text(encoding="utf-8-sig", errors="replace")
+    except Exception:
+        return []
 
-        if path.name == GAMELIST_FILENAME:
-            continue
+    return [
+        reference
+        for reference in _cue_file_references(cue_text)
+        if Path(reference).suffix.lower() in DISC_HELPER_EXTENSIONS
+    ]
+
+
+def _scan_directory_items(
+    directory: Path,
+    files: list[os.DirEntry],
+    system_path: Path,
+    system_folder: str,
+    previous_items: list[dict[str, Any]] | None = None,
+) -> tuple[list[dict[str, Any]], list[str]]:
+    items: list[dict[str, Any]] = []
+    cue_references: list[str] = []
+    previous_zips = {
+        item["name"]: item
+        for item in previous_items or []
+        if isinstance(item, dict) and "zip" in item and item.get("stamp")
+    }
 
-        if _is_inside_media_folder(path, system_path):
+    for entry in files:
+        name = entry.name
+        path = directory / name
+        suffix = path.suffix.lower()
+
+        if name == GAMELIST_FILENAME or name.lower() == "media":
             continue
 
-        if path.suffix.lower() == ".zip":
+        if suffix == ".cue":
+            cue_references.extend(_read_cue_helper_references(path))
+
+        if suffix == ".zip":
+            stamp = _file_stamp(entry)
+            previous = previous_zips.get(name)
+            # Only the zips that were themselves rewritten are opened again.
+            if stamp and previous and previous["stamp"] == stamp:
+                items.append(previous)
+                continue
             zip_roms = _scan_zip_contents(path, system_path, system_folder)
             if zip_roms:
-                if callable(completed_checker):
-                    zip_roms = [
-                        rom
-                        for rom in zip_roms
-                        if not completed_checker(
-                            rom.relative_path,
-                            rom.filename,
-                            rom.path,
-                            rom.zip_inner_path,
-                        )
-                    ]
-
-                if zip_roms:
-                    roms.extend(zip_roms)
+                items.append(
+                    {"name": name, "stamp": stamp, "zip": [[rom.zip_inner_path, rom.size] for rom in zip_roms]}
+                )
                 continue
 
         if not is_supported_rom(system_folder, path):
             continue
 
-        if path.suffix.lower() in DISC_HELPER_EXTENSIONS:
-            if _normalize_local_path(path) in referenced_disc_helpers or _has_matching_cue(path):
-                continue
+        try:
+            # DirEntry caches the stat result, and on Windows it comes free with the directory listing.
+            size = entry.stat().st_size
+        except Exception:
+            size = 0
+
+        item = {"name": name, "size": size}
+        if suffix in DISC_HELPER_EXTENSIONS:
+            item["helper"] = True
+            item["cue"] = _has_matching_cue(path)
+        items.append(item)
+
+    return items, cue_references
+
+
+def _roms_from_directory_items(
+    directory: Path,
+    items: list[dict[str, Any]],
+    system_path: Path,
+    referenced_disc_helpers: set[str],
+    completed_checker=None,
+) -> list[ZapScraperRom]:
+    roms: list[ZapScraperRom] = []
 
+    for item in items:
+        path = directory / item["name"]
         relative_path = to_recalbox_relative_path(path, system_path)
 
+        if "zip" in item:
+            for inner_name, size in item["zip"]:
+                inner_path = Path(inner_name)
+                if callable(completed_checker) and completed_checker(
+                    relative_path,
+                    inner_path.name,
+                    path,
+                    inner_name,
+                ):
+                    continue
+                roms.append(
+                    ZapScraperRom(
+                        path=path,
+                        relative_path=relative_path,
+                        filename=inner_path.name,
+                        stem=inner_path.stem,
+                        size=int(size),
+                        zip_inner_path=inner_name,
+                    )
+                )
+            continue
+
+        if item.get("helper"):
+            if item.get("cue") or _normalize_local_path(path) in referenced_disc_helpers:
+                continue
+
         if callable(completed_checker) and completed_checker(
             relative_path,
             path.name,
@@ -1064,30 +1305,106 @@ def scan_system_folder(
         ):
             continue
 
-        try:
-            size = path.stat().st_size
-        except Exception:
-            size = 0
-
         roms.append(
             ZapScraperRom(
                 path=path,
                 relative_path=relative_path,
                 filename=path.name,
                 stem=path.stem,
-                size=size,
+                size=int(item.get("size") or 0),
             )
         )
 
-        if callable(progress_callback) and len(roms) % 25 == 0:
-            total_games_found = games_found_before + len(roms)
-            label = system_label or system_folder
+    return roms
+
+
+def scan_system_folder(
+    system_path: Path,
+    system_folder: str,
+    progress_callback=None,
+    stop_checker=None,
+    system_index: int = 0,
+    system_total: int = 0,
+    games_found_before: int = 0,
+    system_label: str = "",
+    completed_checker=None,
+    directory_snapshots: dict[str, Any] | None = None,
+) -> list[ZapScraperRom]:
+    roms: list[ZapScraperRom] = []
+    directories: list[tuple[Path, list[dict[str, Any]]]] = []
+    previous_snapshots = dict(directory_snapshots or {})
+    fresh_snapshots: dict[str, Any] = {}
+    checked_files = 0
+    found_games = 0
+    next_report = 1
+    label = system_label or system_folder
+    referenced_disc_helpers: set[str] = set()
+
+    for directory, mtime, names, files in _iter_system_directories(system_path, stop_checker):
+        relative_directory = directory.relative_to(system_path).as_posix()
+        fingerprint = _directory_fingerprint(names, files)
+        previous = previous_snapshots.get(relative_directory)
+
+        # A folder is reused only when both its mtime and its entries are unchanged, because
+        # exFAT/FAT32 volumes do not always bump folder mtimes when files are added or removed.
+        if (
+            isinstance(previous, dict)
+            and previous.get("mtime") == mtime
+            and previous.get("names") == fingerprint
+            and isinstance(previous.get("items"), list)
+            and isinstance(previous.get("cues"), list)
+        ):
+            items = previous["items"]
+            cue_references = previous["cues"]
+        else:
+            items, cue_references = _scan_directory_items(
+                directory,
+                files,
+                system_path,
+                system_folder,
+                previous.get("items") if isinstance(previous, dict) else None,
+            )
+
+        fresh_snapshots[relative_directory] = {
+            "mtime": mtime,
+            "names": fingerprint,
+            "items": items,
+            "cues": cue_references,
+        }
+        directories.append((directory, items))
+        referenced_disc_helpers.update(
+            _normalize_local_path(directory.joinpath(*reference.split("/")))
+            for reference in cue_references
+        )
+        checked_files += len(files)
+        found_games += sum(len(item["zip"]) if "zip" in item else 1 for item in items)
+
+        if callable(progress_callback) and checked_files >= next_report:
+            next_report = checked_files + 250
             progress_callback(
-                f"Scanning {label}: {len(roms)} games found...",
+                f"Scanning {label}: {found_games} games found, {checked_files} files checked...",
                 system_index,
                 system_total,
-                total_games_found,
+                games_found_before + found_games,
+            )
+
+    if callable(stop_checker) and stop_checker():
+        return roms
+
+    for directory, items in directories:
+        roms.extend(
+            _roms_from_directory_items(
+                directory,
+                items,
+                system_path,
+                referenced_disc_helpers,
+                completed_checker=completed_checker,
             )
+        )
+
+    if directory_snapshots is not None:
+        directory_snapshots.clear()
+        directory_snapshots.update(fresh_snapshots)
 
     roms.sort(key=lambda item: item.relative_path.lower())
     return roms
@@ -1347,25 +1664,6 @@ def _normalize_local_path(path: Path) -> str:
         return str(path).replace("\\", "/").casefold()
 
 
-def _cue_referenced_local_paths(system_path: Path) -> set[str]:
-    referenced: set[str] = set()
-    for cue_path in system_path.rglob("*"):
-        if not cue_path.is_file() or cue_path.suffix.lower() != ".cue":
-            continue
-        if _is_inside_media_folder(cue_path, system_path):
-            continue
-        try:
-            cue_text = cue_path.read_text(encoding="utf-8-sig", errors="replace")
-        except Exception:
-            continue
-        for reference in _cue_file_references(cue_text):
-            if Path(reference).suffix.lower() not in DISC_HELPER_EXTENSIONS:
-                continue
-            reference_path = cue_path.parent.joinpath(*reference.split("/"))
-            referenced.add(_normalize_local_path(reference_path))
-    return referenced
-
-
 def to_recalbox_relative_path(path: Path, system_path: Path) -> str:
     try:
         rel = path.relative_to(system_path)
@@ -1406,32 +1704,78 @@ def detect_region_from_filename(filename: str, selected_region: str = "Auto") ->
     return "auto"
 
 
+def _replay_zapscraper_cache_journal(journal_path: Path, data: dict[str, Any]):
+    try:
+        handle = journal_path.open("r", encoding="utf-8")
+    except OSError:
+        return
+
+    with handle:
+        for line in handle:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                # An interrupted append can leave a torn last line; everything before it is still valid.
+                continue
+
+            if not isinstance(record, dict) or not isinstance(record.get("path"), str):
+                continue
+
+            entry = record.get("entry")
+            if isinstance(entry, dict):
+                data[record["path"]] = entry
+            else:
+                data.pop(record["path"], None)
+
+
 def load_zapscraper_cache(system_path: str | Path) -> dict[str, Any]:
     cache_path = Path(system_path) / CACHE_FILENAME
+    data: dict[str, Any] = {}
 
-    if not cache_path.exists():
-        return {}
-
-    try:
-        with cache_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except Exception:
-        return {}
+    if cache_path.exists():
+        try:
+            with cache_path.open("r", encoding="utf-8") as handle:
+                data = json.load(handle)
+        except Exception:
+            data = {}
 
     if not isinstance(data, dict):
-        return {}
+        data = {}
 
+    _replay_zapscraper_cache_journal(Path(system_path) / CACHE_JOURNAL_FILENAME, data)
     return data
 
 
+def append_zapscraper_cache_entries(system_path: str | Path, cache: dict[str, Any], keys, stop_checker=None):
+    _check_stopped(stop_checker)
+    lines = [
+        json.dumps({"path": key, "entry": cache.get(key)}, ensure_ascii=False) + "\n"
+        for key in dict.fromkeys(keys)
+        if key
+    ]
+
+    if not lines:
+        return
+
+    try:
+        with (Path(system_path) / CACHE_JOURNAL_FILENAME).open("a", encoding="utf-8") as handle:
+            handle.writelines(lines)
+    except Exception:
+        pass
+
+
 def save_zapscraper_cache(system_path: str | Path, cache: dict[str, Any], stop_checker=None):
     _check_stopped(stop_checker)
     cache_path = Path(system_path) / CACHE_FILENAME
 
     try:
         _check_stopped(stop_checker)
-        with cache_path.open("w", encoding="utf-8") as handle:
+        temp_path = cache_path.with_name(cache_path.name + ".tmp")
+        with temp_path.open("w", encoding="utf-8") as handle:
             json.dump(cache, handle, indent=2, ensure_ascii=False)
+        os.replace(temp_path, cache_path)
+        # The full file now holds every journaled change, so the journal can go.
+        (Path(system_path) / CACHE_JOURNAL_FILENAME).unlink(missing_ok=True)
         _check_stopped(stop_checker)
     except InterruptedError:
         raise
@@ -1469,6 +1813,7 @@ def clear_scrape_output_for_system(
 
     _remove_path_safely(system_path / GAMELIST_FILENAME, log_callback=log_callback)
     _remove_path_safely(system_path / CACHE_FILENAME, log_callback=log_callback)
+    _remove_path_safely(system_path / CACHE_JOURNAL_FILENAME, log_callback=log_callback)
 
     media_folders: set[str] = set()
 
@@ -1505,15 +1850,7 @@ def load_gamelist(system_path: str | Path) -> ET.ElementTree:
     return ET.ElementTree(root)
 
 
-def _sort_gamelist_entries(root: ET.Element):
-    games = list(root.findall("game"))
-
-    if not games:
-        return
-
-    for game in games:
-        root.remove(game)
-
+def _sorted_gamelist_entries(games: list[ET.Element]) -> list[ET.Element]:
     parents: list[ET.Element] = []
     orphans: list[ET.Element] = []
     children_by_parent: dict[str, list[ET.Element]] = {}
@@ -1531,54 +1868,19 @@ def _sort_gamelist_entries(root: ET.Element):
 
     parents.sort(key=lambda item: (str(item.get("id") or "").lower(), _child_text(item, "name").lower()))
 
-    used_child_ids: set[int] = set()
+    ordered: list[ET.Element] = []
 
     for parent in parents:
-        root.append(parent)
-        parent_id = str(parent.get("id") or "").strip()
-        children = children_by_parent.get(parent_id, [])
-
-        for child in sorted(children, key=lambda item: (_child_text(item, "path") or "").lower()):
-            root.append(child)
-            used_child_ids.add(id(child))
-
-    unmatched_children = [
-        child
-        for children in children_by_parent.values()
-        for child in children
-        if id(child) not in used_child_ids
-    ]
-
-    for child in sorted(unmatched_children, key=lambda item: (_child_text(item, "path") or "").lower()):
-        root.append(child)
-
-    for orphan in sorted(orphans, key=lambda item: (_child_text(item, "path") or _child_text(item, "name") or "").lower()):
-        root.append(orphan)
-
-
-def save_gamelist(system_path: str | Path, tree: ET.ElementTree, log_callback=None, stop_checker=None):
-    _check_stopped(stop_checker)
-    gamelist_path = Path(system_path) / GAMELIST_FILENAME
-    root = tree.getroot()
-    game_count = len(root.findall("game"))
-
-    _log(log_callback, f"Sorting gamelist entries ({game_count} entries)...")
-    _check_stopped(stop_checker)
-    _sort_gamelist_entries(root)
-
-    _log(log_callback, "Indenting gamelist XML...")
-    _check_stopped(stop_checker)
-    indent_xml(root)
-
-    _log(log_callback, "Writing gamelist.xml...")
-    _check_stopped(stop_checker)
-    tree.write(
-        gamelist_path,
-        encoding="utf-8",
-        xml_declaration=True,
+        ordered.append(parent)
+        children = children_by_parent.pop(str(parent.get("id") or "").strip(), [])
+        ordered.extend(sorted(children, key=lambda item: (_child_text(item, "path") or "").lower()))
+
+    unmatched_children = [child for children in children_by_parent.values() for child in children]
+    ordered.extend(sorted(unmatched_children, key=lambda item: (_child_text(item, "path") or "").lower()))
+    ordered.extend(
+        sorted(orphans, key=lambda item: (_child_text(item, "path") or _child_text(item, "name") or "").lower())
     )
-    _check_stopped(stop_checker)
-    _log(log_callback, "gamelist.xml saved.")
+    return ordered
 
 
 def indent_xml(element: ET.Element, level: int = 0):
@@ -1600,71 +1902,283 @@ def indent_xml(element: ET.Element, level: int = 0):
             element.tail = indent
 
 
-def get_game_entries_by_path(tree: ET.ElementTree) -> dict[str, ET.Element]:
-    root = tree.getroot()
-    entries: dict[str, ET.Element] = {}
+class GamelistDocument:
+    def __init__(self, tree: ET.ElementTree):
+        self.tree = tree
+        self.root = tree.getroot()
+        self.entries_by_path: dict[str, ET.Element] = {}
+        self.parents_by_id: dict[str, ET.Element] = {}
+        self.zaparoo_parents: dict[str, ET.Element] = {}
+        # Serialized form of each entry, reused on save until the entry is marked dirty.
+        self._serialized: dict[ET.Element, str] = {}
 
-    for game in root.findall("game"):
-        path_node = game.find("path")
+        for game in self.root.findall("game"):
+            self._index(game)
 
-        if path_node is None or not path_node.text:
-            continue
+    @classmethod
+    def load(cls, system_path: str | Path) -> "GamelistDocument":
+        return cls(load_gamelist(system_path))
 
-        entries[path_node.text.strip()] = game
+    def _index(self, game: ET.Element):
+        path_text = _child_text(game, "path")
+        if path_text:
+            self.entries_by_path[path_text] = game
 
-    return entries
+        game_id = str(game.get("id") or "").strip()
+        if not game_id:
+            return
 
+        if not game.get("parentid"):
+            self.parents_by_id[game_id] = game
+        elif self.parents_by_id.get(game_id) is game:
+            del self.parents_by_id[game_id]
 
-def game_has_metadata(game: ET.Element | None) -> bool:
-    if game is None:
-        return False
+        if game.get("id") == game_id and game.get("source") == "ZaparooCompanion":
+            self.zaparoo_parents.setdefault(game_id, game)
 
-    meaningful_fields = [
-        "name",
-        "desc",
-        "developer",
-        "publisher",
-        "genre",
-        "releasedate",
-        "players",
-        "rating",
-    ]
+    def game_count(self) -> int:
+        return len(self.root.findall("game"))
 
-    for field_name in meaningful_fields:
-        node = game.find(field_name)
-        if node is not None and node.text and node.text.strip():
-            return True
+    def mark_dirty(self, *games: ET.Element):
+        for game in games:
+            if game is not None:
+                self._serialized.pop(game, None)
+                self._index(game)
 
-    return False
+    def _append_game(self) -> ET.Element:
+        return ET.SubElement(self.root, "game")
 
+    def get_or_create_game(self, relative_path: str) -> ET.Element:
+        game = self.entries_by_path.get(relative_path)
 
-def get_or_create_game_entry(tree: ET.ElementTree, relative_path: str) -> ET.Element:
-    entries = get_game_entries_by_path(tree)
+        if game is not None:
+            return game
 
-    if relative_path in entries:
-        return entries[relative_path]
+        game = self._append_game()
+        set_child_text(game, "path", relative_path)
+        self._index(game)
+        return game
 
-    root = tree.getroot()
-    game = ET.SubElement(root, "game")
-    set_child_text(game, "path", relative_path)
-    return game
+    def find_zaparoo_parent(self, screenscraper_id: str | int) -> ET.Element | None:
+        return self.zaparoo_parents.get(str(screenscraper_id or "").strip())
 
+    def get_or_create_zaparoo_parent(self, screenscraper_id: str | int) -> ET.Element:
+        parent = self.find_zaparoo_parent(screenscraper_id)
 
-def set_child_text(parent: ET.Element, tag: str, value: Any):
-    if value is None:
-        return
+        if parent is not None:
+            return parent
 
-    text = str(value).strip()
+        parent = self._append_game()
+        parent.set("id", str(screenscraper_id))
+        parent.set("source", "ZaparooCompanion")
+        self._index(parent)
+        return parent
 
-    if not text:
-        return
+    def get_or_create_zaparoo_child(self, relative_path: str, parent_id: str | int) -> ET.Element:
+        child = self.entries_by_path.get(relative_path)
 
-    child = parent.find(tag)
+        if child is None:
+            child = self._append_game()
+            set_child_text(child, "path", relative_path)
 
-    if child is None:
-        child = ET.SubElement(parent, tag)
+        child.set("parentid", str(parent_id))
+        child.set("source", "ZaparooCompanion")
 
-    child.text = text
+        for tag in ZAPAROO_CHILD_CLEARED_TAGS:
+            node = child.find(tag)
+            if node is not None:
+                child.remove(node)
+
+        self.mark_dirty(child)
+        return child
+
+    def _serialize(self, element: ET.Element) -> str:
+        text = self._serialized.get(element)
+
+        if text is None:
+            indent_xml(element, 1)
+            tail = element.tail
+            element.tail = None
+            text = ET.tostring(element, encoding="unicode")
+            element.tail = tail
+            self._serialized[element] = text
+
+        return text
+
+    def iter_xml(self):
+        root = self.root
+        games = root.findall("game")
+        ordered = [item for item in root if item.tag != "game"] + _sorted_gamelist_entries(games)
+        root[:] = ordered
+
+        yield "<?xml version='1.0' encoding='utf-8'?>\n"
+
+        if not ordered:
+            yield ET.tostring(root, encoding="unicode")
+            return
+
+        # Only the root tag is rebuilt here; entries come from the per-entry cache.
+        shell = ET.Element(root.tag, root.attrib)
+        shell.text = "\n"
+        opening, closing = ET.tostring(shell, encoding="unicode").split("\n", 1)
+
+        if not root.text or not root.text.strip():
+            root.text = "\n  "
+
+        yield opening
+        yield escape_xml(root.text)
+
+        last = len(ordered) - 1
+        for i, element in enumerate(ordered):
+            if not element.tail or not element.tail.strip():
+                element.tail = "\n" if i == last else "\n  "
+            yield self._serialize(element)
+            yield escape_xml(element.tail)
+
+        yield closing
+
+    def save(self, system_path: str | Path, log_callback=None, stop_checker=None):
+        _check_stopped(stop_checker)
+        gamelist_path = Path(system_path) / GAMELIST_FILENAME
+
+        _log(log_callback, f"Writing gamelist.xml ({self.game_count()} entries)...")
+        # Write next to the target and swap it in, so a crash or stop never leaves a truncated gamelist.
+        temp_path = gamelist_path.with_name(gamelist_path.name + ".tmp")
+        with temp_path.open("w", encoding="utf-8", errors="xmlcharrefreplace") as handle:
+            for chunk in self.iter_xml():
+                handle.write(chunk)
+        os.replace(temp_path, gamelist_path)
+        _check_stopped(stop_checker)
+        _log(log_callback, "gamelist.xml saved.")
+
+
+class GamelistSession:
+    def __init__(
+        self,
+        flush_interval: float = GAMELIST_FLUSH_INTERVAL_SECONDS,
+        flush_every: int = GAMELIST_FLUSH_EVERY_GAMES,
+        log_callback=None,
+    ):
+        self.flush_interval = flush_interval
+        self.flush_every = max(1, int(flush_every))
+        self.log_callback = log_callback
+        self._systems: dict[str, dict[str, Any]] = {}
+        self._pending_games = 0
+        self._last_flush = time.monotonic()
+
+    def _state(self, system_path: str | Path) -> dict[str, Any]:
+        key = str(system_path)
+        state = self._systems.get(key)
+
+        if state is None:
+            state = {
+                "path": Path(system_path),
+                "document": GamelistDocument.load(system_path),
+                "cache": load_zapscraper_cache(system_path),
+                "dirty": 0,
+                "journaled": 0,
+            }
+            self._systems[key] = state
+
+        return state
+
+    def document(self, system_path: str | Path) -> GamelistDocument:
+        return self._state(system_path)["document"]
+
+    def cache(self, system_path: str | Path) -> dict[str, Any]:
+        return self._state(system_path)["cache"]
+
+    def zaparoo_maps(self, system_path: str | Path) -> tuple[dict[str, ET.Element], dict[str, ET.Element]]:
+        document = self.document(system_path)
+        return document.entries_by_path, document.parents_by_id
+
+    def mark_dirty(self, system_path: str | Path, *games: ET.Element, cache_keys=()):
+        state = self._state(system_path)
+        state["dirty"] += 1
+        self._pending_games += 1
+
+        if cache_keys:
+            append_zapscraper_cache_entries(state["path"], state["cache"], cache_keys)
+            state["journaled"] += 1
+
+        state["document"].mark_dirty(*games)
+
+    def maybe_flush(self):
+        if not self._pending_games:
+            return
+
+        elapsed = time.monotonic() - self._last_flush
+        if self._pending_games >= self.flush_every or elapsed >= self.flush_interval:
+            self.flush()
+
+    def flush(self, compact: bool = False):
+        for state in self._systems.values():
+            if compact and state["journaled"]:
+                save_zapscraper_cache(state["path"], state["cache"])
+                state["journaled"] = 0
+
+            if not state["dirty"]:
+                continue
+
+            system_path = state["path"]
+            game_count = state["document"].game_count()
+            _log(
+                self.log_callback,
+                f"Saving gamelist.xml for {system_path.name} ({state['dirty']} updated, {game_count} entries)...",
+            )
+
+            try:
+                state["document"].save(system_path)
+                state["dirty"] = 0
+            except Exception as e:
+                _log(self.log_callback, f"Could not save gamelist.xml for {system_path.name}: {e}")
+
+        self._pending_games = sum(state["dirty"] for state in self._systems.values())
+        self._last_flush = time.monotonic()
+
+
+def get_game_entries_by_path(tree: ET.ElementTree) -> dict[str, ET.Element]:
+    return GamelistDocument(tree).entries_by_path
+
+
+def game_has_metadata(game: ET.Element | None) -> bool:
+    if game is None:
+        return False
+
+    meaningful_fields = [
+        "name",
+        "desc",
+        "developer",
+        "publisher",
+        "genre",
+        "releasedate",
+        "players",
+        "rating",
+    ]
+
+    for field_name in meaningful_fields:
+        node = game.find(field_name)
+        if node is not None and node.text and node.text.strip():
+            return True
+
+    return False
+
+
+def set_child_text(parent: ET.Element, tag: str, value: Any):
+    if value is None:
+        return
+
+    text = str(value).strip()
+
+    if not text:
+        return
+
+    child = parent.find(tag)
+
+    if child is None:
+        child = ET.SubElement(parent, tag)
+
+    child.text = text
 
 
 def update_game_metadata(
@@ -1954,20 +2468,8 @@ def _zaparoo_parent_from_child(
 
 
 def _zaparoo_parent_maps(tree: ET.ElementTree) -> tuple[dict[str, ET.Element], dict[str, ET.Element]]:
-    root = tree.getroot()
-    children_by_path: dict[str, ET.Element] = {}
-    parents_by_id: dict[str, ET.Element] = {}
-
-    for game in root.findall("game"):
-        game_id = str(game.get("id") or "").strip()
-        if game_id and not game.get("parentid"):
-            parents_by_id[game_id] = game
-
-        path_text = _child_text(game, "path")
-        if path_text:
-            children_by_path[path_text] = game
-
-    return children_by_path, parents_by_id
+    document = GamelistDocument(tree)
+    return document.entries_by_path, document.parents_by_id
 
 
 def _zaparoo_action_already_complete(
@@ -2267,14 +2769,14 @@ def plan_scrape_actions(
 ) -> list[dict[str, Any]]:
     output_format = normalize_output_format(output_format)
     system_path = Path(system["path"])
-    tree = load_gamelist(system_path)
-    entries = get_game_entries_by_path(tree)
+    document = GamelistDocument.load(system_path)
+    entries = document.entries_by_path
     cache = load_zapscraper_cache(system_path)
     zaparoo_children_by_path: dict[str, ET.Element] = {}
     zaparoo_parents_by_id: dict[str, ET.Element] = {}
 
     if _is_zaparoo_format(output_format):
-        zaparoo_children_by_path, zaparoo_parents_by_id = _zaparoo_parent_maps(tree)
+        zaparoo_children_by_path, zaparoo_parents_by_id = document.entries_by_path, document.parents_by_id
 
     actions = []
 
@@ -2396,15 +2898,20 @@ def apply_scrape_result(
     log_callback=None,
     stop_checker=None,
     crt_mode: bool = False,
+    gamelist_session: GamelistSession | None = None,
 ):
     _check_stopped(stop_checker)
     system_path = Path(system_path)
-    tree = load_gamelist(system_path)
-    _check_stopped(stop_checker)
-    cache = load_zapscraper_cache(system_path)
+    if gamelist_session is not None:
+        document = gamelist_session.document(system_path)
+        cache = gamelist_session.cache(system_path)
+    else:
+        document = GamelistDocument.load(system_path)
+        _check_stopped(stop_checker)
+        cache = load_zapscraper_cache(system_path)
 
     _check_stopped(stop_checker)
-    game = get_or_create_game_entry(tree, relative_path)
+    game = document.get_or_create_game(relative_path)
 
     update_game_metadata(
         game,
@@ -2426,9 +2933,13 @@ def apply_scrape_result(
         crt_mode=crt_mode,
     )
 
+    if gamelist_session is not None:
+        gamelist_session.mark_dirty(system_path, game, cache_keys=(relative_path,))
+        return
+
     _log(log_callback, "Writing gamelist entry...")
     _check_stopped(stop_checker)
-    save_gamelist(system_path, tree, log_callback=log_callback, stop_checker=stop_checker)
+    document.save(system_path, log_callback=log_callback, stop_checker=stop_checker)
     _log(log_callback, "Saving scraper cache...")
     _check_stopped(stop_checker)
     save_zapscraper_cache(system_path, cache, stop_checker=stop_checker)
@@ -2514,7 +3025,7 @@ def _screenscraper_get_json(
     url = f"{SCREENSCRAPER_API_BASE}/{endpoint}"
 
     _check_stopped(stop_checker)
-    _wait_for_screenscraper_rate_limit()
+    _wait_for_screenscraper_rate_limit(stop_checker)
     _check_stopped(stop_checker)
 
     response = requests.get(url, params=params, timeout=_request_timeout(timeout))
@@ -2551,6 +3062,7 @@ def _screenscraper_get_json(
     quota = extract_screenscraper_quota_info(data)
     if quota:
         data["_zapscraper_quota"] = quota
+        _screenscraper_rate_limiter.update_from_quota(quota)
         if callable(quota_callback):
             quota_callback(quota)
 
@@ -2610,6 +3122,25 @@ def test_screenscraper_login(username: str, password: str, quota_callback=None)
     }
 
 
+def get_screenscraper_thread_allowance(
+    username: str,
+    password: str,
+    quota_callback=None,
+    stop_checker=None,
+) -> tuple[int, int | None]:
+    params = _common_screenscraper_params(username, password)
+    data = _screenscraper_get_json(
+        "ssuserInfos.php",
+        params,
+        quota_callback=quota_callback,
+        stop_checker=stop_checker,
+    )
+
+    quota = data.get("_zapscraper_quota") or {}
+    threads = _first_present_int(extract_user_info(data), {"maxthreads"}) or quota.get("threads") or 1
+    return max(1, int(threads)), quota.get("minute_limit")
+
+
 def extract_user_info(data: dict[str, Any]) -> dict[str, Any]:
     response = data.get("response")
 
@@ -2675,43 +3206,6 @@ def build_user_info_message(user_info: dict[str, Any], quota: dict[str, Any] | N
     return " | ".join(parts)
 
 
-def calculate_rom_hashes(path: str | Path, zip_inner_path: str = "", stop_checker=None) -> dict[str, str]:
-    _check_stopped(stop_checker)
-    path = Path(path)
-
-    crc = 0
-    md5 = hashlib.md5()
-    sha1 = hashlib.sha1()
-
-    if zip_inner_path:
-        with zipfile.ZipFile(path, "r") as zf:
-            with zf.open(zip_inner_path) as handle:
-                while True:
-                    _check_stopped(stop_checker)
-                    chunk = handle.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    crc = binascii.crc32(chunk, crc)
-                    md5.update(chunk)
-                    sha1.update(chunk)
-    else:
-        with path.open("rb") as handle:
-            while True:
-                _check_stopped(stop_checker)
-                chunk = handle.read(1024 * 1024)
-                if not chunk:
-                    break
-                crc = binascii.crc32(chunk, crc)
-                md5.update(chunk)
-                sha1.update(chunk)
-
-    return {
-        "crc": f"{crc & 0xFFFFFFFF:08X}",
-        "md5": md5.hexdigest(),
-        "sha1": sha1.hexdigest(),
-    }
-
-
 def fetch_game_info(
     *,
     username: str,
@@ -2722,6 +3216,7 @@ def fetch_game_info(
     system_id: int,
     zip_inner_path: str = "",
     skip_hashes: bool = False,
+    hash_source=None,
     quota_callback=None,
     stop_checker=None,
 ) -> dict[str, Any]:
@@ -2735,26 +3230,47 @@ def fetch_game_info(
         }
     )
 
+    hashes = None
     if not skip_hashes:
         _check_stopped(stop_checker)
-        hashes = calculate_rom_hashes(rom_path, zip_inner_path, stop_checker=stop_checker)
+        hashes = hash_source() if callable(hash_source) else None
+        if not hashes:
+            hashes = calculate_rom_hashes(rom_path, zip_inner_path, stop_checker=stop_checker)
         _check_stopped(stop_checker)
-        params.update(
-            {
-                "romtaille": str(rom_size),
-                "crc": hashes["crc"],
-                "md5": hashes["md5"],
-                "sha1": hashes["sha1"],
-            }
-        )
+        params["romtaille"] = str(rom_size)
+        _apply_hash_params(params, hashes)
 
-    return _screenscraper_get_json(
+    data = _screenscraper_get_json(
         "jeuInfos.php",
         params,
         quota_callback=quota_callback,
         stop_checker=stop_checker,
     )
 
+    if hashes and not has_strong_hashes(hashes) and callable(hash_source) and not extract_game_from_response(data):
+        # CRC-only lookups can miss where MD5/SHA1 would match, so retry once with the full set.
+        strong_hashes = hash_source(strong=True)
+        _check_stopped(stop_checker)
+        if has_strong_hashes(strong_hashes):
+            _apply_hash_params(params, strong_hashes)
+            data = _screenscraper_get_json(
+                "jeuInfos.php",
+                params,
+                quota_callback=quota_callback,
+                stop_checker=stop_checker,
+            )
+
+    return data
+
+
+def _apply_hash_params(params: dict[str, str], hashes: dict[str, Any]):
+    for key in ("crc", "md5", "sha1"):
+        value = str(hashes.get(key) or "")
+        if value:
+            params[key] = value
+        else:
+            params.pop(key, None)
+
 
 def extract_game_from_response(data: dict[str, Any]) -> dict[str, Any]:
     response = data.get("response")
@@ -3125,6 +3641,72 @@ def _encode_jpeg(image: Image.Image, quality: int) -> bytes:
     return buffer.getvalue()
 
 
+def _encode_jpeg_to_target(
+    image: Image.Image,
+    first_quality: int,
+    stop_checker=None,
+) -> tuple[bytes, bool]:
+    qualities = list(range(
+        IMAGE_COMPRESSION_START_QUALITY,
+        IMAGE_COMPRESSION_MIN_QUALITY - 1,
+        -IMAGE_COMPRESSION_QUALITY_STEP,
+    ))
+    encoded = {}
+
+    def fits(index: int) -> bool:
+        if index not in encoded:
+            _check_stopped(stop_checker)
+            encoded[index] = _encode_jpeg(image, qualities[index])
+        return len(encoded[index]) <= TARGET_IMAGE_SIZE_BYTES
+
+    last = len(qualities) - 1
+    first = qualities.index(first_quality)
+    step = 1
+
+    # Gallop away from the first guess until the answer is bracketed, then binary search the
+    # bracket for the highest quality that still fits; encoded size only grows with quality.
+    if fits(first):
+        low, high = 0, first
+        while low < high:
+            probe = max(low, high - step)
+            if not fits(probe):
+                low = probe + 1
+                break
+            high = probe
+            step *= 2
+    else:
+        # The quality range shrinks a file by less than QUALITY_SPAN, so a miss this large goes
+        # straight to the lowest quality instead of galloping through the ones in between.
+        if len(encoded[first]) > TARGET_IMAGE_SIZE_BYTES * IMAGE_COMPRESSION_QUALITY_SPAN and not fits(last):
+            return encoded[last], False
+        low = high = first
+        while not fits(high):
+            if high == last:
+                return encoded[last], False
+            low = high + 1
+            high = min(last, first + step)
+            step *= 2
+
+    while low < high:
+        middle = (low + high) // 2
+        if fits(middle):
+            high = middle
+        else:
+            low = middle + 1
+
+    return encoded[high], True
+
+
+def _draft_jpeg(image: Image.Image, scale: float) -> bool:
+    # JPEG can decode straight to 1/2, 1/4 or 1/8 scale, which skips most of the IDCT work.
+    if scale >= 1 or image.format != "JPEG":
+        return False
+
+    size = image.size
+    image.draft("RGB", (max(1, math.ceil(size[0] * scale)), max(1, math.ceil(size[1] * scale))))
+    return image.size != size
+
+
 def _compressed_image_path(target_path: Path) -> Path:
     if target_path.suffix.lower() in {".jpg", ".jpeg"}:
         return target_path.with_suffix(".jpg")
@@ -3166,6 +3748,7 @@ def _convert_image_bytes_to_crt(
 
     try:
         with Image.open(BytesIO(content)) as source_image:
+            _draft_jpeg(source_image, CRT_IMAGE_MAX_DIMENSION / float(max(1, *source_image.size)))
             source_image.load()
             _check_stopped(stop_checker)
             image = _prepare_image_for_jpeg(source_image)
@@ -3212,66 +3795,67 @@ def _compress_image_bytes(
 
     _check_stopped(stop_checker)
 
-    try:
+    def decode(draft_scale: float = 1.0) -> tuple[Image.Image, bool]:
         with Image.open(BytesIO(content)) as source_image:
+            drafted = _draft_jpeg(source_image, draft_scale)
             source_image.load()
             _check_stopped(stop_checker)
             image = _prepare_image_for_jpeg(source_image)
             image.load()
+        return image, drafted
+
+    # A JPEG this far over the target nearly always ends below half scale, so it is first decoded
+    # at half scale and only decoded in full when the half-scale image already fits.
+    probe = len(content) > TARGET_IMAGE_SIZE_BYTES * IMAGE_COMPRESSION_DRAFT_MIN_RATIO
+
+    try:
+        image, drafted = decode(0.5 if probe else 1.0)
     except InterruptedError:
         raise
     except Exception:
         return None
 
     final_path = _compressed_image_path(target_path)
-    best_data = b""
-    resize_passes = 0
-    max_resize_passes = 12
-
-    while resize_passes <= max_resize_passes:
-        _check_stopped(stop_checker)
-
-        for quality in range(
-            IMAGE_COMPRESSION_START_QUALITY,
-            IMAGE_COMPRESSION_MIN_QUALITY - 1,
-            -IMAGE_COMPRESSION_QUALITY_STEP,
-        ):
-            _check_stopped(stop_checker)
-
-            try:
-                data = _encode_jpeg(image, quality)
-            except Exception:
-                return None
-
-            best_data = data
 
+    try:
+        if drafted:
+            data = _encode_jpeg(image, IMAGE_COMPRESSION_MIN_QUALITY)
             if len(data) <= TARGET_IMAGE_SIZE_BYTES:
-                return final_path, data
+                image, drafted = decode()
 
-        width, height = image.size
-        next_width = int(width * IMAGE_COMPRESSION_RESIZE_STEP)
-        next_height = int(height * IMAGE_COMPRESSION_RESIZE_STEP)
+        if not drafted:
+            data, fits = _encode_jpeg_to_target(image, IMAGE_COMPRESSION_START_QUALITY, stop_checker)
+            if fits:
+                return final_path, data
 
-        if (
-            next_width < IMAGE_COMPRESSION_MIN_DIMENSION
-            or next_height < IMAGE_COMPRESSION_MIN_DIMENSION
-            or (next_width, next_height) == image.size
-        ):
-            break
+        base = image
+        scale = 1.0
+        width, height = base.size
+        min_scale = IMAGE_COMPRESSION_MIN_DIMENSION / float(max(1, min(width, height)))
 
-        _check_stopped(stop_checker)
+        for _resize_pass in range(IMAGE_COMPRESSION_MAX_RESIZE_PASSES):
+            # Encoded size grows roughly with pixel count, so the bytes per pixel at the lowest
+            # quality give the next guess at dimensions; the margin covers denser small images.
+            next_scale = scale * math.sqrt(TARGET_IMAGE_SIZE_BYTES / float(len(data)))
+            next_scale = max(next_scale * IMAGE_COMPRESSION_RESIZE_MARGIN, min_scale)
+            next_size = (max(1, int(round(width * next_scale))), max(1, int(round(height * next_scale))))
 
-        try:
-            image = image.resize((next_width, next_height), Image.Resampling.LANCZOS)
-        except Exception:
-            return None
+            if next_scale >= scale or next_size == image.size:
+                break
 
-        resize_passes += 1
+            _check_stopped(stop_checker)
+            image = base.resize(next_size, Image.Resampling.LANCZOS)
+            scale = next_scale
 
-    if best_data:
-        return final_path, best_data
+            data, fits = _encode_jpeg_to_target(image, IMAGE_COMPRESSION_MIN_QUALITY, stop_checker)
+            if fits:
+                return final_path, data
+    except InterruptedError:
+        raise
+    except Exception:
+        return None
 
-    return None
+    return final_path, data
 
 
 def _download_bytes(url: str, stop_checker=None) -> bytes:
@@ -3302,47 +3886,73 @@ def _download_bytes(url: str, stop_checker=None) -> bytes:
     return b"".join(chunks)
 
 
-def download_image(
-    url: str,
-    target_path: str | Path,
+def _encode_image_bytes(
+    content: bytes,
+    target_path: Path,
+    crt_mode: bool = False,
     stop_checker=None,
     log_callback=None,
     media_label: str = "media",
-    crt_mode: bool = False,
-) -> Path:
-    target_path = Path(target_path)
-    target_path.parent.mkdir(parents=True, exist_ok=True)
-
-    content = _download_bytes(url, stop_checker=stop_checker)
-    final_path = target_path
-    final_content = content
-
+) -> tuple[Path, bytes]:
     if crt_mode:
         _log(log_callback, f"Converting media for CRT Mode: {media_label}")
         converted = _convert_image_bytes_to_crt(content, target_path, stop_checker=stop_checker)
 
         if converted is not None:
-            final_path, final_content = converted
-            final_path.parent.mkdir(parents=True, exist_ok=True)
-
-            if final_path != target_path and target_path.exists():
-                try:
-                    target_path.unlink()
-                except OSError:
-                    pass
+            return converted
     elif len(content) > MAX_IMAGE_SIZE_BYTES:
         _log(log_callback, f"Compressing media: {media_label}")
         compressed = _compress_image_bytes(content, target_path, stop_checker=stop_checker)
 
         if compressed is not None:
-            final_path, final_content = compressed
-            final_path.parent.mkdir(parents=True, exist_ok=True)
+            return compressed
 
-            if final_path != target_path and target_path.exists():
-                try:
-                    target_path.unlink()
-                except OSError:
-                    pass
+    return target_path, content
+
+
+def _wait_for_future(future: Future, stop_checker=None):
+    while True:
+        _check_stopped(stop_checker)
+        try:
+            return future.result(timeout=SCRAPE_POLL_SECONDS)
+        except FutureTimeoutError:
+            continue
+
+
+def download_image(
+    url: str,
+    target_path: str | Path,
+    stop_checker=None,
+    log_callback=None,
+    media_label: str = "media",
+    crt_mode: bool = False,
+    prepared: Future | None = None,
+) -> Path:
+    target_path = Path(target_path)
+    target_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if prepared is not None:
+        # Downloaded and encoded ahead of time by the scrape pipeline.
+        final_path, final_content = _wait_for_future(prepared, stop_checker)
+    else:
+        content = _download_bytes(url, stop_checker=stop_checker)
+        final_path, final_content = _encode_image_bytes(
+            content,
+            target_path,
+            crt_mode,
+            stop_checker=stop_checker,
+            log_callback=log_callback,
+            media_label=media_label,
+        )
+
+    if final_path != target_path:
+        final_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if target_path.exists():
+            try:
+                target_path.unlink()
+            except OSError:
+                pass
 
     _check_stopped(stop_checker)
     _log(log_callback, f"Saving media: {media_label}")
@@ -3484,97 +4094,28 @@ def find_existing_zaparoo_media(
     return None
 
 
-def find_zaparoo_parent_entry(root: ET.Element, screenscraper_id: str | int) -> ET.Element | None:
-    screenscraper_id = str(screenscraper_id or "").strip()
-
-    if not screenscraper_id:
-        return None
-
-    for game in root.findall("game"):
-        if game.get("id") == screenscraper_id and game.get("source") == "ZaparooCompanion":
-            return game
-
-    return None
-
-
-def get_or_create_zaparoo_parent_entry(tree: ET.ElementTree, screenscraper_id: str | int) -> ET.Element:
-    root = tree.getroot()
-    parent = find_zaparoo_parent_entry(root, screenscraper_id)
+def update_zaparoo_parent_metadata(parent: ET.Element, metadata: dict[str, Any]):
+    parent.set("source", "ZaparooCompanion")
 
-    if parent is not None:
-        return parent
+    game_id = metadata.get("id")
+    if game_id:
+        parent.set("id", str(game_id))
 
-    parent = ET.SubElement(root, "game")
-    parent.set("id", str(screenscraper_id))
-    parent.set("source", "ZaparooCompanion")
-    return parent
+    field_map = {
+        "name": "name",
+        "description": "desc",
+        "desc": "desc",
+        "rating": "rating",
+        "releasedate": "releasedate",
+        "developer": "developer",
+        "publisher": "publisher",
+        "genre": "genre",
+        "players": "players",
+    }
 
-
-def get_or_create_zaparoo_child_entry(
-    tree: ET.ElementTree,
-    relative_path: str,
-    parent_id: str | int,
-) -> ET.Element:
-    entries = get_game_entries_by_path(tree)
-    child = entries.get(relative_path)
-
-    if child is None:
-        child = ET.SubElement(tree.getroot(), "game")
-        set_child_text(child, "path", relative_path)
-
-    child.set("parentid", str(parent_id))
-    child.set("source", "ZaparooCompanion")
-
-    for tag in (
-        "name",
-        "desc",
-        "rating",
-        "releasedate",
-        "developer",
-        "publisher",
-        "genre",
-        "players",
-        "region",
-        "lang",
-        "image",
-        "thumbnail",
-        "marquee",
-        "wheel",
-        "screenshot",
-        "titlescreen",
-        "boxart2d",
-        "boxart3d",
-        "logo",
-    ):
-        node = child.find(tag)
-        if node is not None:
-            child.remove(node)
-
-    return child
-
-
-def update_zaparoo_parent_metadata(parent: ET.Element, metadata: dict[str, Any]):
-    parent.set("source", "ZaparooCompanion")
-
-    game_id = metadata.get("id")
-    if game_id:
-        parent.set("id", str(game_id))
-
-    field_map = {
-        "name": "name",
-        "description": "desc",
-        "desc": "desc",
-        "rating": "rating",
-        "releasedate": "releasedate",
-        "developer": "developer",
-        "publisher": "publisher",
-        "genre": "genre",
-        "players": "players",
-    }
-
-    for source_key, xml_key in field_map.items():
-        if source_key in metadata:
-            set_child_text(parent, xml_key, metadata.get(source_key))
+    for source_key, xml_key in field_map.items():
+        if source_key in metadata:
+            set_child_text(parent, xml_key, metadata.get(source_key))
 
 
 def download_zaparoo_companion_media_assets(
@@ -3590,6 +4131,7 @@ def download_zaparoo_companion_media_assets(
     crt_mode: bool = False,
     cache: dict[str, Any] | None = None,
     cache_relative_path: str = "",
+    prepared_media: dict[tuple[str, str], Future] | None = None,
 ) -> dict[str, str]:
     media_source_names = normalize_zaparoo_media_source_names(media_source_names)
     downloaded: dict[str, str] = {}
@@ -3656,6 +4198,7 @@ def download_zaparoo_companion_media_assets(
                     log_callback=log_callback,
                     media_label=media_source_name,
                     crt_mode=crt_mode,
+                    prepared=(prepared_media or {}).get((media_url, str(media_path))),
                 )
                 media_relative_path = zaparoo_companion_image_relative_path(media_source_name, media_path)
             except InterruptedError:
@@ -3692,10 +4235,16 @@ def apply_zaparoo_companion_scrape_result(
     stop_checker=None,
     log_callback=None,
     crt_mode: bool = False,
+    gamelist_session: GamelistSession | None = None,
+    prepared_media: dict[tuple[str, str], Future] | None = None,
 ) -> dict[str, Any]:
     system_path = Path(system_path)
-    tree = load_gamelist(system_path)
-    cache = load_zapscraper_cache(system_path)
+    if gamelist_session is not None:
+        document = gamelist_session.document(system_path)
+        cache = gamelist_session.cache(system_path)
+    else:
+        document = GamelistDocument.load(system_path)
+        cache = load_zapscraper_cache(system_path)
 
     screenscraper_id = metadata.get("id")
 
@@ -3703,7 +4252,7 @@ def apply_zaparoo_companion_scrape_result(
         screenscraper_id = rom.get("screenscraper_id") or safe_media_filename(relative_path)
         metadata["id"] = screenscraper_id
 
-    parent = get_or_create_zaparoo_parent_entry(tree, screenscraper_id)
+    parent = document.get_or_create_zaparoo_parent(screenscraper_id)
     update_zaparoo_parent_metadata(parent, metadata)
 
     _check_stopped(stop_checker)
@@ -3719,10 +4268,11 @@ def apply_zaparoo_companion_scrape_result(
         crt_mode=crt_mode,
         cache=cache,
         cache_relative_path=relative_path,
+        prepared_media=prepared_media,
     )
 
     _check_stopped(stop_checker)
-    child = get_or_create_zaparoo_child_entry(tree, relative_path, screenscraper_id)
+    child = document.get_or_create_zaparoo_child(relative_path, screenscraper_id)
 
     rom_filename = rom.get("filename") or ""
     api_region, api_lang = _match_rom_region_lang(game, rom_filename)
@@ -3742,13 +4292,16 @@ def apply_zaparoo_companion_scrape_result(
         crt_mode=crt_mode,
     )
 
-    _log(log_callback, "Writing gamelist entry...")
-    _check_stopped(stop_checker)
-    save_gamelist(system_path, tree, log_callback=log_callback, stop_checker=stop_checker)
-    _log(log_callback, "Saving scraper cache...")
-    _check_stopped(stop_checker)
-    save_zapscraper_cache(system_path, cache, stop_checker=stop_checker)
-    _log(log_callback, "Scraper cache saved.")
+    if gamelist_session is not None:
+        gamelist_session.mark_dirty(system_path, parent, child, cache_keys=(relative_path,))
+    else:
+        _log(log_callback, "Writing gamelist entry...")
+        _check_stopped(stop_checker)
+        document.save(system_path, log_callback=log_callback, stop_checker=stop_checker)
+        _log(log_callback, "Saving scraper cache...")
+        _check_stopped(stop_checker)
+        save_zapscraper_cache(system_path, cache, stop_checker=stop_checker)
+        _log(log_callback, "Scraper cache saved.")
 
     return {
         "screenscraper_id": str(screenscraper_id),
@@ -3820,6 +4373,7 @@ def _apply_placeholder_after_request_failure(
     log_callback=None,
     reason: str = "",
     crt_mode: bool = False,
+    gamelist_session: GamelistSession | None = None,
 ) -> dict[str, Any]:
     metadata = create_placeholder_metadata_from_rom(rom, region_code)
 
@@ -3838,6 +4392,7 @@ def _apply_placeholder_after_request_failure(
             stop_checker=stop_checker,
             log_callback=log_callback,
             crt_mode=crt_mode,
+            gamelist_session=gamelist_session,
         )
 
         return {
@@ -3863,6 +4418,7 @@ def _apply_placeholder_after_request_failure(
         log_callback=log_callback,
         stop_checker=stop_checker,
         crt_mode=crt_mode,
+        gamelist_session=gamelist_session,
     )
 
     return {
@@ -3874,6 +4430,23 @@ def _apply_placeholder_after_request_failure(
     }
 
 
+def _action_region_code(rom_filename: str, selected_region: str, output_format: str) -> str:
+    if _is_zaparoo_format(output_format):
+        region_code = get_region_code(selected_region)
+        return "us" if region_code == "auto" else region_code
+
+    return detect_region_from_filename(rom_filename, selected_region)
+
+
+def _prefetched_data(prefetched: dict[str, Any]) -> dict[str, Any]:
+    # Errors raised on the API threads are re-raised here so they get the same handling as inline requests.
+    error = prefetched.get("error")
+    if error is not None:
+        raise error
+
+    return prefetched.get("data") or {}
+
+
 def process_scrape_action(
     action: dict[str, Any],
     *,
@@ -3885,10 +4458,13 @@ def process_scrape_action(
     output_format: str = DEFAULT_OUTPUT_FORMAT,
     zaparoo_media_source_names=None,
     zaparoo_slug_map: dict[tuple[str, str], str] | None = None,
+    hash_source=None,
     quota_callback=None,
     stop_checker=None,
     log_callback=None,
     crt_mode: bool = False,
+    gamelist_session: GamelistSession | None = None,
+    prefetched: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
     rom = action.get("rom") or {}
     rom_path = Path(rom.get("path", ""))
@@ -3905,12 +4481,8 @@ def process_scrape_action(
     if not system_id:
         raise RuntimeError(f"Missing ScreenScraper system ID for {rom_filename}")
 
-    if _is_zaparoo_format(output_format):
-        region_code = get_region_code(selected_region)
-        if region_code == "auto":
-            region_code = "us"
-    else:
-        region_code = detect_region_from_filename(rom_filename, selected_region)
+    region_code = _action_region_code(rom_filename, selected_region, output_format)
+    prepared_media = (prefetched or {}).get("media") or {}
 
     zaparoo_slug_key: tuple[str, str] | None = None
     if _is_zaparoo_format(output_format) and zaparoo_slug_map is not None:
@@ -3930,6 +4502,7 @@ def process_scrape_action(
                 stop_checker=stop_checker,
                 log_callback=log_callback,
                 crt_mode=crt_mode,
+                gamelist_session=gamelist_session,
             )
             return {
                 "metadata": {"id": cached_id},
@@ -3946,18 +4519,22 @@ def process_scrape_action(
         _log(log_callback, "Searching ScreenScraper...")
 
     try:
-        data = fetch_game_info(
-            username=username,
-            password=password,
-            rom_path=rom_path,
-            rom_filename=lookup_filename,
-            rom_size=rom_size,
-            system_id=system_id,
-            zip_inner_path=rom.get("zip_inner_path", ""),
-            skip_hashes=_is_zaparoo_format(output_format) or bool(rom.get("skip_hashes")),
-            quota_callback=quota_callback,
-            stop_checker=stop_checker,
-        )
+        if prefetched is not None:
+            data = _prefetched_data(prefetched)
+        else:
+            data = fetch_game_info(
+                username=username,
+                password=password,
+                rom_path=rom_path,
+                rom_filename=lookup_filename,
+                rom_size=rom_size,
+                system_id=system_id,
+                zip_inner_path=rom.get("zip_inner_path", ""),
+                skip_hashes=_is_zaparoo_format(output_format) or bool(rom.get("skip_hashes")),
+                hash_source=hash_source,
+                quota_callback=quota_callback,
+                stop_checker=stop_checker,
+            )
     except InterruptedError:
         raise
     except ScreenScraperQuotaError:
@@ -3976,6 +4553,7 @@ def process_scrape_action(
             log_callback=log_callback,
             reason=f"ScreenScraper request timed out or connection stalled ({e})",
             crt_mode=crt_mode,
+            gamelist_session=gamelist_session,
         )
     except requests.exceptions.RequestException as e:
         return _apply_placeholder_after_request_failure(
@@ -3991,6 +4569,7 @@ def process_scrape_action(
             log_callback=log_callback,
             reason=f"ScreenScraper request failed ({e})",
             crt_mode=crt_mode,
+            gamelist_session=gamelist_session,
         )
 
     if not data:
@@ -4007,6 +4586,7 @@ def process_scrape_action(
             log_callback=log_callback,
             reason="game not found on ScreenScraper",
             crt_mode=crt_mode,
+            gamelist_session=gamelist_session,
         )
 
     game = extract_game_from_response(data)
@@ -4031,6 +4611,8 @@ def process_scrape_action(
             stop_checker=stop_checker,
             log_callback=log_callback,
             crt_mode=crt_mode,
+            gamelist_session=gamelist_session,
+            prepared_media=prepared_media,
         )
 
         if zaparoo_slug_key is not None:
@@ -4072,6 +4654,7 @@ def process_scrape_action(
                     log_callback=log_callback,
                     media_label=image_source_name,
                     crt_mode=crt_mode,
+                    prepared=prepared_media.get((image_url, str(image_path))),
                 )
                 image_relative_path = recalbox_image_relative_path(image_source_name, image_path)
             except InterruptedError:
@@ -4099,6 +4682,7 @@ def process_scrape_action(
         log_callback=log_callback,
         stop_checker=stop_checker,
         crt_mode=crt_mode,
+        gamelist_session=gamelist_session,
     )
 
     return {
@@ -4110,6 +4694,274 @@ def process_scrape_action(
 
 
 
+def _copy_future_outcome(target: Future, source: Future):
+    if source.cancelled():
+        target.cancel()
+        return
+
+    error = source.exception()
+    if error is not None:
+        target.set_exception(error)
+    else:
+        target.set_result(source.result())
+
+
+class ScrapePipeline:
+    # Stages: ROM hashes (RomHashPool) -> API lookups -> media downloads -> image encodes.
+    # Results are committed to the gamelist in order by the caller; only API lookups are
+    # submitted ahead, in a window of a few per thread, which bounds everything behind them.
+    def __init__(self, count: int, fetch, *, wants_fetch=None, api_threads: int = 1, stop_checker=None):
+        self.count = count
+        self.fetch = fetch
+        self.wants_fetch = wants_fetch
+        self.api_threads = max(1, min(int(api_threads or 1), SCRAPE_MAX_API_THREADS))
+        self.lookahead = self.api_threads * SCRAPE_LOOKAHEAD_PER_THREAD
+        self.stop_checker = stop_checker
+        self.error: Exception | None = None
+        self._halted = threading.Event()
+        self._closed = threading.Event()
+        self._futures: dict[int, Future] = {}
+        self._media: dict[tuple[str, str], Future] = {}
+        self._media_lock = threading.Lock()
+        self._next_index = 0
+        self._api = None
+        self._downloads = None
+        self._encoders = None
+
+    def stopped(self) -> bool:
+        return self._halted.is_set() or self._media_stopped()
+
+    def _media_stopped(self) -> bool:
+        # A quota halt only stops new lookups; media for games already found still completes.
+        return self._closed.is_set() or (callable(self.stop_checker) and self.stop_checker())
+
+    def start(self):
+        if self._api is not None:
+            return
+
+        self._api = ThreadPoolExecutor(max_workers=self.api_threads, thread_name_prefix="zapscraper-api")
+        self._downloads = ThreadPoolExecutor(max_workers=SCRAPE_MEDIA_WORKERS, thread_name_prefix="zapscraper-media")
+        self._encoders = ThreadPoolExecutor(
+            max_workers=max(1, min(os.cpu_count() or 1, SCRAPE_MAX_ENCODE_WORKERS)),
+            thread_name_prefix="zapscraper-encode",
+        )
+
+    def halt(self, error: Exception | None = None):
+        if error is not None and self.error is None:
+            self.error = error
+        self._halted.set()
+
+    def _run(self, index: int) -> dict[str, Any] | None:
+        try:
+            return self.fetch(index, self)
+        except ScreenScraperQuotaError as e:
+            # Stop every other API thread before it spends more of the quota.
+            self.halt(e)
+            raise
+
+    def _fill(self, index: int):
+        limit = min(self.count, index + self.lookahead + 1)
+
+        while self._next_index < limit and not self._halted.is_set():
+            next_index = self._next_index
+            self._next_index += 1
+
+            if callable(self.wants_fetch) and not self.wants_fetch(next_index):
+                continue
+
+            self._futures[next_index] = self._api.submit(self._run, next_index)
+
+    def result(self, index: int) -> dict[str, Any] | None:
+        if self._api is None:
+            return None
+
+        self._fill(index)
+        future = self._futures.pop(index, None)
+
+        if future is None:
+            return {"error": self.error} if self.error is not None else None
+
+        try:
+            return _wait_for_future(future, self.stop_checker)
+        except InterruptedError:
+            if self.error is None:
+                raise
+            return {"error": self.error}
+        except Exception as e:
+            return {"error": e}
+
+    def discard(self, index: int):
+        future = self._futures.pop(index, None)
+        if future is not None:
+            future.cancel()
+
+    def prepare_media(self, url: str, target_path: Path, crt_mode: bool = False) -> Future:
+        key = (url, str(target_path))
+
+        with self._media_lock:
+            prepared = self._media.get(key)
+            if prepared is None:
+                prepared = Future()
+                self._media[key] = prepared
+                download = self._downloads.submit(_download_bytes, url, self._media_stopped)
+                download.add_done_callback(partial(self._encode_media, prepared, target_path, crt_mode))
+
+        return prepared
+
+    def _encode_media(self, prepared: Future, target_path: Path, crt_mode: bool, download: Future):
+        try:
+            encode = self._encoders.submit(
+                _encode_image_bytes,
+                download.result(),
+                target_path,
+                crt_mode,
+                self._media_stopped,
+            )
+        except Exception as e:
+            prepared.set_exception(e)
+            return
+
+        encode.add_done_callback(partial(_copy_future_outcome, prepared))
+
+    def release(self, prefetched: dict[str, Any] | None):
+        with self._media_lock:
+            for key, prepared in ((prefetched or {}).get("media") or {}).items():
+                if self._media.get(key) is prepared:
+                    del self._media[key]
+
+    def close(self):
+        self._closed.set()
+
+        for future in self._futures.values():
+            future.cancel()
+        self._futures.clear()
+
+        with self._media_lock:
+            self._media.clear()
+
+        # In-flight requests notice the halt at their next stop check; nothing waits for them here.
+        for executor in (self._api, self._downloads, self._encoders):
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+        self._api = self._downloads = self._encoders = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _action_media_targets(
+    action: dict[str, Any],
+    game: dict[str, Any],
+    region_code: str,
+    *,
+    image_source_name: str,
+    output_format: str,
+    zaparoo_media_source_names=None,
+):
+    system_path = action.get("system_path")
+    rom = action.get("rom") or {}
+    rom_filename = rom.get("filename") or Path(rom.get("path", "")).name
+
+    if _is_zaparoo_format(output_format):
+        game_name = str(extract_metadata_from_game(game, region_code=region_code).get("name") or "")
+
+        for media_source_name in normalize_zaparoo_media_source_names(zaparoo_media_source_names):
+            media_type = get_zaparoo_companion_media_type(media_source_name)
+
+            if not media_type or not get_zaparoo_companion_media_node(media_source_name):
+                continue
+
+            if find_existing_zaparoo_media(system_path, game_name, media_source_name):
+                continue
+
+            media_url = select_media_url_by_media_type(game, media_type=media_type, region_code=region_code)
+            if media_url:
+                media_path, _relative = build_zaparoo_companion_media_path(
+                    system_path,
+                    game_name,
+                    media_source_name,
+                    extension=guess_image_extension(media_url),
+                )
+                yield media_url, media_path
+
+    elif action.get("needs_image"):
+        image_url = select_media_url(game, image_source_name=image_source_name, region_code=region_code)
+        if image_url:
+            image_path, _relative = build_local_image_path(
+                system_path,
+                rom_filename,
+                image_source_name,
+                extension=guess_image_extension(image_url),
+            )
+            yield image_url, image_path
+
+
+def _prefetch_scrape_action(
+    action: dict[str, Any],
+    *,
+    pipeline: ScrapePipeline,
+    username: str,
+    password: str,
+    image_source_name: str,
+    selected_region: str,
+    output_format: str,
+    zaparoo_media_source_names=None,
+    hash_source=None,
+    quota_callback=None,
+    crt_mode: bool = False,
+) -> dict[str, Any] | None:
+    rom = action.get("rom") or {}
+    rom_path = Path(rom.get("path", ""))
+    rom_filename = rom.get("filename") or rom_path.name
+    system_id = int(action.get("screenscraper_system_id") or 0)
+
+    # Invalid actions fail with their usual message when committed inline.
+    if not system_id or not rom_path.exists():
+        return None
+
+    data = fetch_game_info(
+        username=username,
+        password=password,
+        rom_path=rom_path,
+        rom_filename=str(rom.get("scraper_lookup_name") or "").strip() or rom_filename,
+        rom_size=int(rom.get("size") or 0),
+        system_id=system_id,
+        zip_inner_path=rom.get("zip_inner_path", ""),
+        skip_hashes=_is_zaparoo_format(output_format) or bool(rom.get("skip_hashes")),
+        hash_source=hash_source,
+        quota_callback=quota_callback,
+        stop_checker=pipeline.stopped,
+    )
+
+    media: dict[tuple[str, str], Future] = {}
+    game = extract_game_from_response(data) if data else {}
+
+    if game:
+        try:
+            targets = list(
+                _action_media_targets(
+                    action,
+                    game,
+                    _action_region_code(rom_filename, selected_region, output_format),
+                    image_source_name=image_source_name,
+                    output_format=output_format,
+                    zaparoo_media_source_names=zaparoo_media_source_names,
+                )
+            )
+        except Exception:
+            targets = []
+
+        for url, target_path in targets:
+            media[(url, str(target_path))] = pipeline.prepare_media(url, target_path, crt_mode)
+
+    return {"data": data, "media": media}
+
+
 def run_scrape_actions(
     actions: list[dict[str, Any]],
     *,
@@ -4125,67 +4977,70 @@ def run_scrape_actions(
     quota_callback=None,
     stop_checker=None,
     crt_mode: bool = False,
+    hash_policy: str = DEFAULT_HASH_POLICY,
+    max_threads: int | None = None,
 ):
     output_format = normalize_output_format(output_format)
+    requests_per_minute = None
 
-    slug_map: dict[tuple[str, str], str] = {}
+    if not max_threads:
+        try:
+            max_threads, requests_per_minute = get_screenscraper_thread_allowance(
+                username,
+                password,
+                quota_callback=quota_callback,
+                stop_checker=stop_checker,
+            )
+        except Exception as e:
+            _log(log_callback, f"Could not read the ScreenScraper thread allowance, using 1 thread: {e}")
+            max_threads = 1
 
-    total = len(actions)
-    zaparoo_existing_cache: dict[str, tuple[dict[str, ET.Element], dict[str, ET.Element]]] = {}
+    api_threads = max(1, min(int(max_threads), SCRAPE_MAX_API_THREADS))
+    _screenscraper_rate_limiter.configure(api_threads, requests_per_minute)
+    requests_label = f"ScreenScraper requests use {api_threads} thread(s) and are rate-limited."
+
+    hash_caches: dict[str, RomHashCache] = {}
+    hash_entries = [
+        _action_hash_entry(action, output_format, hash_caches, hash_policy)
+        for action in actions
+    ]
+    hash_pool = RomHashPool(
+        [
+            (entry["path"], entry["zip_inner_path"], entry["strong"])
+            if entry and not entry.get("hashes")
+            else None
+            for entry in hash_entries
+        ],
+        stop_checker=stop_checker,
+    )
 
     if callable(log_callback):
         if _is_zaparoo_format(output_format):
             media_names = normalize_zaparoo_media_source_names(zaparoo_media_source_names)
             label = "Zaparoo Companion"
-            log_callback(
-                f"Output format: {label}. "
-                f"Media: {', '.join(media_names)}. Requests are single-threaded and rate-limited."
-            )
+            log_callback(f"Output format: {label}. Media: {', '.join(media_names)}. {requests_label}")
         else:
-            log_callback("Output format: Recalbox Compatible. ScreenScraper requests are single-threaded and rate-limited.")
-
-    for index, action in enumerate(actions, start=1):
-        if callable(stop_checker) and stop_checker():
-            if callable(log_callback):
-                log_callback("Scrape stopped by user.")
-            break
+            log_callback(f"Output format: Recalbox Compatible. {requests_label}")
 
-        rom = action.get("rom") or {}
-        rom_filename = rom.get("filename") or Path(rom.get("path", "")).name
-        system_label = action.get("system_label") or action.get("system_folder") or "Unknown"
+    if hash_caches and callable(log_callback):
+        hits = sum(cache.hits for cache in hash_caches.values())
+        misses = sum(cache.misses for cache in hash_caches.values())
+        log_callback(f"ROM hash cache: {hits} hit(s), {misses} miss(es).")
 
-        if callable(log_callback):
-            log_callback(f"[{index}/{total}] {system_label}: {rom_filename}")
+    gamelist_session = GamelistSession(log_callback=log_callback)
 
-        if _is_zaparoo_format(output_format):
-            system_path = str(action.get("system_path") or "")
-            if system_path not in zaparoo_existing_cache:
-                try:
-                    tree = load_gamelist(system_path)
-                    zaparoo_existing_cache[system_path] = _zaparoo_parent_maps(tree)
-                except Exception:
-                    zaparoo_existing_cache[system_path] = ({}, {})
-
-            children_by_path, parents_by_id = zaparoo_existing_cache.get(system_path, ({}, {}))
-            if _zaparoo_action_already_complete(
-                action,
-                children_by_path=children_by_path,
-                parents_by_id=parents_by_id,
-                media_source_names=zaparoo_media_source_names,
-                skip_existing_metadata=skip_existing_metadata,
-                cache=load_zapscraper_cache(system_path),
-                crt_mode=crt_mode,
-            ):
-                if callable(log_callback):
-                    log_callback(f"Skipped: {rom_filename} - metadata and selected media already exist.")
-                if callable(progress_callback):
-                    progress_callback(index, total, rom_filename)
-                continue
-
-        result = {}
-        try:
-            result = process_scrape_action(
-                action,
+    try:
+        with hash_pool:
+            if hash_pool.active and callable(log_callback):
+                log_callback(f"ROM hashing runs ahead in {hash_pool.workers} background processes.")
+
+            _run_scrape_action_loop(
+                actions,
+                gamelist_session=gamelist_session,
+                hash_source_for=lambda index, checker: partial(
+                    _resolve_action_hashes, hash_pool, hash_entries[index], index, checker
+                ),
+                api_threads=api_threads,
                 username=username,
                 password=password,
                 image_source_name=image_source_name,
@@ -4193,75 +5048,307 @@ def run_scrape_actions(
                 skip_existing_metadata=skip_existing_metadata,
                 output_format=output_format,
                 zaparoo_media_source_names=zaparoo_media_source_names,
-                zaparoo_slug_map=slug_map if _is_zaparoo_format(output_format) else None,
+                progress_callback=progress_callback,
+                log_callback=log_callback,
                 quota_callback=quota_callback,
                 stop_checker=stop_checker,
-                log_callback=log_callback,
                 crt_mode=crt_mode,
             )
+    finally:
+        # Runs on completion, stop, quota errors and crashes alike, so finished games are never lost.
+        gamelist_session.flush(compact=True)
 
-            if _is_zaparoo_format(output_format):
-                system_path = str(action.get("system_path") or "")
-                if system_path in zaparoo_existing_cache:
-                    try:
-                        tree = load_gamelist(system_path)
-                        zaparoo_existing_cache[system_path] = _zaparoo_parent_maps(tree)
-                    except Exception:
-                        pass
+        for cache in hash_caches.values():
+            cache.save()
 
-            if callable(log_callback):
-                if result.get("slug_hit"):
-                    log_callback(f"Done (API skipped — matched existing title): {rom_filename}")
-                elif result.get("request_skipped"):
-                    log_callback(f"Done (ScreenScraper skipped): {rom_filename}")
-                else:
-                    log_callback(f"Done: {rom_filename}")
-        except InterruptedError:
-            if callable(log_callback):
-                log_callback("Scrape stopped by user.")
-            break
-        except ScreenScraperDailyQuotaError as e:
-            message = str(e).strip() or build_screenscraper_daily_quota_message()
-            if callable(log_callback):
-                log_callback(message)
+        _log_hash_stats(hash_entries, log_callback)
+        _screenscraper_rate_limiter.configure()
 
-            if callable(quota_callback):
-                try:
-                    quota_callback(
-                        {
-                            "quota_reached": True,
-                            "quota_type": "daily",
-                            "message": message,
-                        }
-                    )
-                except TypeError:
-                    quota_callback({})
 
-            break
-        except ScreenScraperQuotaError as e:
-            if callable(log_callback):
-                log_callback(f"ScreenScraper quota/rate limit reached: {e}")
-                log_callback("Scrape stopped to avoid exceeding ScreenScraper limits.")
+def _log_hash_stats(hash_entries: list[dict[str, Any] | None], log_callback=None):
+    hashed = [entry for entry in hash_entries if entry and entry.get("hashed")]
+    if not hashed:
+        return
 
-            if callable(quota_callback):
-                try:
-                    quota_callback(
-                        {
-                            "quota_reached": True,
-                            "quota_type": "rate_limit",
-                            "message": str(e).strip(),
-                        }
-                    )
-                except TypeError:
-                    quota_callback({})
+    bytes_read = sum(int(entry.get("bytes_read") or 0) for entry in hashed)
+    retried = sum(1 for entry in hashed if entry.get("strong_retry"))
+    message = f"ROM hashing read {bytes_read / (1024 * 1024):.1f} MB for {len(hashed)} ROM(s)."
+    if retried:
+        message += f" {retried} lookup(s) retried with MD5/SHA1."
+    _log(log_callback, message)
+
+
+def _action_hash_entry(
+    action: dict[str, Any],
+    output_format: str,
+    hash_caches: dict[str, RomHashCache],
+    hash_policy: str = DEFAULT_HASH_POLICY,
+) -> dict[str, Any] | None:
+    rom = action.get("rom") or {}
+    if _is_zaparoo_format(output_format) or rom.get("skip_hashes") or not rom.get("path"):
+        return None
+
+    rom_path = Path(rom.get("path"))
+    try:
+        stat = rom_path.stat()
+    except OSError:
+        return None
+
+    entry = {
+        "path": str(rom_path),
+        "zip_inner_path": str(rom.get("zip_inner_path") or ""),
+        "relative_path": str(rom.get("relative_path") or rom_path.name),
+        "size": int(stat.st_size),
+        "mtime": int(stat.st_mtime_ns),
+        "strong": needs_strong_hashes(hash_policy, int(rom.get("size") or stat.st_size)),
+        "cache": None,
+        "hashes": None,
+        "hashed": False,
+        "bytes_read": 0,
+        "strong_retry": False,
+    }
+
+    system_path = str(action.get("system_path") or "")
+    if system_path:
+        if system_path not in hash_caches:
+            hash_caches[system_path] = RomHashCache(get_rom_hash_cache_path(system_path))
+        cache = hash_caches[system_path]
+        entry["cache"] = cache
+        entry["hashes"] = cache.get(
+            entry["relative_path"],
+            entry["zip_inner_path"],
+            entry["size"],
+            entry["mtime"],
+            strong=entry["strong"],
+        )
+
+    return entry
+
+
+def _resolve_action_hashes(
+    hash_pool: RomHashPool,
+    entry: dict[str, Any] | None,
+    index: int,
+    stop_checker=None,
+    strong: bool = False,
+):
+    if not entry:
+        return None
+
+    hashes = entry.get("hashes")
+    if hashes and (has_strong_hashes(hashes) or not strong):
+        return hashes
+
+    if strong:
+        entry["strong_retry"] = True
+
+    if not hashes:
+        hashes = hash_pool.result(index)
+        if hashes:
+            entry["bytes_read"] += int(hashes.get("bytes_read") or 0)
+
+    if not hashes or (strong and not has_strong_hashes(hashes)):
+        hashes = calculate_rom_hashes(
+            entry["path"],
+            entry["zip_inner_path"],
+            stop_checker=stop_checker,
+            strong=strong or entry["strong"],
+        )
+        entry["bytes_read"] += int(hashes.get("bytes_read") or 0)
+
+    entry["hashes"] = hashes
+    entry["hashed"] = True
+    if entry.get("cache") is not None:
+        entry["cache"].put(entry["relative_path"], entry["zip_inner_path"], entry["size"], entry["mtime"], hashes)
+
+    return hashes
+
+
+def _run_scrape_action_loop(
+    actions: list[dict[str, Any]],
+    *,
+    gamelist_session: GamelistSession,
+    hash_source_for,
+    api_threads: int = 1,
+    username: str,
+    password: str,
+    image_source_name: str,
+    selected_region: str,
+    skip_existing_metadata: bool,
+    output_format: str,
+    zaparoo_media_source_names,
+    progress_callback=None,
+    log_callback=None,
+    quota_callback=None,
+    stop_checker=None,
+    crt_mode: bool = False,
+):
+    slug_map: dict[tuple[str, str], str] = {}
+    fetched_slugs: set[tuple[str, str]] = set()
+    zaparoo = _is_zaparoo_format(output_format)
+
+    total = len(actions)
+
+    def action_rom_filename(action):
+        rom = action.get("rom") or {}
+        return rom.get("filename") or Path(rom.get("path", "")).name
+
+    def zaparoo_action_complete(action):
+        system_path = str(action.get("system_path") or "")
+        try:
+            children_by_path, parents_by_id = gamelist_session.zaparoo_maps(system_path)
+            system_cache = gamelist_session.cache(system_path)
+        except Exception:
+            children_by_path, parents_by_id, system_cache = {}, {}, {}
+
+        return _zaparoo_action_already_complete(
+            action,
+            children_by_path=children_by_path,
+            parents_by_id=parents_by_id,
+            media_source_names=zaparoo_media_source_names,
+            skip_existing_metadata=skip_existing_metadata,
+            cache=system_cache,
+            crt_mode=crt_mode,
+        )
+
+    def wants_fetch(action_index):
+        if not zaparoo:
+            return True
+
+        action = actions[action_index]
+        if zaparoo_action_complete(action):
+            return False
+
+        # Later ROMs of the same title reuse the first match instead of spending a request.
+        slug_key = (action.get("system_folder", ""), _slugify_rom_filename(action_rom_filename(action)))
+        if slug_key in slug_map or slug_key in fetched_slugs:
+            return False
+
+        fetched_slugs.add(slug_key)
+        return True
+
+    def fetch(action_index, pipeline):
+        return _prefetch_scrape_action(
+            actions[action_index],
+            pipeline=pipeline,
+            username=username,
+            password=password,
+            image_source_name=image_source_name,
+            selected_region=selected_region,
+            output_format=output_format,
+            zaparoo_media_source_names=zaparoo_media_source_names,
+            hash_source=hash_source_for(action_index, pipeline.stopped),
+            quota_callback=quota_callback,
+            crt_mode=crt_mode,
+        )
+
+    with ScrapePipeline(
+        total,
+        fetch,
+        wants_fetch=wants_fetch,
+        api_threads=api_threads,
+        stop_checker=stop_checker,
+    ) as pipeline:
+        for index, action in enumerate(actions, start=1):
+            if callable(stop_checker) and stop_checker():
+                if callable(log_callback):
+                    log_callback("Scrape stopped by user.")
+                break
+
+            rom_filename = action_rom_filename(action)
+            system_label = action.get("system_label") or action.get("system_folder") or "Unknown"
 
-            break
-        except Exception as e:
             if callable(log_callback):
-                log_callback(f"Failed: {rom_filename} - {e}")
+                log_callback(f"[{index}/{total}] {system_label}: {rom_filename}")
 
-        if callable(progress_callback):
-            progress_callback(index, total, rom_filename)
+            if zaparoo and zaparoo_action_complete(action):
+                pipeline.discard(index - 1)
+                if callable(log_callback):
+                    log_callback(f"Skipped: {rom_filename} - metadata and selected media already exist.")
+                if callable(progress_callback):
+                    progress_callback(index, total, rom_filename)
+                continue
+
+            result = {}
+            prefetched = None
+            try:
+                prefetched = pipeline.result(index - 1)
+                result = process_scrape_action(
+                    action,
+                    username=username,
+                    password=password,
+                    image_source_name=image_source_name,
+                    selected_region=selected_region,
+                    skip_existing_metadata=skip_existing_metadata,
+                    output_format=output_format,
+                    zaparoo_media_source_names=zaparoo_media_source_names,
+                    zaparoo_slug_map=slug_map if zaparoo else None,
+                    hash_source=hash_source_for(index - 1, stop_checker),
+                    quota_callback=quota_callback,
+                    stop_checker=stop_checker,
+                    log_callback=log_callback,
+                    crt_mode=crt_mode,
+                    gamelist_session=gamelist_session,
+                    prefetched=prefetched,
+                )
+
+                if callable(log_callback):
+                    if result.get("slug_hit"):
+                        log_callback(f"Done (API skipped — matched existing title): {rom_filename}")
+                    elif result.get("request_skipped"):
+                        log_callback(f"Done (ScreenScraper skipped): {rom_filename}")
+                    else:
+                        log_callback(f"Done: {rom_filename}")
+            except InterruptedError:
+                if callable(log_callback):
+                    log_callback("Scrape stopped by user.")
+                break
+            except ScreenScraperDailyQuotaError as e:
+                message = str(e).strip() or build_screenscraper_daily_quota_message()
+                if callable(log_callback):
+                    log_callback(message)
+
+                if callable(quota_callback):
+                    try:
+                        quota_callback(
+                            {
+                                "quota_reached": True,
+                                "quota_type": "daily",
+                                "message": message,
+                            }
+                        )
+                    except TypeError:
+                        quota_callback({})
+
+                break
+            except ScreenScraperQuotaError as e:
+                if callable(log_callback):
+                    log_callback(f"ScreenScraper quota/rate limit reached: {e}")
+                    log_callback("Scrape stopped to avoid exceeding ScreenScraper limits.")
+
+                if callable(quota_callback):
+                    try:
+                        quota_callback(
+                            {
+                                "quota_reached": True,
+                                "quota_type": "rate_limit",
+                                "message": str(e).strip(),
+                            }
+                        )
+                    except TypeError:
+                        quota_callback({})
+
+                break
+            except Exception as e:
+                if callable(log_callback):
+                    log_callback(f"Failed: {rom_filename} - {e}")
+            finally:
+                pipeline.release(prefetched)
+
+            gamelist_session.maybe_flush()
+
+            if callable(progress_callback):
+                progress_callback(index, total, rom_filename)
 
 
 def get_zaparoo_parent_entries_by_id(tree: ET.ElementTree) -> dict[str, ET.Element]:
@@ -0,0 +1,321 @@
+import binascii
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any
+
+
+HASH_CHUNK_SIZE = 1024 * 1024
+HASH_POOL_MAX_WORKERS = 16
+HASH_POOL_LOOKAHEAD_PER_WORKER = 4
+HASH_POOL_POLL_SECONDS = 0.2
+HASH_CACHE_VERSION = 1
+HASH_CACHE_SAVE_EVERY = 50
+
+# Pool workers unpickle their tasks from this module (plus the light main.py), so it stays free
+# of the scraper's network and image deps.
+_worker_stop_event = None
+
+
+def _check_stopped(stop_checker=None):
+    if callable(stop_checker) and stop_checker():
+        raise InterruptedError("Scrape stopped by user.")
+
+
+HASH_POLICY_AUTO = "auto"
+HASH_POLICY_FULL = "full"
+HASH_POLICY_CRC = "crc"
+DEFAULT_HASH_POLICY = HASH_POLICY_AUTO
+HASH_STRONG_MAX_SIZE = 64 * 1024 * 1024
+
+HASH_POLICIES = {
+    "Auto (CRC only for large ROMs)": HASH_POLICY_AUTO,
+    "Full (CRC, MD5, SHA1)": HASH_POLICY_FULL,
+    "CRC only": HASH_POLICY_CRC,
+}
+
+
+def get_hash_policy_names() -> list[str]:
+    return list(HASH_POLICIES.keys())
+
+
+def get_hash_policy_id(name: str) -> str:
+    value = str(name or "").strip()
+    if value in HASH_POLICIES.values():
+        return value
+    return HASH_POLICIES.get(value, DEFAULT_HASH_POLICY)
+
+
+def needs_strong_hashes(policy: str, size: int) -> bool:
+    policy = get_hash_policy_id(policy)
+    if policy == HASH_POLICY_FULL:
+        return True
+    if policy == HASH_POLICY_CRC:
+        return False
+    return int(size or 0) <= HASH_STRONG_MAX_SIZE
+
+
+def has_strong_hashes(hashes: dict[str, str] | None) -> bool:
+    return bool(hashes and hashes.get("md5") and hashes.get("sha1"))
+
+
+def calculate_rom_hashes(
+    path: str | Path,
+    zip_inner_path: str = "",
+    stop_checker=None,
+    strong: bool = True,
+) -> dict[str, Any]:
+    _check_stopped(stop_checker)
+    path = Path(path)
+
+    crc = 0
+    bytes_read = 0
+    md5 = hashlib.md5() if strong else None
+    sha1 = hashlib.sha1() if strong else None
+
+    def consume(handle):
+        nonlocal crc, bytes_read
+        while True:
+            _check_stopped(stop_checker)
+            chunk = handle.read(HASH_CHUNK_SIZE)
+            if not chunk:
+                break
+            bytes_read += len(chunk)
+            crc = binascii.crc32(chunk, crc)
+            if strong:
+                md5.update(chunk)
+                sha1.update(chunk)
+
+    if zip_inner_path:
+        with zipfile.ZipFile(path, "r") as zf:
+            if not strong:
+                # The central directory already stores the member CRC, so nothing needs decompressing.
+                return {
+                    "crc": f"{zf.getinfo(zip_inner_path).CRC & 0xFFFFFFFF:08X}",
+                    "md5": "",
+                    "sha1": "",
+                    "bytes_read": 0,
+                }
+            with zf.open(zip_inner_path) as handle:
+                consume(handle)
+    else:
+        with path.open("rb") as handle:
+            consume(handle)
+
+    return {
+        "crc": f"{crc & 0xFFFFFFFF:08X}",
+        "md5": md5.hexdigest() if strong else "",
+        "sha1": sha1.hexdigest() if strong else "",
+        "bytes_read": bytes_read,
+    }
+
+
+class RomHashCache:
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.hits = 0
+        self.misses = 0
+        self._entries = None
+        self._pending = 0
+        # Lookups and stores come from the scrape pipeline's API threads.
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def key(relative_path: str, zip_inner_path: str = "") -> str:
+        return f"{relative_path}|{zip_inner_path or ''}"
+
+    def _load(self):
+        if self._entries is not None:
+            return self._entries
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except Exception:
+            data = {}
+
+        entries = data.get("entries") if isinstance(data, dict) else None
+        if not isinstance(entries, dict) or data.get("version") != HASH_CACHE_VERSION:
+            entries = {}
+
+        self._entries = entries
+        return entries
+
+    def get(
+        self,
+        relative_path: str,
+        zip_inner_path: str,
+        size: int,
+        mtime: int,
+        strong: bool = False,
+    ) -> dict[str, str] | None:
+        with self._lock:
+            entry = self._load().get(self.key(relative_path, zip_inner_path))
+            if isinstance(entry, dict) and entry.get("size") == size and entry.get("mtime") == mtime:
+                hashes = entry.get("hashes")
+                if isinstance(hashes, dict) and hashes.get("crc") and (has_strong_hashes(hashes) or not strong):
+                    self.hits += 1
+                    return dict(hashes)
+
+            self.misses += 1
+            return None
+
+    def put(self, relative_path: str, zip_inner_path: str, size: int, mtime: int, hashes: dict[str, str]):
+        with self._lock:
+            self._load()[self.key(relative_path, zip_inner_path)] = {
+                "size": size,
+                "mtime": mtime,
+                "hashes": {key: str(hashes.get(key) or "") for key in ("crc", "md5", "sha1")},
+            }
+            self._pending += 1
+            if self._pending >= HASH_CACHE_SAVE_EVERY:
+                self.save()
+
+    def save(self):
+        with self._lock:
+            self._save()
+
+    def _save(self):
+        if self._entries is None or not self._pending:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            temp_path.write_text(
+                json.dumps({"version": HASH_CACHE_VERSION, "entries": self._entries}, ensure_ascii=False),
+                encoding="utf-8",
+            )
+            os.replace(temp_path, self.path)
+            self._pending = 0
+        except Exception:
+            pass
+
+
+def _init_hash_worker(stop_event):
+    global _worker_stop_event
+    _worker_stop_event = stop_event
+
+
+def _worker_stopped() -> bool:
+    return _worker_stop_event is not None and _worker_stop_event.is_set()
+
+
+def _hash_rom_job(path: str, zip_inner_path: str, strong: bool) -> dict[str, Any]:
+    return calculate_rom_hashes(path, zip_inner_path, stop_checker=_worker_stopped, strong=strong)
+
+
+def default_hash_workers() -> int:
+    return max(1, min(os.cpu_count() or 1, HASH_POOL_MAX_WORKERS))
+
+
+class RomHashPool:
+    def __init__(self, jobs, workers: int | None = None, stop_checker=None):
+        # One entry per action: (path, zip_inner_path, strong), or None when that action needs no hashes.
+        self.jobs = list(jobs)
+        self.workers = workers or default_hash_workers()
+        self.stop_checker = stop_checker
+        self.lookahead = self.workers * HASH_POOL_LOOKAHEAD_PER_WORKER
+        self._futures = {}
+        self._next_index = 0
+        self._executor = None
+        self._stop_event = None
+        self._started = False
+        self._lock = threading.RLock()
+
+    @property
+    def active(self) -> bool:
+        return self._executor is not None
+
+    def start(self) -> bool:
+        if self._started:
+            return self.active
+        self._started = True
+
+        if not any(self.jobs):
+            return False
+
+        try:
+            # Spawn everywhere: forking a process that already runs Qt threads is not safe.
+            context = multiprocessing.get_context("spawn")
+            self._stop_event = context.Event()
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_hash_worker,
+                initargs=(self._stop_event,),
+            )
+        except Exception:
+            self._executor = None
+            self._stop_event = None
+            return False
+
+        return True
+
+    def _fill(self, index: int):
+        limit = min(len(self.jobs), index + self.lookahead + 1)
+
+        while self._next_index < limit:
+            job = self.jobs[self._next_index]
+            if job:
+                path, zip_inner_path, strong = job
+                try:
+                    self._futures[self._next_index] = self._executor.submit(
+                        _hash_rom_job, str(path), str(zip_inner_path or ""), bool(strong)
+                    )
+                except Exception:
+                    # A broken pool leaves the remaining jobs to be hashed inline.
+                    self.close()
+                    return
+            self._next_index += 1
+
+    def result(self, index: int) -> dict[str, Any] | None:
+        # Several API threads ask for hashes at once, and not strictly in order.
+        with self._lock:
+            if not self.active:
+                return None
+
+            self._fill(index)
+            future = self._futures.pop(index, None)
+
+        if future is None:
+            return None
+
+        while True:
+            if callable(self.stop_checker) and self.stop_checker():
+                self.close()
+                raise InterruptedError("Scrape stopped by user.")
+            try:
+                return future.result(timeout=HASH_POOL_POLL_SECONDS)
+            except FutureTimeoutError:
+                continue
+            except BrokenProcessPool:
+                self.close()
+                return None
+
+    def close(self):
+        with self._lock:
+            executor = self._executor
+            if executor is None:
+                return
+
+            self._executor = None
+            if self._stop_event is not None:
+                self._stop_event.set()
+            for future in self._futures.values():
+                future.cancel()
+            self._futures.clear()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
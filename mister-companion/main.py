@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import platform
 import sys
@@ -12,18 +13,19 @@ def configure_qt_high_dpi():
     os.environ.setdefault("QT_SCALE_FACTOR_ROUNDING_POLICY", "PassThrough")
 
 
-configure_qt_high_dpi()
-
-from PyQt6.QtWidgets import QApplication
+def main():
+    # Imported here rather than at module level: hashing pool workers started with "spawn"
+    # re-import this file as __mp_main__ and should not load Qt or the whole UI.
+    configure_qt_high_dpi()
 
-from core.config import load_config
-from core.theme import apply_theme
-from ui.custom_dialog import install_custom_dialogs
-from ui.custom_message_dialog import install_custom_message_boxes
-from ui.main_window import MainWindow
+    from PyQt6.QtWidgets import QApplication
 
+    from core.config import load_config
+    from core.theme import apply_theme
+    from ui.custom_dialog import install_custom_dialogs
+    from ui.custom_message_dialog import install_custom_message_boxes
+    from ui.main_window import MainWindow
 
-def main():
     app = QApplication(sys.argv)
 
     config = load_config()
@@ -39,4 +41,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Frozen builds need this so ZapScraper's hashing worker processes do not relaunch the app.
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
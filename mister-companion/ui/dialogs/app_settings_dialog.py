@@ -138,6 +138,20 @@ class AppSettingsDialog(QDialog):
 
         main_layout.addWidget(menu_style_group)
 
+        connection_group = QGroupBox("Connection")
+        connection_layout = QVBoxLayout(connection_group)
+        connection_layout.setSpacing(8)
+
+        self.use_session_shell_check = QCheckBox("Reuse one shell session for MiSTer commands")
+        self.use_session_shell_check.setToolTip(
+            "Runs quick status commands through a single long-lived shell instead of\n"
+            "opening a new SSH channel for every command. Falls back automatically\n"
+            "if the shell session is lost."
+        )
+        connection_layout.addWidget(self.use_session_shell_check)
+
+        main_layout.addWidget(connection_group)
+
         notices_group = QGroupBox("Notices")
         notices_layout = QVBoxLayout(notices_group)
         notices_layout.setSpacing(8)
@@ -196,6 +210,9 @@ class AppSettingsDialog(QDialog):
         self.check_updates_on_startup_check.setChecked(
             bool(self.config_data.get("check_updates_on_startup", True))
         )
+        self.use_session_shell_check.setChecked(
+            bool(self.config_data.get("use_session_shell", False))
+        )
         self.show_setup_notice_check.setChecked(
             not bool(self.config_data.get("hide_setup_notice", False))
         )
@@ -292,8 +309,10 @@ class AppSettingsDialog(QDialog):
         self.config_data["hide_update_all_warning"] = not self.show_update_all_warning_check.isChecked()
         self.config_data["hide_zapscripts_scan_notice"] = not self.show_zapscripts_scan_notice_check.isChecked()
         self.config_data["menu_style"] = self.get_selected_menu_style()
+        self.config_data["use_session_shell"] = self.use_session_shell_check.isChecked()
         save_config(self.config_data)
         self.main_window.config_data = self.config_data
+        self.main_window.connection.use_session_shell = self.config_data["use_session_shell"]
         if hasattr(self.main_window, "apply_menu_style"):
             self.main_window.apply_menu_style()
         self.accept()
@@ -384,7 +403,9 @@ class AppSettingsDialog(QDialog):
         self.config_data["hide_update_all_warning"] = not self.show_update_all_warning_check.isChecked()
         self.config_data["hide_zapscripts_scan_notice"] = not self.show_zapscripts_scan_notice_check.isChecked()
         self.config_data["menu_style"] = self.get_selected_menu_style()
+        self.config_data["use_session_shell"] = self.use_session_shell_check.isChecked()
         save_config(self.config_data)
         self.main_window.config_data = self.config_data
+        self.main_window.connection.use_session_shell = self.config_data["use_session_shell"]
         if hasattr(self.main_window, "apply_menu_style"):
             self.main_window.apply_menu_style()
@@ -179,14 +179,14 @@ class RemoteGameBrowserDialog(QDialog):
                 break
 
     def _exists(self, path):
-        sftp = self.connection.client.open_sftp()
+        sftp = self.connection.open_sftp()
         try:
             return _sftp_exists(sftp, path)
         finally:
             sftp.close()
 
     def load_path(self, path):
-        sftp = self.connection.client.open_sftp()
+        sftp = self.connection.open_sftp()
         try:
             import stat
             if not _sftp_exists(sftp, path):
@@ -691,7 +691,7 @@ class CollectionLauncherManagerDialog(QDialog):
                     except Exception: pass
         else:
             if not self.connection: raise RuntimeError("Not connected to MiSTer.")
-            sftp=self.connection.client.open_sftp()
+            sftp=self.connection.open_sftp()
             try:
                 _sftp_mkdirs(sftp,COLLECTIONS_REMOTE)
                 for name in sorted(sftp.listdir(COLLECTIONS_REMOTE), key=str.lower):
@@ -726,7 +726,7 @@ class CollectionLauncherManagerDialog(QDialog):
         try:
             if self.offline: shutil.rmtree(self._offline_root()/folder)
             else:
-                sftp=self.connection.client.open_sftp()
+                sftp=self.connection.open_sftp()
                 try:_sftp_remove_tree(sftp,posixpath.join(COLLECTIONS_REMOTE,folder))
                 finally:sftp.close()
         except Exception as exc: QMessageBox.critical(self,"Delete Collection",str(exc));return
@@ -744,7 +744,7 @@ class CollectionLauncherManagerDialog(QDialog):
         if self.offline:
             p=self._offline_root()/folder/relname
             return p.read_bytes() if p.exists() else None
-        sftp=self.connection.client.open_sftp()
+        sftp=self.connection.open_sftp()
         try:
             with sftp.open(posixpath.join(COLLECTIONS_REMOTE,folder,relname),'rb') as f:return f.read()
         finally:sftp.close()
@@ -793,7 +793,7 @@ class CollectionLauncherManagerDialog(QDialog):
             sftp = None
             try:
                 transfer.write("Connecting to MiSTer...")
-                sftp=self.connection.client.open_sftp()
+                sftp=self.connection.open_sftp()
                 root=posixpath.join(COLLECTIONS_REMOTE,folder)
                 transfer.write(f"Preparing {root}")
                 _sftp_mkdirs(sftp,root);_sftp_mkdirs(sftp,posixpath.join(root,'artwork'))
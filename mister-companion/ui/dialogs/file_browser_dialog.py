@@ -1,7 +1,7 @@
 from datetime import datetime
 from pathlib import Path
 
-from PyQt6.QtCore import QEvent, QPoint, QRect, QThread, QTimer, Qt, pyqtSignal
+from PyQt6.QtCore import QAbstractTableModel, QEvent, QModelIndex, QPoint, QRect, QThread, QTimer, Qt, pyqtSignal
 from PyQt6.QtGui import QAction, QCursor, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QAbstractItemView,
@@ -18,8 +18,7 @@ from PyQt6.QtWidgets import (
     QPushButton,
     QSizePolicy,
     QTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
@@ -28,20 +27,25 @@ from core.config import load_config, save_config
 from core.file_browser import (
     DEFAULT_ROOT,
     available_roots,
+    cached_listing,
     clamp_to_root,
     copy_path,
     delete_path,
     download_path,
     format_size,
+    get_listing_cache,
     is_safe_path,
     join_remote_path,
     list_directory,
     make_directory,
     move_path,
     parent_path,
+    prefetch_candidates,
+    prefetch_directories,
     rename_path,
-    upload_path,
+    upload_items,
 )
+from core.tar_transfer import TAR_STREAM_THRESHOLD
 
 
 class FileBrowserWorker(QThread):
@@ -63,23 +67,22 @@ class FileBrowserWorker(QThread):
                 return
 
             if self.action == "list":
-                self.result.emit(self.action, list_directory(self.connection, self.kwargs.get("path", DEFAULT_ROOT)))
+                self.result.emit(
+                    self.action,
+                    list_directory(self.connection, self.kwargs.get("path", DEFAULT_ROOT)),
+                )
                 return
 
             if self.action == "upload":
-                upload_items = self.kwargs.get("upload_items", [])
-                uploaded = []
-                for item in upload_items:
-                    target = upload_path(
-                        self.connection,
-                        item.get("local_path"),
-                        item.get("remote_dir", DEFAULT_ROOT),
-                        progress_callback=self.on_transfer_progress,
-                        message_callback=self.progress.emit,
-                        target_name=item.get("target_name"),
-                        overwrite=item.get("overwrite", False),
-                    )
-                    uploaded.append(target)
+                uploaded = upload_items(
+                    self.connection,
+                    self.kwargs.get("upload_items", []),
+                    progress_callback=self.on_transfer_progress,
+                    message_callback=self.progress.emit,
+                    tar_threshold=self.kwargs.get("tar_threshold", TAR_STREAM_THRESHOLD),
+                    compress=self.kwargs.get("compress", False),
+                    delta=self.kwargs.get("delta", True),
+                )
                 self.result.emit(self.action, uploaded)
                 return
 
@@ -92,6 +95,8 @@ class FileBrowserWorker(QThread):
                     message_callback=self.progress.emit,
                     target_name=self.kwargs.get("target_name"),
                     overwrite=self.kwargs.get("overwrite", False),
+                    tar_threshold=self.kwargs.get("tar_threshold", TAR_STREAM_THRESHOLD),
+                    compress=self.kwargs.get("compress", False),
                 )
                 self.result.emit(self.action, target)
                 return
@@ -150,11 +155,109 @@ class FileBrowserWorker(QThread):
         self.transfer_progress.emit(int(transferred or 0), int(total or 0))
 
 
-class FileTreeWidget(QTreeWidget):
+# Stopped prefetch workers stay referenced here until their current listing returns, so neither
+# navigation nor closing the dialog has to block on a slow listdir.
+_retired_prefetch_workers = set()
+
+
+class FileBrowserPrefetchWorker(QThread):
+    def __init__(self, connection, paths):
+        super().__init__()
+        self.connection = connection
+        self.paths = list(paths)
+        self._stop_requested = False
+
+    def stop(self):
+        self._stop_requested = True
+
+    def run(self):
+        try:
+            prefetch_directories(self.connection, self.paths, stop_checker=lambda: self._stop_requested)
+        except Exception:
+            pass
+
+
+class FileListModel(QAbstractTableModel):
+    PAGE_SIZE = 200
+    HEADERS = ["Name", "Size", "Modified"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._entries = []
+        self._loaded = 0
+
+    def set_entries(self, entries):
+        self.beginResetModel()
+        self._entries = list(entries)
+        self._loaded = min(len(self._entries), self.PAGE_SIZE)
+        self.endResetModel()
+
+    def entry(self, row):
+        if 0 <= row < self._loaded:
+            return self._entries[row]
+        return None
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._loaded < len(self._entries)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        count = min(self.PAGE_SIZE, len(self._entries) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            if 0 <= section < len(self.HEADERS):
+                return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        entry = self.entry(index.row()) if index.isValid() else None
+        if entry is None:
+            return None
+
+        if role == Qt.ItemDataRole.UserRole:
+            return entry
+
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if entry.get("up"):
+            return ".." if index.column() == 0 else ""
+
+        if index.column() == 0:
+            icon_name = "📁 " if entry.get("is_dir") else "📄 "
+            return f"{icon_name}{entry.get('name', '')}"
+
+        if index.column() == 1:
+            return "" if entry.get("is_dir") else format_size(entry.get("size", 0))
+
+        if entry.get("mtime"):
+            return datetime.fromtimestamp(entry["mtime"]).strftime("%Y-%m-%d %H:%M")
+        return ""
+
+
+class FileTreeView(QTreeView):
     files_dropped = pyqtSignal(list)
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.setUniformRowHeights(True)
         self.setAcceptDrops(True)
         self.setDragDropMode(QAbstractItemView.DragDropMode.DropOnly)
         self.setDropIndicatorShown(True)
@@ -206,6 +309,11 @@ class FileBrowserDialog(QDialog):
         },
         "sort_column": "name",
         "sort_descending": False,
+        "tar_stream_threshold": TAR_STREAM_THRESHOLD,
+        "tar_stream_gzip": False,
+        # Delta uploads need free space for a full working copy of the target next to it; when it
+        # is short they fall back to a normal upload.
+        "delta_upload": True,
     }
 
     def __init__(self, parent=None):
@@ -215,6 +323,7 @@ class FileBrowserDialog(QDialog):
         self.config_data = load_config()
         self.file_browser_config = self.load_file_browser_config()
         self.worker = None
+        self.prefetch_worker = None
         self.current_path = DEFAULT_ROOT
         self.current_root = DEFAULT_ROOT
         self.roots = []
@@ -434,16 +543,16 @@ class FileBrowserDialog(QDialog):
         path_layout.addWidget(self.path_label, 1)
         root_layout.addWidget(path_panel)
 
-        self.file_tree = FileTreeWidget()
-        self.file_tree.setColumnCount(3)
-        self.file_tree.setHeaderLabels(["Name", "Size", "Modified"])
+        self.file_model = FileListModel(self)
+        self.file_tree = FileTreeView()
+        self.file_tree.setModel(self.file_model)
         self.file_tree.setRootIsDecorated(False)
         self.file_tree.setAlternatingRowColors(True)
         self.file_tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
         self.file_tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.file_tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.file_tree.doubleClicked.connect(self.on_item_double_clicked)
         self.file_tree.customContextMenuRequested.connect(self.open_context_menu)
-        self.file_tree.itemSelectionChanged.connect(self.update_action_buttons)
+        self.file_tree.selectionModel().selectionChanged.connect(lambda *_: self.update_action_buttons())
         self.file_tree.files_dropped.connect(self.upload_dropped_paths)
         header = self.file_tree.header()
         header.setSectionsClickable(True)
@@ -515,6 +624,14 @@ class FileBrowserDialog(QDialog):
             config["sort_column"] = "name"
 
         config["sort_descending"] = bool(config.get("sort_descending", False))
+
+        try:
+            config["tar_stream_threshold"] = max(0, int(config.get("tar_stream_threshold", TAR_STREAM_THRESHOLD)))
+        except Exception:
+            config["tar_stream_threshold"] = TAR_STREAM_THRESHOLD
+
+        config["tar_stream_gzip"] = bool(config.get("tar_stream_gzip", False))
+        config["delta_upload"] = bool(config.get("delta_upload", True))
         return config
 
     def save_file_browser_config(self):
@@ -550,9 +667,14 @@ class FileBrowserDialog(QDialog):
         self._restoring_columns = False
 
     def closeEvent(self, event):
+        self.stop_prefetch()
         self.save_file_browser_config()
         super().closeEvent(event)
 
+    def done(self, result):
+        self.stop_prefetch()
+        super().done(result)
+
     def bind_shortcuts(self):
         QShortcut(QKeySequence.StandardKey.Refresh, self, activated=self.refresh_current_path)
         QShortcut(QKeySequence.StandardKey.Copy, self, activated=self.copy_selected)
@@ -631,9 +753,47 @@ class FileBrowserDialog(QDialog):
         path = clamp_to_root(path, self.current_root or DEFAULT_ROOT)
         if not is_safe_path(path):
             path = DEFAULT_ROOT
+        if not self.busy and self.connection and self.connection.is_connected():
+            cached = cached_listing(self.connection, path)
+            if cached is not None:
+                self.apply_listing(cached, fresh=False)
         self.append_output(f"Loading {path}...")
         self.start_worker("list", path=path)
 
+    def start_prefetch(self, listing):
+        self.stop_prefetch()
+        if not self.connection or not self.connection.is_connected():
+            return
+        paths = prefetch_candidates(self.connection, listing)
+        if not paths:
+            return
+        self.prefetch_worker = FileBrowserPrefetchWorker(self.connection, paths)
+        self.prefetch_worker.finished.connect(self.on_prefetch_finished)
+        self.prefetch_worker.start()
+
+    def stop_prefetch(self):
+        worker = self.prefetch_worker
+        if worker is None:
+            return
+        self.prefetch_worker = None
+        worker.stop()
+        worker.finished.disconnect(self.on_prefetch_finished)
+        _retired_prefetch_workers.add(worker)
+        worker.finished.connect(lambda: _retired_prefetch_workers.discard(worker))
+        if worker.isFinished():
+            _retired_prefetch_workers.discard(worker)
+
+    def on_prefetch_finished(self):
+        self.prefetch_worker = None
+
+    def invalidate_listings(self, *paths):
+        if not self.connection:
+            return
+        cache = get_listing_cache()
+        for path in paths:
+            if path:
+                cache.invalidate(self.connection.host, path)
+
     def on_worker_result(self, action, data):
         if action == "roots":
             self.apply_roots(data)
@@ -659,6 +819,7 @@ class FileBrowserDialog(QDialog):
             return
 
         if action == "rename":
+            self.invalidate_listings(self.worker.kwargs.get("old_path"))
             self.append_output(f"Renamed to: {data}")
             self.pending_load_path = self.current_path
             return
@@ -669,6 +830,7 @@ class FileBrowserDialog(QDialog):
             return
 
         if action == "move":
+            self.invalidate_listings(self.worker.kwargs.get("source_path"), data)
             self.append_output(f"Moved to: {data}")
             self.clipboard_entry = None
             self.clipboard_action = ""
@@ -677,6 +839,7 @@ class FileBrowserDialog(QDialog):
             return
 
         if action == "delete":
+            self.invalidate_listings(data)
             self.append_output(f"Deleted: {data}")
             self.pending_load_path = self.current_path
 
@@ -718,34 +881,23 @@ class FileBrowserDialog(QDialog):
         self.current_path = self.current_root
         self.pending_load_path = self.current_path
 
-    def apply_listing(self, data):
+    def apply_listing(self, data, fresh=True):
         self.current_path = data.get("path", self.current_path)
         self.current_root = self.storage_combo.currentData() or DEFAULT_ROOT
         self.entries = data.get("entries", [])
         self.path_label.setText(self.current_path)
         self.populate_file_tree()
-        self.append_output(f"Loaded {self.current_path}")
         self.update_action_buttons()
+        if fresh:
+            self.append_output(f"Loaded {self.current_path}")
+            self.start_prefetch(data)
 
     def populate_file_tree(self):
-        self.file_tree.clear()
-
+        entries = self.sorted_entries()
         if self.current_path != self.current_root:
-            up_item = QTreeWidgetItem(["..", "", ""])
-            up_item.setData(0, Qt.ItemDataRole.UserRole, {"up": True, "path": parent_path(self.current_path), "is_dir": True})
-            self.file_tree.addTopLevelItem(up_item)
-
-        for entry in self.sorted_entries():
-            mtime = ""
-            if entry.get("mtime"):
-                mtime = datetime.fromtimestamp(entry["mtime"]).strftime("%Y-%m-%d %H:%M")
-
-            size = "" if entry.get("is_dir") else format_size(entry.get("size", 0))
-            icon_name = "📁 " if entry.get("is_dir") else "📄 "
-            item = QTreeWidgetItem([f"{icon_name}{entry.get('name', '')}", size, mtime])
-            item.setData(0, Qt.ItemDataRole.UserRole, entry)
-            self.file_tree.addTopLevelItem(item)
+            entries.insert(0, {"up": True, "path": parent_path(self.current_path), "is_dir": True})
 
+        self.file_model.set_entries(entries)
         self.update_action_buttons()
 
     def sorted_entries(self):
@@ -824,10 +976,10 @@ class FileBrowserDialog(QDialog):
         self.load_path(path)
 
     def selected_entry(self):
-        items = self.file_tree.selectedItems()
-        if not items:
+        rows = self.file_tree.selectionModel().selectedRows()
+        if not rows:
             return None
-        return items[0].data(0, Qt.ItemDataRole.UserRole)
+        return self.file_model.entry(rows[0].row())
 
     def existing_names(self):
         return {entry.get("name", "") for entry in self.entries}
@@ -881,7 +1033,7 @@ class FileBrowserDialog(QDialog):
         if entry.get("is_dir"):
             self.load_path(entry.get("path"))
 
-    def on_item_double_clicked(self, item, column):
+    def on_item_double_clicked(self, index):
         self.open_selected()
 
     def go_up(self):
@@ -934,7 +1086,13 @@ class FileBrowserDialog(QDialog):
             )
 
         self.append_output(f"Uploading {len(upload_items)} item{'s' if len(upload_items) != 1 else ''} to {self.current_path}...")
-        self.start_worker("upload", upload_items=upload_items)
+        self.start_worker(
+            "upload",
+            upload_items=upload_items,
+            tar_threshold=self.file_browser_config.get("tar_stream_threshold", TAR_STREAM_THRESHOLD),
+            compress=self.file_browser_config.get("tar_stream_gzip", False),
+            delta=self.file_browser_config.get("delta_upload", True),
+        )
 
     def download_selected(self):
         entry = self.selected_entry()
@@ -969,6 +1127,8 @@ class FileBrowserDialog(QDialog):
             local_dir=local_dir,
             target_name=target_name,
             overwrite=overwrite,
+            tar_threshold=self.file_browser_config.get("tar_stream_threshold", TAR_STREAM_THRESHOLD),
+            compress=self.file_browser_config.get("tar_stream_gzip", False),
         )
 
     def unique_local_name(self, local_dir, name):
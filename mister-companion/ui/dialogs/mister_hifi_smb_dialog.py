@@ -31,7 +31,7 @@ def smb_config_exists(connection=None, sd_root=None):
     if connection is None or not connection.is_connected():
         return False
     try:
-        sftp = connection.client.open_sftp()
+        sftp = connection.open_sftp()
         try:
             sftp.stat(SMB_CONFIG_REMOTE)
             return True
@@ -42,7 +42,7 @@ def smb_config_exists(connection=None, sd_root=None):
 
 
 def _read_online(connection):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         try:
             with sftp.file(SMB_CONFIG_REMOTE, "r") as handle:
@@ -70,7 +70,7 @@ def _mkdirs_sftp(sftp, remote_dir):
 
 
 def _write_online(connection, data):
-    sftp = connection.client.open_sftp()
+    sftp = connection.open_sftp()
     try:
         _mkdirs_sftp(sftp, posixpath.dirname(SMB_CONFIG_REMOTE))
         payload = json.dumps(data, indent=2, ensure_ascii=False) + "\n"
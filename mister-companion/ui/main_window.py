@@ -421,6 +421,7 @@ class MainWindow(QMainWindow):
         self.app = app
         self.connection = MiSTerConnection()
         self.config_data = load_config()
+        self.connection.use_session_shell = bool(self.config_data.get("use_session_shell", False))
 
         self.app_mode = APP_MODE_ONLINE
         self.offline_sd_root = (
@@ -2168,7 +2169,8 @@ class MainWindow(QMainWindow):
         look_for_ssh_keys = self.reboot_reconnect_look_for_ssh_keys
 
         try:
-            success = self.connection.connect(
+            # A running transfer may already have reconnected while waiting to resume.
+            success = self.connection.is_connected() or self.connection.connect(
                 host,
                 username,
                 password,
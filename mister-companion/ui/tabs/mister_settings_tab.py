@@ -177,7 +177,7 @@ class MiSTerSettingsRefreshWorker(QThread):
         if "MiSTer.ini" not in files:
             default_text = self.download_default_mister_ini()
 
-            sftp = self.connection.client.open_sftp()
+            sftp = self.connection.open_sftp()
             try:
                 with sftp.open("/media/fat/MiSTer.ini", "w") as f:
                     f.write(default_text)
@@ -217,7 +217,7 @@ class MiSTerSettingsRefreshWorker(QThread):
             raise RuntimeError("Connect to a MiSTer first.")
 
         remote_path = f"/media/fat/{filename}"
-        sftp = self.connection.client.open_sftp()
+        sftp = self.connection.open_sftp()
         try:
             with sftp.open(remote_path, "r") as f:
                 data = f.read()
@@ -934,7 +934,7 @@ class MiSTerSettingsTab(QWidget):
 
         default_text = self.download_default_mister_ini()
 
-        sftp = self.connection.client.open_sftp()
+        sftp = self.connection.open_sftp()
         try:
             with sftp.open("/media/fat/MiSTer.ini", "w") as f:
                 f.write(default_text)
@@ -1094,7 +1094,7 @@ class MiSTerSettingsTab(QWidget):
 
         remote_path = self.selected_remote_ini_path()
 
-        sftp = self.connection.client.open_sftp()
+        sftp = self.connection.open_sftp()
         try:
             try:
                 with sftp.open(remote_path, "r") as f:
@@ -1117,7 +1117,7 @@ class MiSTerSettingsTab(QWidget):
 
         remote_path = self.selected_remote_ini_path()
 
-        sftp = self.connection.client.open_sftp()
+        sftp = self.connection.open_sftp()
         try:
             with sftp.open(remote_path, "w") as f:
                 f.write(text)
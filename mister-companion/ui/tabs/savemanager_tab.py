@@ -1,6 +1,6 @@
 from pathlib import Path
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QThread, Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QCheckBox,
     QDialog,
@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QListWidget,
+    QListWidgetItem,
     QMessageBox,
     QPushButton,
     QSpinBox,
@@ -18,7 +19,10 @@ from PyQt6.QtWidgets import (
 )
 
 from ui.scaling import set_text_button_min_width
+from core.file_browser import format_size
 from core.savemanager import (
+    BACKUP_FORMAT_STORE,
+    BACKUP_FORMAT_ZIP,
     SYNC_ROOT,
     create_backup,
     create_backup_local,
@@ -26,15 +30,26 @@ from core.savemanager import (
     ensure_remote_save_dirs,
     ensure_savemanager_dirs,
     get_backup_count,
+    get_backup_format,
     get_device_backup_root,
+    get_sync_device_key,
+    list_backup_contents,
     list_backup_devices,
     open_folder,
     restore_backup,
     restore_backup_local,
+    save_backup_format_setting,
     save_retention_setting,
     sync_saves,
     sync_saves_local,
 )
+from core.save_sync import (
+    PREFER_LOCAL,
+    PREFER_REMOTE,
+    get_sync_conflicts,
+    resolve_all_sync_conflicts,
+    resolve_sync_conflict,
+)
 
 
 class SaveManagerWorker(QThread):
@@ -80,6 +95,12 @@ class RestoreBackupDialog(QDialog):
         self.list_widget = QListWidget()
         layout.addWidget(self.list_widget)
 
+        self.contents_label = QLabel("Contents:")
+        layout.addWidget(self.contents_label)
+
+        self.contents_list = QListWidget()
+        layout.addWidget(self.contents_list)
+
         self.backup_before_restore_checkbox = QCheckBox("Backup current device before restoring")
         self.backup_before_restore_checkbox.setChecked(True)
         layout.addWidget(self.backup_before_restore_checkbox)
@@ -98,6 +119,7 @@ class RestoreBackupDialog(QDialog):
         self.restore_button.clicked.connect(self.accept)
         self.cancel_button.clicked.connect(self.reject)
         self.list_widget.itemDoubleClicked.connect(lambda _: self.accept())
+        self.list_widget.currentRowChanged.connect(lambda _: self.populate_contents())
         self.populate_backups()
 
     def populate_backups(self):
@@ -111,6 +133,24 @@ class RestoreBackupDialog(QDialog):
         if backups:
             self.list_widget.setCurrentRow(0)
 
+    def populate_contents(self):
+        self.contents_list.clear()
+        device = self.selected_device()
+        backup = self.selected_backup()
+        if not device or not backup:
+            self.contents_label.setText("Contents:")
+            return
+
+        try:
+            contents = list_backup_contents(device, backup)
+        except Exception as e:
+            self.contents_label.setText(f"Contents: unavailable ({e})")
+            return
+
+        total = sum(entry["size"] for entry in contents)
+        self.contents_label.setText(f"Contents: {len(contents)} files, {format_size(total)}")
+        self.contents_list.addItems([f"{entry['path']}  ({format_size(entry['size'])})" for entry in contents])
+
     def selected_device(self):
         return self.device_combo.currentText().strip()
 
@@ -234,9 +274,20 @@ class SaveManagerTab(QWidget):
         self.retention_spin.setValue(int(self.main_window.config_data.get("backup_retention", 10)))
         self.retention_spin.valueChanged.connect(self.on_retention_changed)
 
+        self.backup_format_label = QLabel("Backup format:")
+        self.backup_format_combo = QComboBox()
+        self.backup_format_combo.addItem("Deduplicated store", BACKUP_FORMAT_STORE)
+        self.backup_format_combo.addItem("Compressed archive (.zip)", BACKUP_FORMAT_ZIP)
+        format_index = self.backup_format_combo.findData(get_backup_format(self.main_window.config_data))
+        self.backup_format_combo.setCurrentIndex(max(0, format_index))
+        self.backup_format_combo.currentIndexChanged.connect(self.on_backup_format_changed)
+
         retention_row.addStretch()
         retention_row.addWidget(self.retention_label)
         retention_row.addWidget(self.retention_spin)
+        retention_row.addSpacing(16)
+        retention_row.addWidget(self.backup_format_label)
+        retention_row.addWidget(self.backup_format_combo)
         retention_row.addStretch()
         main_group_layout.addLayout(retention_row)
 
@@ -263,6 +314,41 @@ class SaveManagerTab(QWidget):
 
         main_layout.addWidget(folder_group)
 
+        self.conflict_group = QGroupBox("Merge Conflicts")
+        conflict_group_layout = QVBoxLayout(self.conflict_group)
+        conflict_group_layout.setContentsMargins(12, 12, 12, 12)
+        conflict_group_layout.setSpacing(8)
+
+        conflict_info = QLabel(
+            "These files changed both in the Merge folder and on this device since the last merge. "
+            "Choose which version to keep, then run Merge Saves again."
+        )
+        conflict_info.setWordWrap(True)
+        conflict_group_layout.addWidget(conflict_info)
+
+        self.conflict_list = QListWidget()
+        self.conflict_list.setMinimumHeight(110)
+        conflict_group_layout.addWidget(self.conflict_list)
+
+        conflict_button_row = QHBoxLayout()
+        self.keep_all_merge_button = QPushButton("Keep All Merge Folder")
+        self.keep_all_device_button = QPushButton("Keep All Device")
+        set_text_button_min_width(self.keep_all_merge_button, 160)
+        set_text_button_min_width(self.keep_all_device_button, 130)
+        conflict_button_row.addWidget(self.keep_all_merge_button)
+        conflict_button_row.addWidget(self.keep_all_device_button)
+        conflict_button_row.addStretch()
+        self.keep_merge_version_button = QPushButton("Keep Merge Folder Version")
+        self.keep_device_version_button = QPushButton("Keep Device Version")
+        set_text_button_min_width(self.keep_merge_version_button, 180)
+        set_text_button_min_width(self.keep_device_version_button, 150)
+        conflict_button_row.addWidget(self.keep_merge_version_button)
+        conflict_button_row.addWidget(self.keep_device_version_button)
+        conflict_group_layout.addLayout(conflict_button_row)
+
+        main_layout.addWidget(self.conflict_group)
+        self.conflict_group.hide()
+
         self.log_group = QGroupBox("Log")
         log_group_layout = QVBoxLayout(self.log_group)
         log_group_layout.setContentsMargins(12, 12, 12, 12)
@@ -292,6 +378,10 @@ class SaveManagerTab(QWidget):
         self.open_backup_folder_button.clicked.connect(self.open_backup_folder)
         self.open_sync_folder_button.clicked.connect(self.open_sync_folder)
         self.hide_log_button.clicked.connect(self.hide_log)
+        self.keep_merge_version_button.clicked.connect(lambda: self.resolve_selected_conflict(PREFER_LOCAL))
+        self.keep_device_version_button.clicked.connect(lambda: self.resolve_selected_conflict(PREFER_REMOTE))
+        self.keep_all_merge_button.clicked.connect(lambda: self.resolve_all_conflicts(PREFER_LOCAL))
+        self.keep_all_device_button.clicked.connect(lambda: self.resolve_all_conflicts(PREFER_REMOTE))
 
     def is_offline_mode(self):
         checker = getattr(self.main_window, "is_offline_mode", None)
@@ -336,6 +426,42 @@ class SaveManagerTab(QWidget):
             return f"offline:{self.get_offline_sd_root()}"
         return f"online:{self.get_current_ip()}"
 
+    def current_sync_device_key(self):
+        if self.is_offline_mode():
+            root = self.get_offline_sd_root()
+            return get_sync_device_key(sd_root=root) if root else ""
+        return get_sync_device_key(self.get_current_profile_name(), self.get_current_ip())
+
+    def refresh_conflicts(self):
+        device_key = self.current_sync_device_key() if self.can_use_savemanager() else ""
+        conflicts = get_sync_conflicts(device_key) if device_key else []
+
+        self.conflict_list.clear()
+        for conflict in conflicts:
+            label = conflict["path"]
+            if conflict.get("prefer") == PREFER_LOCAL:
+                label += "  (will keep Merge folder version)"
+            elif conflict.get("prefer") == PREFER_REMOTE:
+                label += "  (will keep device version)"
+            item = QListWidgetItem(label)
+            item.setData(Qt.ItemDataRole.UserRole, conflict["path"])
+            self.conflict_list.addItem(item)
+
+        self.conflict_group.setVisible(bool(conflicts))
+
+    def resolve_selected_conflict(self, prefer):
+        item = self.conflict_list.currentItem()
+        if item is None:
+            QMessageBox.information(self, "Merge Conflicts", "Select a conflict first.")
+            return
+
+        resolve_sync_conflict(self.current_sync_device_key(), item.data(Qt.ItemDataRole.UserRole), prefer)
+        self.refresh_conflicts()
+
+    def resolve_all_conflicts(self, prefer):
+        resolve_all_sync_conflicts(self.current_sync_device_key(), prefer)
+        self.refresh_conflicts()
+
     def update_backup_count(self):
         count = get_backup_count(
             profile_name=self.get_current_profile_name(),
@@ -363,6 +489,7 @@ class SaveManagerTab(QWidget):
 
         self._set_controls_enabled(True)
         self.update_backup_count()
+        self.refresh_conflicts()
 
         if lightweight:
             return
@@ -417,6 +544,9 @@ class SaveManagerTab(QWidget):
         self.retention_spin.setValue(value)
         self.retention_spin.blockSignals(False)
 
+    def on_backup_format_changed(self, _index):
+        save_backup_format_setting(self.main_window.config_data, self.backup_format_combo.currentData())
+
     def show_log(self):
         if not self.log_group.isVisible():
             self.log_group.show()
@@ -459,6 +589,7 @@ class SaveManagerTab(QWidget):
         self.set_busy(False)
         self.worker = None
         self.update_backup_count()
+        self.refresh_conflicts()
 
         if not ok:
             self.log_message(f"Operation failed: {error_message}")
@@ -623,6 +754,8 @@ class SaveManagerTab(QWidget):
                     )
                 sync_saves(
                     self.connection,
+                    profile_name=profile_name,
+                    ip_address=ip_address,
                     log_callback=log,
                 )
 
@@ -1,5 +1,4 @@
 from pathlib import Path
-import json
 import shutil
 import xml.etree.ElementTree as ET
 
@@ -27,7 +26,10 @@ from PyQt6.QtWidgets import (
 from core.config import load_config, save_config
 from core.screenscraper_private import has_dev_credentials
 from core.zapscraper import (
+    clear_rom_hash_cache,
     load_scan_cache_systems,
+    load_zapscraper_cache,
+    load_scan_snapshots,
     plan_scrape_actions,
     run_scrape_actions,
     save_scan_cache,
@@ -36,6 +38,7 @@ from core.zapscraper import (
     scan_sd_card,
     test_screenscraper_login,
 )
+from core.zapscraper_hashing import DEFAULT_HASH_POLICY, get_hash_policy_id, get_hash_policy_names
 from core.zapscraper_systems import (
     OUTPUT_FORMAT_ZAPAROO_COMPANION,
     get_default_zaparoo_companion_media_names,
@@ -59,6 +62,7 @@ SOURCE_CUSTOM_GAMES_FOLDER = "Custom Games Folder"
 
 GAMELIST_FILENAME = "gamelist.xml"
 ZAPSCRAPER_CACHE_FILENAME = ".zapscraper_cache.json"
+ZAPSCRAPER_CACHE_JOURNAL_FILENAME = ".zapscraper_cache.jsonl"
 
 IMAGE_SIZE_HDTV = "HDTV Mode"
 IMAGE_SIZE_CRT = "CRT Mode"
@@ -98,12 +102,13 @@ def _read_gamelist_metadata_state(system):
     system_path = Path(system.get("path", ""))
     gamelist_path = system_path / GAMELIST_FILENAME
     cache_path = system_path / ZAPSCRAPER_CACHE_FILENAME
+    journal_path = system_path / ZAPSCRAPER_CACHE_JOURNAL_FILENAME
 
     state = {
         "system": system,
         "label": system.get("label") or system.get("folder") or system_path.name or "Unknown",
         "has_gamelist": gamelist_path.exists() and gamelist_path.is_file(),
-        "has_cache": cache_path.exists() and cache_path.is_file(),
+        "has_cache": cache_path.is_file() or journal_path.is_file(),
         "has_zaparoo_entries": False,
         "entry_count": 0,
         "type": "none",
@@ -171,18 +176,8 @@ def _metadata_conflict_count(conflicts):
 
 
 def _read_zapscraper_cache(system_path: str | Path) -> dict:
-    cache_path = Path(system_path) / ZAPSCRAPER_CACHE_FILENAME
-
-    if not cache_path.exists() or not cache_path.is_file():
-        return {}
-
-    try:
-        with cache_path.open("r", encoding="utf-8") as handle:
-            data = json.load(handle)
-    except Exception:
-        return {}
-
-    return data if isinstance(data, dict) else {}
+    # Goes through core so entries still in the append journal are included.
+    return load_zapscraper_cache(system_path)
 
 
 def _relative_media_exists(system_path: str | Path, relative_path: str) -> bool:
@@ -452,6 +447,7 @@ def _clear_system_rebuild_output(
 
     _remove_file_if_exists(system_path / GAMELIST_FILENAME)
     _remove_file_if_exists(system_path / ZAPSCRAPER_CACHE_FILENAME)
+    _remove_file_if_exists(system_path / ZAPSCRAPER_CACHE_JOURNAL_FILENAME)
 
     if get_output_format_id(output_format) == OUTPUT_FORMAT_ZAPAROO_COMPANION:
         folders = set()
@@ -473,13 +469,14 @@ def _clear_system_rebuild_output(
 
 class ZapScraperScanWorker(QThread):
     progress = pyqtSignal(str, int, int, int)
-    result = pyqtSignal(list)
+    result = pyqtSignal(list, dict)
     error = pyqtSignal(str)
 
-    def __init__(self, source_mode, source_path):
+    def __init__(self, source_mode, source_path, force_full_scan=False):
         super().__init__()
         self.source_mode = str(source_mode or SOURCE_SELECTED_SD)
         self.source_path = str(source_path or "").strip()
+        self.force_full_scan = bool(force_full_scan)
 
     def run(self):
         try:
@@ -497,23 +494,32 @@ class ZapScraperScanWorker(QThread):
             def stop_checker():
                 return self.isInterruptionRequested()
 
+            snapshots = {}
+            if not self.force_full_scan:
+                try:
+                    snapshots = load_scan_snapshots(self.source_mode, self.source_path)
+                except Exception:
+                    snapshots = {}
+
             if self.source_mode == SOURCE_CUSTOM_GAMES_FOLDER:
                 systems = scan_games_folder(
                     self.source_path,
                     progress_callback=progress_callback,
                     stop_checker=stop_checker,
+                    scan_snapshots=snapshots,
                 )
             else:
                 systems = scan_sd_card(
                     self.source_path,
                     progress_callback=progress_callback,
                     stop_checker=stop_checker,
+                    scan_snapshots=snapshots,
                 )
 
             if self.isInterruptionRequested():
                 return
 
-            self.result.emit(systems)
+            self.result.emit(systems, snapshots)
         except Exception as e:
             self.error.emit(str(e))
 
@@ -647,6 +653,8 @@ class ZapScraperScrapeWorker(QThread):
         skip_existing_metadata=True,
         zaparoo_media_source_names=None,
         crt_mode=False,
+        hash_policy=DEFAULT_HASH_POLICY,
+        max_threads=None,
     ):
         super().__init__()
         self.actions = actions or []
@@ -658,6 +666,8 @@ class ZapScraperScrapeWorker(QThread):
         self.skip_existing_metadata = bool(skip_existing_metadata)
         self.zaparoo_media_source_names = list(zaparoo_media_source_names or [])
         self.crt_mode = bool(crt_mode)
+        self.hash_policy = get_hash_policy_id(hash_policy)
+        self.max_threads = max_threads
         self.completed = 0
 
     def run(self):
@@ -695,6 +705,8 @@ class ZapScraperScrapeWorker(QThread):
                 quota_callback=quota_callback,
                 stop_checker=stop_checker,
                 crt_mode=self.crt_mode,
+                hash_policy=self.hash_policy,
+                max_threads=self.max_threads,
             )
 
             self.result.emit(int(self.completed), int(total))
@@ -960,6 +972,19 @@ class ZapScraperTab(QWidget):
         region_col.addWidget(self.region_combo)
         mode2_options_row.addLayout(region_col, 1)
 
+        hash_policy_col = QVBoxLayout()
+        hash_policy_col.setSpacing(3)
+        hash_policy_col.addWidget(QLabel("ROM Hashes"))
+        self.hash_policy_combo = QComboBox()
+        self.hash_policy_combo.addItems(get_hash_policy_names())
+        self.hash_policy_combo.setToolTip(
+            "Auto sends only the CRC for ROMs over 64 MB (read from the zip directory for zipped ROMs) "
+            "and retries with MD5/SHA1 when ScreenScraper finds no match."
+        )
+        self.hash_policy_combo.currentIndexChanged.connect(lambda *_: self.save_settings())
+        hash_policy_col.addWidget(self.hash_policy_combo)
+        mode2_options_row.addLayout(hash_policy_col, 1)
+
         mode2_layout.addLayout(mode2_options_row)
         options_layout.addWidget(self.mode2_options_widget)
 
@@ -1028,17 +1053,29 @@ class ZapScraperTab(QWidget):
         self.scrape_button = QPushButton("Scrape Selected")
         self.stop_button = QPushButton("Stop")
         self.stop_button.setEnabled(False)
+        self.clear_hash_cache_button = QPushButton("Clear Hash Cache")
+        self.clear_hash_cache_button.setToolTip(
+            "Forget stored ROM hashes for the selected systems (or all systems if none are selected), "
+            "so they are recalculated on the next scrape."
+        )
 
-        for button in (self.scan_button, self.scrape_button, self.stop_button):
+        for button in (self.scan_button, self.scrape_button, self.stop_button, self.clear_hash_cache_button):
             set_text_button_min_width(button, 120)
 
         self.scan_button.clicked.connect(self.scan_source)
         self.scrape_button.clicked.connect(self.prepare_scrape)
         self.stop_button.clicked.connect(self.stop_current_worker)
+        self.clear_hash_cache_button.clicked.connect(self.clear_hash_cache)
+        self.full_scan_checkbox = QCheckBox("Force full scan")
+        self.full_scan_checkbox.setToolTip(
+            "Re-scan every folder instead of reusing folders that are unchanged since the last scan."
+        )
 
         action_row.addWidget(self.scan_button)
         action_row.addWidget(self.scrape_button)
         action_row.addWidget(self.stop_button)
+        action_row.addWidget(self.clear_hash_cache_button)
+        action_row.addWidget(self.full_scan_checkbox)
         actions_layout.addLayout(action_row)
 
         self.current_task_label = QLabel("Ready")
@@ -1154,6 +1191,11 @@ class ZapScraperTab(QWidget):
             self.skip_metadata_incomplete_media_checkbox.setChecked(
                 bool(scraper_config.get("skip_games_with_metadata_ignore_incomplete_media", False))
             )
+            hash_policy = get_hash_policy_id(scraper_config.get("hash_policy", DEFAULT_HASH_POLICY))
+            for index, name in enumerate(get_hash_policy_names()):
+                if get_hash_policy_id(name) == hash_policy:
+                    self.hash_policy_combo.setCurrentIndex(index)
+                    break
         finally:
             self._loading_settings = False
 
@@ -1182,6 +1224,7 @@ class ZapScraperTab(QWidget):
             "image_size": self.image_size_combo.currentText(),
             "crt_mode": self._active_crt_mode(),
             "skip_games_with_metadata_ignore_incomplete_media": self.skip_metadata_incomplete_media_checkbox.isChecked(),
+            "hash_policy": get_hash_policy_id(self.hash_policy_combo.currentText()),
         }
         config["zapscraper"] = zapscraper_config
         save_config(config)
@@ -1689,7 +1732,11 @@ class ZapScraperTab(QWidget):
         self.append_output(f"Scanning {location} for supported systems...")
 
         self.last_scan_log_message = ""
-        self.scan_worker = ZapScraperScanWorker(self._active_source_mode(), source_path)
+        self.scan_worker = ZapScraperScanWorker(
+            self._active_source_mode(),
+            source_path,
+            force_full_scan=self.full_scan_checkbox.isChecked(),
+        )
         self.scan_worker.progress.connect(self.on_scan_progress)
         self.scan_worker.result.connect(self.on_scan_finished)
         self.scan_worker.error.connect(self.on_scan_error)
@@ -1720,7 +1767,7 @@ class ZapScraperTab(QWidget):
             self.last_scan_log_message = message
             self.append_output(f"{message} {games_found} games found.")
 
-    def on_scan_finished(self, systems):
+    def on_scan_finished(self, systems, snapshots=None):
         self.systems = systems or []
 
         if self._active_source_path():
@@ -1729,6 +1776,7 @@ class ZapScraperTab(QWidget):
                     self._active_source_mode(),
                     self._active_source_path(),
                     self.systems,
+                    snapshots=snapshots,
                 )
             except Exception as e:
                 self.append_output(f"Scan cache could not be saved: {e}")
@@ -2004,6 +2052,8 @@ class ZapScraperTab(QWidget):
             skip_existing_metadata=self.skip_metadata_checkbox.isChecked(),
             zaparoo_media_source_names=zaparoo_media_sources,
             crt_mode=crt_mode,
+            hash_policy=get_hash_policy_id(self.hash_policy_combo.currentText()),
+            max_threads=(self.quota_info or {}).get("threads"),
         )
         self.scrape_worker.progress.connect(self.on_scrape_progress)
         self.scrape_worker.log.connect(self.append_output)
@@ -2177,6 +2227,25 @@ class ZapScraperTab(QWidget):
 
         self.update_connection_state(lightweight=True)
 
+    def clear_hash_cache(self):
+        if self._is_busy():
+            return
+
+        selected = [system for system in self.selected_systems() if isinstance(system, dict)]
+
+        try:
+            if selected:
+                removed = clear_rom_hash_cache([system.get("path", "") for system in selected])
+                scope = f"{len(selected)} selected system(s)"
+            else:
+                removed = clear_rom_hash_cache()
+                scope = "all systems"
+        except Exception as e:
+            self.append_output(f"Could not clear ROM hash cache: {e}")
+            return
+
+        self.append_output(f"Cleared ROM hash cache for {scope} ({removed} cache file(s) removed).")
+
     def append_output(self, message):
         self.output.append(str(message))
 
@@ -2194,6 +2263,8 @@ class ZapScraperTab(QWidget):
 
         self.scan_button.setEnabled(enabled)
         self.scrape_button.setEnabled(enabled)
+        self.clear_hash_cache_button.setEnabled(not busy)
+        self.full_scan_checkbox.setEnabled(enabled)
         self.select_all_button.setEnabled(enabled)
         self.clear_selection_button.setEnabled(enabled)
         self.review_gamelist_button.setEnabled(
@@ -2208,6 +2279,7 @@ class ZapScraperTab(QWidget):
         self.output_format_combo.setEnabled(enabled)
         self.image_source_combo.setEnabled(enabled and not self._is_zaparoo_companion_mode())
         self.region_combo.setEnabled(enabled and not self._is_zaparoo_companion_mode())
+        self.hash_policy_combo.setEnabled(enabled and not self._is_zaparoo_companion_mode())
         self.region_priority_combo.setEnabled(enabled and self._is_zaparoo_companion_mode())
 
         for checkbox in self.zaparoo_media_checkboxes.values():
@@ -2247,6 +2319,8 @@ class ZapScraperTab(QWidget):
 
         self.scan_button.setEnabled(enabled)
         self.scrape_button.setEnabled(enabled)
+        self.clear_hash_cache_button.setEnabled(not busy)
+        self.full_scan_checkbox.setEnabled(enabled)
         self.select_all_button.setEnabled(enabled)
         self.clear_selection_button.setEnabled(enabled)
         self.review_gamelist_button.setEnabled(
@@ -2261,6 +2335,7 @@ class ZapScraperTab(QWidget):
         self.output_format_combo.setEnabled(enabled)
         self.image_source_combo.setEnabled(enabled and not self._is_zaparoo_companion_mode())
         self.region_combo.setEnabled(enabled and not self._is_zaparoo_companion_mode())
+        self.hash_policy_combo.setEnabled(enabled and not self._is_zaparoo_companion_mode())
         self.region_priority_combo.setEnabled(enabled and self._is_zaparoo_companion_mode())
 
         for checkbox in self.zaparoo_media_checkboxes.values():